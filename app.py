@@ -3,41 +3,80 @@
 # Security: Rate limiting, input sanitization,
 #           security headers, integrity check
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, Response, render_template, request, jsonify
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
+import json
 import re
-import hashlib
-import os
 import threading
-import urllib.request
-
-from engine.intent_detector import detect_intent
-from engine.response_generator import generate_response
-from engine.log_manager import save_log
-from engine.md_retriever import get_law_context, get_complaint_channels
+from collections import namedtuple
+from time import perf_counter
+
+from config import (
+    INTEGRITY_CHECK_INTERVAL,
+    INTEGRITY_FULL_RECHECK_INTERVAL,
+    RATE_LIMIT_ENABLED,
+    DEFAULT_RATE_LIMITS,
+    CHAT_RATE_LIMIT,
+    RATE_LIMIT_STORAGE_URI,
+    RATE_LIMIT_STRATEGY,
+    BATCH_MAX_SIZE,
+    BATCH_RATE_LIMIT,
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL
+)
+from engine.intent_detector import (
+    detect_intent_traced,
+    detect_intents_traced
+)
+from engine.integrity_monitor import IntegrityMonitor
+from engine.registry import get_registry, peek_registry
+from engine.response_generator import build_skeleton
+from engine.log_manager import save_log, start_writers
+from engine.result_cache import ResultCache
+from engine.metrics import stage, observe_request, render_prometheus
+from engine.event_log import get_logger
+from engine.rate_limit_store import usable_storage_uri  # + sqlite://
+from engine.md_retriever import (
+    get_law_index,
+    get_law_context,
+    get_complaint_channels
+)
+from utils.text_cleaner import normalize_for_matching
 from engine.language_detector import (
-    detect_language,
+    scan_text,
+    get_text_matcher,
     translate_tanglish,
     get_tamil_response,
-    is_offensive,
-    is_irrelevant,
-    is_general_conversation,
     get_general_response,
     get_offensive_response,
-    get_irrelevant_response,
-    detect_tamil_intent
+    get_irrelevant_response
 )
 
+log = get_logger("app")
+
 app = Flask(__name__)
 
 # ── Rate Limiter ──────────────────────────────────────
+# Counters live in shared storage (SQLite / Redis), so a
+# limit holds across all gunicorn workers; if the store
+# fails, each worker falls back to its own memory
 limiter = Limiter(
     app=app,
     key_func=get_remote_address,
-    default_limits=["200 per day", "50 per hour"]
+    default_limits=DEFAULT_RATE_LIMITS,
+    storage_uri=usable_storage_uri(RATE_LIMIT_STORAGE_URI),
+    strategy=RATE_LIMIT_STRATEGY,
+    in_memory_fallback_enabled=True,
+    enabled=RATE_LIMIT_ENABLED
 )
 
+# /chat and /chat/stream give the same answers, so they
+# draw from ONE per-client budget (asgi.py counts its
+# /chat in the same bucket)
+CHAT_LIMIT_SCOPE = "chat"
+chat_limit = limiter.shared_limit(CHAT_RATE_LIMIT, scope=CHAT_LIMIT_SCOPE)
+
 # ── File Integrity Check ──────────────────────────────
 LAW_FILES = [
     "laws/consumer_protection.md",
@@ -45,43 +84,31 @@ LAW_FILES = [
     "laws/bns.md"
 ]
 
-def calculate_hash(filepath: str) -> str:
-    """Calculate SHA256 hash of a file."""
-    try:
-        with open(filepath, "rb") as f:
-            return hashlib.sha256(f.read()).hexdigest()
-    except Exception:
-        return ""
-
-def build_integrity_map() -> dict:
-    """Build hash map of all law files at startup."""
-    return {
-        filepath: calculate_hash(filepath)
-        for filepath in LAW_FILES
-    }
+def _alert_tampered(filepath: str):
+    """Logged once per tampering, not per request."""
+    save_log(
+        "INTEGRITY_CHECK",
+        "SECURITY_ALERT",
+        f"File tampered: {filepath}"
+    )
 
-# Calculate hashes when app starts
-INTEGRITY_MAP = build_integrity_map()
-print("✅ File integrity map built:")
-for filepath, hash_val in INTEGRITY_MAP.items():
-    print(f"   {filepath}: {hash_val[:16]}...")
+# Hashes once at startup; a background thread re-hashes
+# only when file metadata changes (started per process
+# by start_worker_services)
+integrity_monitor = IntegrityMonitor(
+    LAW_FILES,
+    check_interval=INTEGRITY_CHECK_INTERVAL,
+    full_recheck_interval=INTEGRITY_FULL_RECHECK_INTERVAL,
+    on_tamper=_alert_tampered
+)
 
 def verify_integrity() -> bool:
     """
     Check if law files have been tampered.
     Returns True if all files are intact.
+    Reads the monitor's in-memory flag — no disk access.
     """
-    for filepath, original_hash in INTEGRITY_MAP.items():
-        current_hash = calculate_hash(filepath)
-        if current_hash != original_hash:
-            print(f"⚠️  INTEGRITY WARNING: {filepath} has been modified!")
-            save_log(
-                f"INTEGRITY_CHECK",
-                "SECURITY_ALERT",
-                f"File tampered: {filepath}"
-            )
-            return False
-    return True
+    return integrity_monitor.is_intact()
 
 # ── Input Sanitization ────────────────────────────────
 def sanitize_input(text: str) -> str:
@@ -119,6 +146,10 @@ def validate_response(response: str) -> str:
     Validate response contains required disclaimer.
     If missing, append it automatically.
     """
+    # Pre-rendered legal responses always end with it
+    if getattr(response, "has_disclaimer", False):
+        return response
+
     disclaimer = "⚖️  Disclaimer: This is legal awareness guidance only"
 
     # Only check legal responses — not general chat
@@ -140,33 +171,34 @@ def validate_response(response: str) -> str:
     return response
 
 # ── Security Headers ──────────────────────────────────
-@app.after_request
-def add_security_headers(response):
-    """Add security headers to every response."""
-
+SECURITY_HEADERS = {
     # Prevent clickjacking — no iframes allowed
-    response.headers['X-Frame-Options'] = 'DENY'
+    "X-Frame-Options": "DENY",
 
     # Prevent MIME sniffing
-    response.headers['X-Content-Type-Options'] = 'nosniff'
+    "X-Content-Type-Options": "nosniff",
 
     # Force HTTPS
-    response.headers['Strict-Transport-Security'] = (
-        'max-age=31536000; includeSubDomains'
-    )
+    "Strict-Transport-Security": "max-age=31536000; includeSubDomains",
 
     # Content Security Policy
-    response.headers['Content-Security-Policy'] = (
+    "Content-Security-Policy": (
         "default-src 'self'; "
         "script-src 'self' 'unsafe-inline'; "
         "style-src 'self' 'unsafe-inline' https://fonts.googleapis.com; "
         "font-src 'self' https://fonts.gstatic.com; "
         "img-src 'self' data:;"
-    )
+    ),
 
     # Prevent XSS in older browsers
-    response.headers['X-XSS-Protection'] = '1; mode=block'
+    "X-XSS-Protection": "1; mode=block"
+}
+
 
+@app.after_request
+def add_security_headers(response):
+    """Add security headers to every response."""
+    response.headers.update(SECURITY_HEADERS)
     return response
 
 
@@ -176,103 +208,467 @@ def home():
     return render_template("index.html")
 
 
-@limiter.limit("15 per minute")
-@app.route("/chat", methods=["POST"])
-def chat():
+# ── Chat pipeline (shared by /chat and /chat/batch) ───
+EMPTY_MESSAGE_RESPONSE = "Please type something so I can help you."
+INTEGRITY_FAILED_RESPONSE = (
+    "⚠️ System integrity check failed. "
+    "Please try again later or contact support."
+)
+IN_TAMIL_RESPONSE = "நான் தமிழிலும் பேசுவேன்! உங்கள் கேள்வியை தமிழில் கேளுங்கள். 😊"
+
+# Outcome of the pipeline for one message, WITHOUT the
+# randomly picked wording — render_route() picks that per
+# request, so a cached route still varies its replies.
+#   log_intent — intent id written to the conversation log
+#   language   — english / tamil / tanglish
+#   kind       — offensive / general / irrelevant / fixed / intent
+#   payload    — conv type, fixed text or a ResponseSkeleton
+#   path       — decision path, labels /metrics latencies
+ChatRoute = namedtuple(
+    "ChatRoute", ["log_intent", "language", "kind", "payload", "path"]
+)
 
-    # ── Get and sanitize input ────────────────────────
-    raw_message = request.json.get("message", "")
-    user_message = sanitize_input(raw_message)
+class DataSnapshot(
+    namedtuple("DataSnapshot", ["registry", "law_index"])
+):
+    """The read-only engine data one request works from."""
+    __slots__ = ()
 
-    if not user_message:
-        return jsonify({
-            "response": "Please type something so I can help you."
-        })
+    @property
+    def version(self) -> tuple:
+        """Intents / model / law files version — keys the cache."""
+        return self.registry.version, self.law_index.version
 
-    # ── Integrity check ───────────────────────────────
-    if not verify_integrity():
-        return jsonify({
-            "response": (
-                "⚠️ System integrity check failed. "
-                "Please try again later or contact support."
-            )
-        })
+
+# Repeated messages skip detection + law retrieval
+chat_cache = ResultCache(CACHE_MAX_ENTRIES, CACHE_TTL)
+
+
+def screen_message(user_message: str, registry=None) -> tuple:
+    """
+    Steps 1-7 for one sanitized message, scanned with the
+    request's registry.
+    Returns (language, route, detect_args):
+      route       — ChatRoute if already decided
+      detect_args — (text, scan) for detect_intent otherwise
+    """
+    with stage("scan"):
+        scan = scan_text(user_message, registry)
+    language = scan.language
 
     # ── Step 1: Offensive filter ──────────────────────
-    if is_offensive(user_message):
-        response = get_offensive_response()
-        save_log(user_message, "OFFENSIVE", response)
-        return jsonify({"response": response})
+    if scan.offensive:
+        route = ChatRoute(
+            "OFFENSIVE", language, "offensive", None, "offensive"
+        )
+        return language, route, None
 
     # ── Step 2: General conversation ──────────────────
-    conv_type = is_general_conversation(user_message)
+    conv_type = scan.general
     if conv_type:
-        response = get_general_response(conv_type)
-        save_log(user_message, "GENERAL", response)
-        return jsonify({"response": response})
+        route = ChatRoute(
+            "GENERAL", language, "general", conv_type, "general"
+        )
+        return language, route, None
 
     # ── Step 2b: "in tamil" request ───────────────────
     if user_message.lower().strip() in [
         "in tamil", "tamil la",
         "tamil la sollu", "tamil la solu"
     ]:
-        response = "நான் தமிழிலும் பேசுவேன்! உங்கள் கேள்வியை தமிழில் கேளுங்கள். 😊"
-        save_log(user_message, "GENERAL", response)
-        return jsonify({"response": response})
+        route = ChatRoute(
+            "GENERAL", language, "fixed", IN_TAMIL_RESPONSE, "general"
+        )
+        return language, route, None
 
     # ── Step 3: Irrelevant topics ─────────────────────
-    if is_irrelevant(user_message):
-        response = get_irrelevant_response()
-        save_log(user_message, "IRRELEVANT", response)
-        return jsonify({"response": response})
-
-    # ── Step 4: Detect language ───────────────────────
-    language = detect_language(user_message)
+    if scan.irrelevant:
+        route = ChatRoute(
+            "IRRELEVANT", language, "irrelevant", None, "irrelevant"
+        )
+        return language, route, None
 
-    # ── Step 5: Tamil script ──────────────────────────
+    # ── Step 4-5: Tamil script ────────────────────────
     if language == "tamil":
-        tamil_intent_id = detect_tamil_intent(user_message)
+        tamil_intent_id = scan.tamil_intent_id
         if tamil_intent_id:
-            response = get_tamil_response(tamil_intent_id)
-        else:
-            intent = detect_intent(user_message)
-            intent_id = intent.get("intent_id", "UNKNOWN001")
-            response = get_tamil_response(intent_id)
-        response = validate_response(response)
-        save_log(user_message, tamil_intent_id or "UNKNOWN001", response)
-        return jsonify({"response": response})
+            response = validate_response(
+                get_tamil_response(tamil_intent_id)
+            )
+            route = ChatRoute(
+                tamil_intent_id, language, "fixed", response, "tamil_keyword"
+            )
+            return language, route, None
+        return language, None, (user_message, scan)
 
     # ── Step 6: Tanglish ──────────────────────────────
     if language == "tanglish":
-        converted = translate_tanglish(user_message)
-        intent = detect_intent(converted)
-    else:
-        # ── Step 7: English ───────────────────────────
-        intent = detect_intent(user_message)
+        return language, None, (translate_tanglish(user_message), None)
+
+    # ── Step 7: English ───────────────────────────────
+    return language, None, (user_message, scan)
+
 
+def enrich_intent(intent: dict, law_index=None) -> dict:
+    """Step 8: a copy of the intent with law context + channels."""
     intent_id = intent.get("intent_id", "UNKNOWN001")
 
+    # Shared registry intents are read-only — enrich a copy
+    intent = dict(intent)
+
     # ── Step 8: Enrich with MD content ───────────────
     if intent_id not in ["GREET001", "UNKNOWN001"]:
-        law_context = get_law_context(intent_id)
-        complaint_channels = get_complaint_channels(intent_id)
+        law_context = get_law_context(intent_id, law_index)
+        complaint_channels = get_complaint_channels(intent_id, law_index)
         if law_context:
             intent["md_context"] = law_context
         if complaint_channels:
             intent["complaint_channels"] = complaint_channels
+    return intent
+
+
+# Every intent's response pre-rendered for the current
+# data version — (version, {intent_id: ResponseSkeleton})
+_skeletons = (None, {})
+
+
+def intent_skeletons(snapshot: DataSnapshot) -> dict:
+    """
+    Pre-renders all intents once per data version, so a
+    request only fills in the template line. Built from
+    the request's snapshot — never from a newer version.
+    """
+    global _skeletons
+    version = snapshot.version
+    built_for, skeletons = _skeletons
+    if built_for != version:
+        skeletons = {
+            intent["intent_id"]: build_skeleton(
+                enrich_intent(intent, snapshot.law_index)
+            )
+            for intent in snapshot.registry.intents_list
+        }
+        _skeletons = (version, skeletons)
+    return skeletons
+
+
+def route_intent(
+    language: str,
+    intent: dict,
+    path: str,
+    snapshot: DataSnapshot
+) -> ChatRoute:
+    """
+    Step 8 once the intent is known: Tamil reply, or the
+    pre-rendered response of the enriched intent.
+    path is the detector's decision path.
+    """
+    intent_id = intent.get("intent_id", "UNKNOWN001")
+
+    if language == "tamil":
+        response = validate_response(get_tamil_response(intent_id))
+        return ChatRoute("UNKNOWN001", language, "fixed", response, path)
+
+    skeleton = intent_skeletons(snapshot).get(intent_id)
+    if skeleton is None:
+        skeleton = build_skeleton(enrich_intent(intent, snapshot.law_index))
+    return ChatRoute(intent_id, language, "intent", skeleton, path)
+
+
+def render_route(route: ChatRoute) -> str:
+    """Steps 9-10: the reply text for a route."""
+    if route.kind == "offensive":
+        return get_offensive_response()
+    if route.kind == "general":
+        return get_general_response(route.payload)
+    if route.kind == "irrelevant":
+        return get_irrelevant_response()
+    if route.kind == "fixed":
+        return route.payload
 
     # ── Step 9: Generate response ─────────────────────
-    response = generate_response(intent)
+    response = route.payload.render()
 
     # ── Step 10: Validate response ────────────────────
-    response = validate_response(response)
+    return validate_response(response)
+
+
+def render_route_sections(route: ChatRoute) -> list:
+    """
+    render_route() as [(section name, text), ...] —
+    joined, the texts are the same reply. Only legal
+    responses have several sections.
+    """
+    if route.kind != "intent":
+        return [("response", render_route(route))]
+
+    skeleton = route.payload
+    sections = skeleton.render_sections()
+    response = skeleton.response_type("".join(text for _, text in sections))
+    validated = validate_response(response)
+    if len(validated) > len(response):
+        sections.append(("disclaimer", validated[len(response):]))
+    return sections
+
+
+def data_snapshot() -> DataSnapshot:
+    """
+    Registry + law index for one request, fetched ONCE at
+    its start and passed to every step — a hot reload
+    mid-request never mixes two versions, and the cache
+    key is the version the route was built from.
+    """
+    return DataSnapshot(get_registry(), get_law_index())
+
+
+def cached_route(user_message: str, version: tuple):
+    """
+    (cache key, cached ChatRoute or None) for a message.
+
+    The key is exactly the text the gates match against
+    (sanitized, lowercased, NFC) — punctuation decides
+    the offensive / general / irrelevant gates, so two
+    messages that differ only in punctuation never share
+    a route.
+    """
+    key = normalize_for_matching(user_message)
+    if not key:
+        return None, None
+    return key, chat_cache.get(key, version)
+
+
+def resolve_message(raw_message: str) -> tuple:
+    """
+    Sanitize, gates, cache and detection for one raw
+    message — everything before rendering.
+
+    Returns (user_message, route, path):
+      user_message — "" for an empty message or a failed
+                     integrity check; route is then the
+                     fixed reply and path is None
+      path         — decision path for /metrics
+    """
+    # ── Get and sanitize input ────────────────────────
+    with stage("sanitize"):
+        user_message = sanitize_input(raw_message)
+
+    if not user_message:
+        return "", ChatRoute(
+            None, None, "fixed", EMPTY_MESSAGE_RESPONSE, None
+        ), None
+
+    # ── Integrity check ───────────────────────────────
+    with stage("integrity"):
+        intact = verify_integrity()
+    if not intact:
+        return "", ChatRoute(
+            None, None, "fixed", INTEGRITY_FAILED_RESPONSE, None
+        ), None
+
+    with stage("cache"):
+        snapshot = data_snapshot()
+        key, route = cached_route(user_message, snapshot.version)
+    path = "cache_hit"
+    if route is None:
+        language, route, detect_args = screen_message(
+            user_message, snapshot.registry
+        )
+        if route is None:
+            with stage("detect"):
+                intent, detect_path = detect_intent_traced(
+                    *detect_args, registry=snapshot.registry
+                )
+            with stage("retrieve"):
+                route = route_intent(language, intent, detect_path, snapshot)
+        if key:
+            chat_cache.put(key, route, snapshot.version)
+        path = route.path
+    return user_message, route, path
+
+
+def answer_message(raw_message: str) -> tuple:
+    """
+    The whole /chat pipeline for one raw message, up to
+    (not including) logging — shared by the Flask view and
+    the async entry point (asgi.py).
+
+    Returns (response, log_entry, path):
+      log_entry — save_log() arguments, None if not logged
+      path      — decision path for /metrics, None if the
+                  message never reached the pipeline
+    """
+    user_message, route, path = resolve_message(raw_message)
+    if not user_message:
+        return route.payload, None, None
+
+    with stage("render"):
+        response = render_route(route)
+
+    log_entry = (user_message, route.log_intent, response, route.language)
+    return response, log_entry, path
+
+
+@app.route("/chat", methods=["POST"])
+@chat_limit
+def chat():
+    request_start = perf_counter()
+    response, log_entry, path = answer_message(
+        request.json.get("message", "")
+    )
 
     # ── Step 11: Log conversation ─────────────────────
-    save_log(user_message, intent_id, response)
+    if log_entry:
+        with stage("log"):
+            save_log(*log_entry)
 
+    if path:
+        observe_request(path, perf_counter() - request_start)
     return jsonify({"response": response})
 
 
+def _sse(event: str, data: dict) -> str:
+    """One Server-Sent Event."""
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@app.route("/chat/stream", methods=["POST"])
+@chat_limit
+def chat_stream():
+    """
+    /chat as Server-Sent Events, section by section:
+      meta    {"intent", "language"} — once the route is known
+      section {"name", "text"}       — SITUATION UNDERSTOOD,
+                                       APPLICABLE LAW, ...
+      done    {}
+    The section texts joined are the /chat response.
+    """
+    request_start = perf_counter()
+    user_message, route, path = resolve_message(
+        (request.get_json(silent=True) or {}).get("message", "")
+    )
+
+    def events():
+        yield _sse("meta", {
+            "intent": route.log_intent,
+            "language": route.language
+        })
+        sections = []
+        try:
+            with stage("render"):
+                sections = render_route_sections(route)
+            for name, text in sections:
+                yield _sse("section", {"name": name, "text": text})
+            yield _sse("done", {})
+        finally:
+            # Logged even if the client went away mid-stream
+            if user_message and sections:
+                response = "".join(text for _, text in sections)
+                with stage("log"):
+                    save_log(
+                        user_message, route.log_intent,
+                        response, route.language
+                    )
+            if path:
+                observe_request(path, perf_counter() - request_start)
+
+    return Response(
+        events(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.route("/chat/batch", methods=["POST"])
+@limiter.limit(BATCH_RATE_LIMIT)
+def chat_batch():
+    """
+    Classifies many messages in one request:
+    {"messages": ["...", ...]} →
+    {"results": [{"intent", "language", "response"}, ...]}
+
+    Same answers as /chat per message; messages that need
+    the ML model are scored together in one call.
+    """
+    messages = (request.get_json(silent=True) or {}).get("messages")
+    if not isinstance(messages, list) or not messages:
+        return jsonify({
+            "error": "Send a non-empty list as \"messages\"."
+        }), 400
+    if len(messages) > BATCH_MAX_SIZE:
+        return jsonify({
+            "error": f"At most {BATCH_MAX_SIZE} messages per batch."
+        }), 413
+
+    if not verify_integrity():
+        return jsonify({"error": INTEGRITY_FAILED_RESPONSE}), 503
+
+    snapshot = data_snapshot()
+    version = snapshot.version
+    routes = [None] * len(messages)
+    user_messages = [
+        sanitize_input(raw if isinstance(raw, str) else "")
+        for raw in messages
+    ]
+    pending = []
+    for position, user_message in enumerate(user_messages):
+        if not user_message:
+            continue
+        key, route = cached_route(user_message, version)
+        if route is None:
+            language, route, detect_args = screen_message(
+                user_message, snapshot.registry
+            )
+            if route is None:
+                pending.append((position, key, language, detect_args))
+                continue
+            if key:
+                chat_cache.put(key, route, version)
+        routes[position] = route
+
+    detected = detect_intents_traced(
+        [detect_args[0] for *_, detect_args in pending],
+        [detect_args[1] for *_, detect_args in pending],
+        snapshot.registry
+    )
+    for (position, key, language, _), (intent, path) in zip(
+        pending, detected
+    ):
+        route = route_intent(language, intent, path, snapshot)
+        if key:
+            chat_cache.put(key, route, version)
+        routes[position] = route
+
+    results = []
+    for user_message, route in zip(user_messages, routes):
+        if route is None:
+            results.append({
+                "intent": None,
+                "language": None,
+                "response": EMPTY_MESSAGE_RESPONSE
+            })
+            continue
+        response = render_route(route)
+        save_log(user_message, route.log_intent, response, route.language)
+        results.append({
+            "intent": route.log_intent,
+            "language": route.language,
+            "response": response
+        })
+
+    return jsonify({"results": results})
+
+
+@app.route("/metrics")
+@limiter.exempt
+def metrics():
+    """Stage + decision-path latency histograms (Prometheus)."""
+    return Response(
+        render_prometheus(),
+        mimetype="text/plain; version=0.0.4"
+    )
+
+
 @app.route("/logs/summary")
 def log_summary():
     from engine.log_manager import get_log_summary
@@ -281,20 +677,30 @@ def log_summary():
 
 @app.route("/health")
 def health():
+    """
+    Answers while the engine is still warming up — it
+    reports the registry only once loaded, never loads it.
+    """
     integrity_ok = verify_integrity()
+    registry = peek_registry()
     return jsonify({
         "status": "running",
         "app": "ARAM Legal Awareness Assistant",
         "version": "3.0",
         "ml_accuracy": "78%",
         "languages": ["English", "Tamil", "Tanglish"],
-        "integrity": "✅ OK" if integrity_ok else "⚠️ WARNING"
+        "integrity": "✅ OK" if integrity_ok else "⚠️ WARNING",
+        "ready": engine_ready.is_set(),
+        "model_version": registry.version if registry else None,
+        "registry": registry.stats() if registry else None,
+        "cache": chat_cache.stats()
     })
-# Keep Render awake
 
 
+# ── Keep Render awake ─────────────────────────────────
 def ping_self():
     import time
+    import urllib.request
     while True:
         time.sleep(840)
         try:
@@ -304,7 +710,96 @@ def ping_self():
         except:
             pass
 
-threading.Thread(target=ping_self, daemon=True).start()
+
+_keepalive_started = False
+
+
+def start_keepalive() -> None:
+    """
+    Starts ping_self once per process. Under gunicorn it
+    runs in one worker only — one ping for all workers.
+    """
+    global _keepalive_started
+    if not _keepalive_started:
+        _keepalive_started = True
+        threading.Thread(
+            target=ping_self, name="keepalive", daemon=True
+        ).start()
+
+
+# ── App factory ───────────────────────────────────────
+engine_ready = threading.Event()
+
+
+def preload_engine() -> None:
+    """
+    Builds all read-only engine state: intent registry +
+    ML model, law index, text matcher and every intent's
+    pre-rendered response.
+
+    With gunicorn preload_app this runs once in the master
+    and the workers share the pages copy-on-write.
+    Starts no threads — threads do not survive fork().
+    """
+    snapshot = data_snapshot()
+    get_text_matcher(snapshot.registry)
+    intent_skeletons(snapshot)
+    engine_ready.set()
+
+
+def warm_up_engine() -> None:
+    """
+    preload_engine() on a background thread, so the app
+    serves /health right away. A request that needs the
+    engine earlier waits on the same registry lock.
+    Never use before fork() — see gunicorn.conf.py.
+    """
+    def warm_up():
+        try:
+            preload_engine()
+        except Exception as e:
+            log.error(
+                "engine.warm_up_failed",
+                fallback="load on first use", error=str(e)
+            )
+
+    threading.Thread(
+        target=warm_up, name="engine-warm-up", daemon=True
+    ).start()
+
+
+def start_worker_services() -> None:
+    """
+    Background threads of one serving process: integrity
+    monitor, log writers, MongoDB connect. Each is started
+    at most once per process (gunicorn: in post_fork).
+    """
+    integrity_monitor.ensure_running()
+    start_writers()
+
+
+def create_app(
+    start_services: bool = True,
+    background_warm_up: bool = False
+) -> Flask:
+    """
+    Loads the engine and returns the Flask app.
+
+    gunicorn.conf.py calls create_app(start_services=False)
+    in the master and starts the services in each worker;
+    `python app.py` starts everything in-process.
+    With background_warm_up the engine loads on a thread
+    and the app is returned at once.
+    """
+    if background_warm_up:
+        warm_up_engine()
+    else:
+        preload_engine()
+    if start_services:
+        start_worker_services()
+        start_keepalive()
+    return app
+
 
 if __name__ == "__main__":
-    app.run(debug=True)
\ No newline at end of file
+    create_app(background_warm_up=True).run(debug=True)
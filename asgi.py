@@ -0,0 +1,120 @@
+# asgi.py
+# ARAM — async serving mode (Starlette)
+# Run: uvicorn asgi:app --workers 2
+#
+# POST /chat is served natively: the event loop only
+# parses and answers, the CPU-bound pipeline runs in a
+# thread pool and the conversation log is written after
+# the response is sent. Every other route is the Flask
+# app from app.py, mounted as WSGI — same pipeline,
+# gates, security headers and rate limits.
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from time import perf_counter
+
+from a2wsgi import WSGIMiddleware
+from limits import parse
+from starlette.applications import Starlette
+from starlette.background import BackgroundTask
+from starlette.responses import JSONResponse
+from starlette.routing import Mount, Route
+
+from config import (
+    ASYNC_EXECUTOR_WORKERS,
+    CHAT_RATE_LIMIT,
+    RATE_LIMIT_ENABLED
+)
+from app import (
+    CHAT_LIMIT_SCOPE,
+    SECURITY_HEADERS,
+    answer_message,
+    create_app,
+    limiter,
+    save_log,
+    start_keepalive,
+    start_worker_services
+)
+from engine.metrics import observe_request
+
+flask_app = create_app(start_services=False)
+
+executor = ThreadPoolExecutor(
+    max_workers=ASYNC_EXECUTOR_WORKERS,
+    thread_name_prefix="chat-pipeline"
+)
+
+# The Flask /chat + /chat/stream limit — same storage,
+# strategy and bucket (client, CHAT_LIMIT_SCOPE), so all
+# three routes share one budget
+CHAT_LIMITS = [parse(CHAT_RATE_LIMIT)]
+
+
+def _json(payload: dict, status_code: int = 200, background=None):
+    return JSONResponse(
+        payload,
+        status_code=status_code,
+        headers=SECURITY_HEADERS,
+        background=background
+    )
+
+
+def _rate_limited(client: str) -> bool:
+    """
+    True when this client is over the /chat limit.
+    Blocking (a SQLite transaction or a Redis round trip)
+    — runs on the executor, never on the event loop.
+    """
+    strategy = limiter.limiter
+    return not all(
+        strategy.hit(item, client, CHAT_LIMIT_SCOPE) for item in CHAT_LIMITS
+    )
+
+
+async def chat(request):
+    request_start = perf_counter()
+    client = request.client.host if request.client else "127.0.0.1"
+    loop = asyncio.get_running_loop()
+    if RATE_LIMIT_ENABLED and await loop.run_in_executor(
+        executor, _rate_limited, client
+    ):
+        return _json(
+            {"error": f"Rate limit exceeded: {CHAT_RATE_LIMIT}"}, 429
+        )
+
+    try:
+        payload = await request.json()
+    except ValueError:
+        payload = None
+    if not isinstance(payload, dict):
+        return _json({"error": "Send JSON with a \"message\"."}, 400)
+    raw_message = payload.get("message", "")
+
+    response, log_entry, path = await loop.run_in_executor(
+        executor, answer_message, raw_message
+    )
+    if path:
+        observe_request(path, perf_counter() - request_start)
+
+    # ── Step 11: Log after the response is sent ───────
+    background = BackgroundTask(save_log, *log_entry) if log_entry else None
+    return _json({"response": response}, background=background)
+
+
+@asynccontextmanager
+async def lifespan(_app):
+    # Per process — uvicorn workers are separate processes
+    start_worker_services()
+    start_keepalive()
+    yield
+    executor.shutdown(wait=False)
+
+
+app = Starlette(
+    routes=[
+        Route("/chat", chat, methods=["POST"]),
+        Mount("/", app=WSGIMiddleware(flask_app))
+    ],
+    lifespan=lifespan
+)
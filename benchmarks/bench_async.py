@@ -0,0 +1,171 @@
+# benchmarks/bench_async.py
+# Purpose: /chat under concurrent load — sync gunicorn
+#          (gunicorn.conf.py) vs async uvicorn (asgi.py)
+# Same worker count for both; rate limits off, logs go to
+# a temp directory, MongoDB disabled
+# Run: python -m benchmarks.bench_async [--workers 2]
+#          [--concurrency 1 8 32] [--duration 5]
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from benchmarks.bench_workers import free_port
+from benchmarks.corpus import build_corpus
+from config import BASE_DIR
+
+
+def _server_command(mode: str, workers: int, port: int) -> list:
+    if mode == "sync":
+        return [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+                "--bind", f"127.0.0.1:{port}", "--workers", str(workers)]
+    return [sys.executable, "-m", "uvicorn", "asgi:app",
+            "--port", str(port), "--workers", str(workers),
+            "--log-level", "warning"]
+
+
+def _wait_ready(url: str, timeout: float = 60) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(url, timeout=1):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"server not ready: {url}")
+
+
+def _post(url: str, message: str) -> bool:
+    data = json.dumps({"message": message}).encode("utf-8")
+    request = urllib.request.Request(
+        url, data=data, headers={"Content-Type": "application/json"}
+    )
+    try:
+        with urllib.request.urlopen(request, timeout=30) as response:
+            response.read()
+            return response.status == 200
+    except (OSError, urllib.error.HTTPError):
+        return False
+
+
+def load(url: str, messages: list, concurrency: int, duration: float) -> dict:
+    """concurrency clients posting back-to-back for duration seconds."""
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + duration
+
+    def client(offset):
+        position = offset
+        mine, failed = [], 0
+        while time.perf_counter() < stop_at:
+            message = messages[position % len(messages)]
+            position += concurrency
+            start = time.perf_counter()
+            ok = _post(url, message)
+            mine.append(time.perf_counter() - start)
+            failed += not ok
+        with lock:
+            latencies.extend(mine)
+            errors[0] += failed
+
+    threads = [
+        threading.Thread(target=client, args=(i,))
+        for i in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+
+    def pct(fraction):
+        return latencies[min(len(latencies) - 1,
+                             int(fraction * len(latencies)))] * 1000
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors[0],
+        "req_per_s": len(latencies) / elapsed,
+        "p50_ms": pct(0.50),
+        "p95_ms": pct(0.95),
+        "p99_ms": pct(0.99)
+    }
+
+
+def run_mode(mode, workers, levels, duration, messages) -> list:
+    port = free_port()
+    env = dict(
+        os.environ,
+        ARAM_RATE_LIMIT="0",
+        ARAM_LOGS_DIR=tempfile.mkdtemp(prefix="aram-bench-"),
+        MONGODB_URI=""
+    )
+    server = subprocess.Popen(
+        _server_command(mode, workers, port), cwd=BASE_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    base = f"http://127.0.0.1:{port}"
+    try:
+        _wait_ready(f"{base}/metrics")
+        # Warm every worker's cache of pre-rendered routes
+        load(f"{base}/chat", messages, workers * 2, 1.0)
+        return [
+            load(f"{base}/chat", messages, level, duration)
+            for level in levels
+        ]
+    finally:
+        server.terminate()
+        server.wait(30)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="/chat concurrency: sync gunicorn vs async uvicorn"
+    )
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--concurrency", type=int, nargs="+",
+                        default=[1, 8, 32])
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument("--output", help="JSON file to write")
+    args = parser.parse_args(argv)
+
+    messages = [item["text"] for item in build_corpus()]
+    report = {
+        "workers": args.workers,
+        "duration_s": args.duration,
+        "sync": run_mode("sync", args.workers, args.concurrency,
+                         args.duration, messages),
+        "async": run_mode("async", args.workers, args.concurrency,
+                          args.duration, messages)
+    }
+
+    print(f"\n⚡ /chat, {args.workers} workers, "
+          f"{args.duration:.0f} s per level")
+    print("─" * 70)
+    print(f"{'mode':<7} {'clients':>7} {'req/s':>9} {'p50 ms':>8} "
+          f"{'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for mode in ("sync", "async"):
+        for row in report[mode]:
+            print(f"{mode:<7} {row['concurrency']:>7} "
+                  f"{row['req_per_s']:>9.0f} {row['p50_ms']:>8.1f} "
+                  f"{row['p95_ms']:>8.1f} {row['p99_ms']:>8.1f} "
+                  f"{row['errors']:>7}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n✅ Results written: {args.output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
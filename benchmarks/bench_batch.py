@@ -0,0 +1,92 @@
+# benchmarks/bench_batch.py
+# Purpose: Throughput of one-by-one detect_intent versus
+#          detect_intents / POST /chat/batch as batches grow
+# Run: python -m benchmarks.bench_batch
+
+import contextlib
+import io
+import random
+import time
+
+BATCH_SIZES = [1, 4, 16, 64, 256, 1024]
+
+SAMPLE_MESSAGES = [
+    "I never got my refund",
+    "someone hacked my account",
+    "I was tricked into giving money",
+    "they are threatening me",
+    "I am being harassed at work",
+    "my product stopped working",
+    "account hack pannittaan",
+    "panam thirumba kudukala",
+    "என் கணக்கு hack ஆனது",
+    "seller not responding after payment",
+    "fake customer care called me",
+    "neighbour troubling me daily",
+    "what documents do I need to file complaint",
+    "xyz qwerty",
+]
+
+
+def make_batch(size: int, seed: int = 42) -> list:
+    rng = random.Random(seed)
+    return [rng.choice(SAMPLE_MESSAGES) for _ in range(size)]
+
+
+def _best_seconds(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run(repeat: int = 3) -> list:
+    # Detector prints a trace line per message — keep it
+    # out of the timings
+    with contextlib.redirect_stdout(io.StringIO()):
+        import app
+        from engine.intent_detector import detect_intent, detect_intents
+
+        app.limiter.enabled = False
+        # Time classification, not the conversation log
+        app.save_log = lambda *args, **kwargs: None
+        client = app.app.test_client()
+
+        results = []
+        for size in BATCH_SIZES:
+            batch = make_batch(size)
+
+            loop_s = _best_seconds(
+                lambda: [detect_intent(text) for text in batch], repeat
+            )
+            batch_s = _best_seconds(
+                lambda: detect_intents(batch), repeat
+            )
+            endpoint_s = _best_seconds(
+                lambda: client.post(
+                    "/chat/batch", json={"messages": batch}
+                ),
+                repeat
+            )
+            results.append({
+                "batch_size": size,
+                "loop_msgs_per_s": size / loop_s,
+                "batch_msgs_per_s": size / batch_s,
+                "endpoint_msgs_per_s": size / endpoint_s,
+            })
+    return results
+
+
+if __name__ == "__main__":
+    rows = run()
+    print("\n⏱️  Batch classification benchmark (messages / second)")
+    print("─" * 60)
+    print(f"{'batch':>6} {'detect_intent loop':>19} "
+          f"{'detect_intents':>15} {'/chat/batch':>13}")
+    for row in rows:
+        print(f"{row['batch_size']:>6} "
+              f"{row['loop_msgs_per_s']:>19.0f} "
+              f"{row['batch_msgs_per_s']:>15.0f} "
+              f"{row['endpoint_msgs_per_s']:>13.0f}")
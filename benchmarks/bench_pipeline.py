@@ -0,0 +1,226 @@
+# benchmarks/bench_pipeline.py
+# Purpose: Latency + throughput of every chat pipeline step
+#          and of the whole /chat route, over the replay corpus
+# Run: python -m benchmarks.bench_pipeline [--output FILE]
+#                                          [--repeat N] [--extras]
+# Compare two runs: python -m benchmarks.compare OLD NEW
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from benchmarks.corpus import build_corpus, corpus_digest
+from config import BASE_DIR
+
+RESULTS_DIR = os.path.join(BASE_DIR, "benchmarks", "results")
+
+
+def _percentile(sorted_values: list, fraction: float) -> float:
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+
+def measure(fn, inputs: list, repeat: int) -> dict:
+    """
+    Calls fn(item) for every input, repeat times, after one
+    untimed warm-up pass. Latencies in microseconds.
+    """
+    for item in inputs:
+        fn(item)
+
+    timings = []
+    clock = time.perf_counter_ns
+    start_all = clock()
+    for _ in range(repeat):
+        for item in inputs:
+            start = clock()
+            fn(item)
+            timings.append(clock() - start)
+    total_s = (clock() - start_all) / 1e9
+
+    timings.sort()
+    return {
+        "calls": len(timings),
+        "mean_us": sum(timings) / len(timings) / 1000,
+        "p50_us": _percentile(timings, 0.50) / 1000,
+        "p95_us": _percentile(timings, 0.95) / 1000,
+        "p99_us": _percentile(timings, 0.99) / 1000,
+        "max_us": timings[-1] / 1000,
+        "calls_per_s": len(timings) / total_s if total_s else 0.0
+    }
+
+
+def _git_revision() -> dict:
+    def git(*args):
+        return subprocess.run(
+            ["git", *args], cwd=BASE_DIR,
+            capture_output=True, text=True
+        ).stdout.strip()
+    try:
+        return {
+            "commit": git("rev-parse", "--short", "HEAD"),
+            "dirty": bool(git("status", "--porcelain", "--untracked-files=no"))
+        }
+    except OSError:
+        return {"commit": None, "dirty": None}
+
+
+def _isolate_logging(log_dir: str):
+    """
+    Points conversation logging at a temp directory and
+    switches MongoDB off, so benchmarking never touches
+    real logs or the cluster.
+    """
+    import engine.log_manager as log_manager
+    import engine.mongo_logger as mongo_logger
+
+    mongo_logger.MONGODB_URI = None
+    log_manager.LOGS_DIR = log_dir
+    log_manager.LOGS_FILE = os.path.join(log_dir, "conversations.jsonl")
+    log_manager.LEGACY_LOGS_FILE = os.path.join(log_dir, "conversations.json")
+    log_manager.LEGACY_ARCHIVE = os.path.join(
+        log_dir, "conversations-00000000-legacy.jsonl"
+    )
+    log_manager.log_stats.live_path = log_manager.LOGS_FILE
+    log_manager.log_stats.snapshot_path = os.path.join(
+        log_dir, "stats_snapshot.json"
+    )
+    return log_manager
+
+
+def run(repeat: int = 3, corpus_size: int = 600, seed: int = 42) -> dict:
+    corpus = build_corpus(corpus_size, seed)
+    texts = [item["text"] for item in corpus]
+    random.seed(seed)   # template choices
+
+    log_dir = tempfile.mkdtemp(prefix="aram-bench-")
+    # Module traces are not part of the measurement
+    with contextlib.redirect_stdout(io.StringIO()):
+        log_manager = _isolate_logging(log_dir)
+
+        import app
+        from engine.intent_detector import rule_based_detect, ml_based_detect
+        from engine.language_detector import detect_language, is_offensive
+        from engine.md_retriever import get_law_context
+        from engine.registry import get_registry
+        from engine.response_generator import generate_response
+
+        app.limiter.enabled = False
+        client = app.app.test_client()
+        registry = get_registry()
+        intents_lookup = registry.intents_lookup
+        sanitized = [app.sanitize_input(text) for text in texts]
+        detected = [
+            dict(rule_based_detect(text)[0] or intents_lookup["UNKNOWN001"])
+            for text in sanitized
+        ]
+        intent_ids = [intent["intent_id"] for intent in detected]
+
+        def post_chat(text):
+            client.post("/chat", json={"message": text})
+
+        def save(text):
+            log_manager.save_log(text, "BENCH", "benchmark response")
+
+        results = {
+            "sanitize_input": measure(app.sanitize_input, texts, repeat),
+            "detect_language": measure(detect_language, sanitized, repeat),
+            "is_offensive": measure(is_offensive, sanitized, repeat),
+            "rule_based_detect": measure(rule_based_detect, sanitized, repeat),
+            "ml_based_detect": measure(
+                lambda text: ml_based_detect(text, intents_lookup),
+                sanitized, repeat
+            ),
+            "get_law_context": measure(get_law_context, intent_ids, repeat),
+            "generate_response": measure(generate_response, detected, repeat),
+            "save_log": measure(save, sanitized, repeat),
+        }
+        # Logging is asynchronous — include the time to write it out
+        start = time.perf_counter()
+        log_manager._local_writer.drain()
+        results["save_log"]["drain_ms"] = (time.perf_counter() - start) * 1000
+
+        app.chat_cache.max_size = 0
+        app.chat_cache.clear()
+        results["chat_uncached"] = measure(post_chat, texts, repeat)
+        app.chat_cache.max_size = app.CACHE_MAX_ENTRIES
+        results["chat_cached"] = measure(post_chat, texts, repeat)
+        log_manager._local_writer.drain()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "git": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "repeat": repeat,
+            "registry_version": registry.version,
+            "model_format": registry.model_format,
+            "corpus": {
+                "size": len(corpus),
+                "seed": seed,
+                "digest": corpus_digest(corpus),
+                "real": sum(item["source"] == "real" for item in corpus)
+            }
+        },
+        "results": results
+    }
+
+
+def run_extras() -> dict:
+    """The focused benchmarks, folded into the same report."""
+    from benchmarks import bench_batch, bench_tanglish
+    return {
+        "tanglish_translator": bench_tanglish.run(),
+        "batch_classification": bench_batch.run()
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Latency + throughput of each chat pipeline step"
+    )
+    parser.add_argument("--output", help="JSON file to write")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--corpus-size", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--extras", action="store_true",
+        help="also run the Tanglish and batch benchmarks"
+    )
+    args = parser.parse_args(argv)
+
+    report = run(args.repeat, args.corpus_size, args.seed)
+    if args.extras:
+        report["extras"] = run_extras()
+
+    output = args.output or os.path.join(
+        RESULTS_DIR,
+        f"pipeline-{report['meta']['git']['commit'] or 'local'}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    print("\n⏱️  Chat pipeline benchmark (µs per call)")
+    print("─" * 70)
+    print(f"{'function':<20} {'mean':>9} {'p50':>9} {'p95':>9} "
+          f"{'p99':>9} {'calls/s':>10}")
+    for name, row in report["results"].items():
+        print(f"{name:<20} {row['mean_us']:>9.1f} {row['p50_us']:>9.1f} "
+              f"{row['p95_us']:>9.1f} {row['p99_us']:>9.1f} "
+              f"{row['calls_per_s']:>10.0f}")
+    print(f"\n✅ Results written: {output}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+# benchmarks/bench_rate_limit.py
+# Purpose: Rate-limit storage backends — cost per hit and
+#          whether the /chat limit holds across processes
+# Backends: memory:// (per process), SQLite (one host) and
+# Redis — an in-process fake (fakeredis[lua]) unless
+# --redis-uri points at a real server
+# Run: python -m benchmarks.bench_rate_limit [--processes 4]
+
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+from limits import parse, storage
+from limits.strategies import SlidingWindowCounterRateLimiter
+from engine.rate_limit_store import sqlite_uri  # + sqlite://
+from config import CHAT_RATE_LIMIT
+
+
+def _fake_redis_options() -> dict | None:
+    """connection_pool for an in-process Redis, or None."""
+    try:
+        import fakeredis
+        import redis
+    except ImportError:
+        return None
+    return {
+        "connection_pool": redis.ConnectionPool(
+            connection_class=fakeredis.FakeConnection,
+            server=fakeredis.FakeServer()
+        )
+    }
+
+
+def hit_latency(uri: str, options: dict, hits: int) -> dict:
+    """µs per hit: one busy client, and many distinct clients."""
+    limiter = SlidingWindowCounterRateLimiter(
+        storage.storage_from_string(uri, **options)
+    )
+    item = parse(CHAT_RATE_LIMIT)
+    result = {}
+    for label, client in (
+        ("same_client_us", lambda i: "10.0.0.1"),
+        ("distinct_clients_us", lambda i: f"10.{i // 65536}."
+                                          f"{i // 256 % 256}.{i % 256}")
+    ):
+        start = time.perf_counter()
+        for i in range(hits):
+            limiter.hit(item, "chat", client(i))
+        result[label] = (time.perf_counter() - start) / hits * 1e6
+    limiter.storage.reset()
+    return result
+
+
+def _hammer(uri: str, attempts: int, results) -> None:
+    # Runs in a child process: its own storage connection
+    limiter = SlidingWindowCounterRateLimiter(
+        storage.storage_from_string(uri)
+    )
+    item = parse(CHAT_RATE_LIMIT)
+    results.put(sum(
+        limiter.hit(item, "chat", "203.0.113.7") for _ in range(attempts)
+    ))
+
+
+def global_allowed(uri: str, processes: int, attempts: int) -> int:
+    """Hits accepted for ONE client across several processes."""
+    context = multiprocessing.get_context("fork")
+    results = context.Queue()
+    workers = [
+        context.Process(target=_hammer, args=(uri, attempts, results))
+        for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return sum(results.get() for _ in workers)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Rate-limit storage: cost per hit + global limits"
+    )
+    parser.add_argument("--hits", type=int, default=5000)
+    parser.add_argument("--processes", type=int, default=4)
+    parser.add_argument(
+        "--redis-uri", help="real Redis, e.g. redis://localhost:6379"
+    )
+    args = parser.parse_args(argv)
+
+    backends = [
+        ("memory", "memory://", {}),
+        ("sqlite", sqlite_uri(os.path.join(
+            tempfile.mkdtemp(prefix="aram-bench-"), "ratelimit.sqlite3"
+        )), {})
+    ]
+    if args.redis_uri:
+        backends.append(("redis", args.redis_uri, {}))
+    else:
+        fake = _fake_redis_options()
+        if fake:
+            backends.append(("redis (fake)", "redis://localhost:6379", fake))
+        else:
+            print("⚠️  fakeredis[lua] not installed — skipping Redis")
+
+    limit = parse(CHAT_RATE_LIMIT).amount
+    print(f"\n🚦 Rate limit storage — {CHAT_RATE_LIMIT}, "
+          f"sliding window counter")
+    print("─" * 70)
+    print(f"{'backend':<14} {'µs/hit (1 client)':>18} "
+          f"{'µs/hit (many)':>14} {'allowed':>9} {'expected':>9}")
+    for name, uri, options in backends:
+        latency = hit_latency(uri, options, args.hits)
+        # A fake Redis lives in one process — no cross-process run
+        allowed = (
+            global_allowed(uri, args.processes, limit * 2)
+            if not options else None
+        )
+        print(f"{name:<14} {latency['same_client_us']:>18.1f} "
+              f"{latency['distinct_clients_us']:>14.1f} "
+              f"{'—' if allowed is None else allowed:>9} {limit:>9}")
+    print(f"\n'allowed': hits accepted for one client from "
+          f"{args.processes} processes — memory:// counts per process.")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
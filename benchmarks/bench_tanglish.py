@@ -0,0 +1,79 @@
+# benchmarks/bench_tanglish.py
+# Purpose: Compare the old str.replace() chain with the
+#          single-pass Tanglish translator as the map grows
+# Run: python -m benchmarks.bench_tanglish
+
+import random
+import string
+import timeit
+from engine.language_detector import TANGLISH_KEYWORD_MAP
+from engine.pattern_matcher import LongestMatchTranslator
+
+MAP_SIZES = [len(TANGLISH_KEYWORD_MAP), 100, 1000, 5000]
+
+SAMPLE_TEXTS = [
+    "account hack pannittaan",
+    "panam thirumba kudukala seller mosadi pannittaan",
+    "otp kuduthen panam pochu bank fraud udhavi venum",
+    "naan online la porul vaanginen aana kedu porul vandhuchu "
+    "thirupa kudukala complaint panna enna pannanum",
+]
+
+
+def legacy_translate(text: str, mapping: dict) -> str:
+    """The original implementation — one replace() per key."""
+    text_lower = text.lower()
+    for tanglish, english in mapping.items():
+        text_lower = text_lower.replace(tanglish, english)
+    return text_lower
+
+
+def grow_map(size: int, seed: int = 42) -> dict:
+    """Real map padded with random Tanglish-like words."""
+    rng = random.Random(seed)
+    mapping = dict(TANGLISH_KEYWORD_MAP)
+    while len(mapping) < size:
+        word = "".join(
+            rng.choice(string.ascii_lowercase)
+            for _ in range(rng.randint(4, 10))
+        )
+        mapping.setdefault(word, "word")
+    return mapping
+
+
+def run(repeat: int = 5, number: int = 200) -> list:
+    results = []
+    for size in MAP_SIZES:
+        mapping = grow_map(size)
+        translator = LongestMatchTranslator(mapping)
+
+        def old():
+            for text in SAMPLE_TEXTS:
+                legacy_translate(text, mapping)
+
+        def new():
+            for text in SAMPLE_TEXTS:
+                translator.translate(text.lower())
+
+        per_call = number * len(SAMPLE_TEXTS)
+        old_us = min(timeit.repeat(old, repeat=repeat, number=number))
+        new_us = min(timeit.repeat(new, repeat=repeat, number=number))
+        results.append({
+            "map_size": size,
+            "replace_chain_us": old_us / per_call * 1e6,
+            "single_pass_us": new_us / per_call * 1e6,
+        })
+    return results
+
+
+if __name__ == "__main__":
+    print("\n⏱️  Tanglish translator benchmark (µs per message)")
+    print("─" * 56)
+    print(f"{'map size':>10} {'replace chain':>15} "
+          f"{'single pass':>13} {'speedup':>9}")
+    for row in run():
+        speedup = row["replace_chain_us"] / row["single_pass_us"]
+        print(f"{row['map_size']:>10} "
+              f"{row['replace_chain_us']:>15.1f} "
+              f"{row['single_pass_us']:>13.1f} "
+              f"{speedup:>8.1f}x")
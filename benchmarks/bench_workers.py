@@ -0,0 +1,169 @@
+# benchmarks/bench_workers.py
+# Purpose: Worker memory + spawn time, preloaded vs per-worker
+# Starts gunicorn with gunicorn.conf.py twice (ARAM_PRELOAD=1
+# and 0) and reads each worker's RSS / PSS / USS from
+# /proc/<pid>/smaps_rollup (Linux only)
+# Run: python -m benchmarks.bench_workers [--workers 4]
+
+import argparse
+import json
+import os
+import re
+import signal
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+from config import BASE_DIR
+
+READY_LINE = re.compile(r"Worker (\d+) ready in ([\d.]+) ms")
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _children(pid: int) -> list:
+    children = []
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat", "r") as f:
+                # ppid is the 2nd field after "(comm)"
+                ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+        if ppid == pid:
+            children.append(int(entry))
+    return sorted(children)
+
+
+def memory_kb(pid: int) -> dict:
+    """RSS, PSS (shared pages split) and USS (private) in KB."""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup", "r") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].isdigit():
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss_kb": fields.get("Rss", 0),
+        "pss_kb": fields.get("Pss", 0),
+        "uss_kb": fields.get("Private_Clean", 0)
+        + fields.get("Private_Dirty", 0)
+    }
+
+
+def _get(url: str) -> bool:
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            return response.status == 200
+    except OSError:
+        return False
+
+
+def run_server(workers: int, preload: bool, requests: int) -> dict:
+    port = free_port()
+    env = dict(
+        os.environ,
+        ARAM_PRELOAD="1" if preload else "0",
+        WEB_CONCURRENCY=str(workers),
+        MONGODB_URI=""
+    )
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py",
+         "--bind", f"127.0.0.1:{port}"],
+        cwd=BASE_DIR, env=env,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+    )
+
+    spawn_ms = {}
+    all_ready = threading.Event()
+
+    def read_log():
+        for line in server.stderr:
+            match = READY_LINE.search(line)
+            if match:
+                spawn_ms[int(match.group(1))] = float(match.group(2))
+                if len(spawn_ms) == workers:
+                    all_ready.set()
+
+    threading.Thread(target=read_log, daemon=True).start()
+    try:
+        if not all_ready.wait(120):
+            raise RuntimeError("gunicorn workers did not start")
+        boot_s = time.perf_counter() - start
+
+        # Some traffic, so workers run their collector
+        for _ in range(requests):
+            _get(f"http://127.0.0.1:{port}/metrics")
+        memory = {pid: memory_kb(pid) for pid in _children(server.pid)}
+        master = memory_kb(server.pid)
+    finally:
+        server.send_signal(signal.SIGTERM)
+        server.wait(30)
+
+    worker_mem = list(memory.values())
+    return {
+        "preload": preload,
+        "workers": workers,
+        "boot_s": boot_s,
+        "spawn_ms": sorted(spawn_ms.values()),
+        "master": master,
+        "worker_memory": worker_mem,
+        "total_pss_kb": sum(m["pss_kb"] for m in worker_mem),
+        "total_uss_kb": sum(m["uss_kb"] for m in worker_mem)
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="gunicorn worker memory + spawn time"
+    )
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--output", help="JSON file to write")
+    args = parser.parse_args(argv)
+
+    if not os.path.exists("/proc/self/smaps_rollup"):
+        print("⚠️  Needs Linux /proc/<pid>/smaps_rollup")
+        return 1
+
+    runs = [
+        run_server(args.workers, preload, args.requests)
+        for preload in (False, True)
+    ]
+
+    print(f"\n🧠 gunicorn, {args.workers} workers (KB per worker)")
+    print("─" * 70)
+    print(f"{'mode':<12} {'boot s':>7} {'spawn ms':>9} "
+          f"{'RSS':>9} {'PSS':>9} {'USS':>9}")
+    for result in runs:
+        count = len(result["worker_memory"]) or 1
+        spawn = result["spawn_ms"]
+        print(
+            f"{'preload' if result['preload'] else 'per-worker':<12} "
+            f"{result['boot_s']:>7.2f} "
+            f"{sum(spawn) / len(spawn):>9.1f} "
+            f"{sum(m['rss_kb'] for m in result['worker_memory']) / count:>9.0f} "
+            f"{result['total_pss_kb'] / count:>9.0f} "
+            f"{result['total_uss_kb'] / count:>9.0f}"
+        )
+    print("\nPSS splits shared pages between processes; USS is "
+          "what a worker alone costs.")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(runs, f, indent=2)
+        print(f"✅ Results written: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
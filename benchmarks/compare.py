@@ -0,0 +1,76 @@
+# benchmarks/compare.py
+# Purpose: Diff two bench_pipeline JSON reports
+# Run: python -m benchmarks.compare OLD.json NEW.json [--threshold 10]
+
+import argparse
+import json
+import sys
+
+METRICS = ["mean_us", "p50_us", "p95_us", "p99_us"]
+
+
+def load(path: str) -> dict:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(old: dict, new: dict, threshold: float) -> list:
+    """
+    Rows of (function, metric, old, new, change %, flag);
+    flag is "slower" / "faster" beyond threshold percent.
+    """
+    rows = []
+    for name, new_row in new["results"].items():
+        old_row = old["results"].get(name)
+        if old_row is None:
+            continue
+        for metric in METRICS:
+            before, after = old_row[metric], new_row[metric]
+            change = (after - before) / before * 100 if before else 0.0
+            flag = ""
+            if change > threshold:
+                flag = "slower"
+            elif change < -threshold:
+                flag = "faster"
+            rows.append((name, metric, before, after, change, flag))
+    return rows
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Diff two bench_pipeline JSON reports"
+    )
+    parser.add_argument("old")
+    parser.add_argument("new")
+    parser.add_argument(
+        "--threshold", type=float, default=10.0,
+        help="percent change reported as a regression / gain"
+    )
+    args = parser.parse_args(argv)
+    old, new = load(args.old), load(args.new)
+
+    old_corpus = old["meta"]["corpus"]["digest"]
+    new_corpus = new["meta"]["corpus"]["digest"]
+    if old_corpus != new_corpus:
+        print(f"⚠️  Different corpora ({old_corpus} vs {new_corpus}) "
+              f"— numbers are not directly comparable")
+
+    print(f"\n📊 {old['meta']['git']['commit']} → "
+          f"{new['meta']['git']['commit']}")
+    print("─" * 72)
+    regressions = 0
+    for name, metric, before, after, change, flag in compare(
+        old, new, args.threshold
+    ):
+        marker = {"slower": "🔴", "faster": "🟢"}.get(flag, "  ")
+        print(f"{marker} {name:<20} {metric:<8} "
+              f"{before:>10.1f} → {after:>10.1f}  {change:>+7.1f}%")
+        if flag == "slower" and metric == "p50_us":
+            regressions += 1
+
+    # Non-zero exit lets CI fail on a median regression
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+# benchmarks/corpus.py
+# Purpose: Deterministic replay corpus for the benchmarks
+# Real queries (missed-query export + known user phrasing)
+# plus synthetic English / Tamil / Tanglish messages built
+# from the intent data — same seed, same corpus
+
+import hashlib
+import json
+import os
+import random
+import re
+from config import BASE_DIR, INTENTS_FILE, TAMIL_INTENTS_FILE
+
+MISSED_QUERIES_FILE = os.path.join(BASE_DIR, "logs", "missed_queries.txt")
+
+# Phrasing seen from real users, kept with the repo so the
+# corpus does not depend on local conversation logs
+REAL_QUERIES = [
+    "hello", "hi", "vanakkam aram", "thank you", "who are you",
+    "what can you do", "ok bye", "good morning",
+    "I never got my refund", "someone hacked my account",
+    "I was tricked into giving money", "they are threatening me",
+    "I am being harassed at work", "cyber fraud happened to me",
+    "my product stopped working", "refund",
+    "money back please seller not refunding",
+    "someone made fake profile with my photos",
+    "I ordered online but nothing came",
+    "how do I file a police complaint",
+    "neighbour troubling me daily", "fake job offer scam",
+    "phonepe fraud happened", "my aadhaar details misused",
+    "account hack pannittaan", "emattu vittaan",
+    "panam thirumba kudukala", "hacking aana enna pannanum",
+    "otp kuduthen panam pochu", "mosadi nadanthuchu",
+    "thondara pannuranga", "hack aana account", "poi sonnanga",
+    "என் கணக்கு hack ஆனது", "மிரட்டல் வருகிறது",
+    "பணம் திரும்ப வரவில்லை", "what is cricket", "poda loosu",
+    "<script>alert(1)</script> refund not processed",
+]
+
+ENGLISH_FILLERS = [
+    "please help", "what should I do", "I need help",
+    "yesterday", "urgent", "my", "the seller", "online",
+    "can you guide me", "it happened again"
+]
+TANGLISH_FILLERS = [
+    "enna pannanum", "udhavi venum", "please sollunga",
+    "naan", "ippo", "romba kashtam", "yaaru kitta complaint"
+]
+TAMIL_FILLERS = [
+    "உதவி வேண்டும்", "என்ன செய்வது", "தயவு செய்து", "நேற்று", "எனக்கு"
+]
+
+
+def load_missed_queries(path: str = MISSED_QUERIES_FILE) -> list:
+    """Queries from the missed-query export ("N. query" lines)."""
+    if not os.path.exists(path):
+        return []
+    queries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            match = re.match(r"\s*\d+\.\s+(.+)", line)
+            if match:
+                queries.append(match.group(1).strip().strip('-" '))
+    return [q for q in queries if q]
+
+
+def _synthetic(rng, keywords: list, fillers: list) -> str:
+    words = rng.sample(keywords, k=min(len(keywords), rng.randint(1, 2)))
+    words += rng.sample(fillers, k=rng.randint(0, 2))
+    rng.shuffle(words)
+    return " ".join(words)
+
+
+def build_corpus(size: int = 600, seed: int = 42) -> list:
+    """
+    Returns [{"text", "language", "source"}, ...] — every
+    real query once, then synthetic messages up to size
+    (roughly half English, a quarter each Tamil/Tanglish).
+    """
+    rng = random.Random(seed)
+
+    with open(INTENTS_FILE, "r", encoding="utf-8") as f:
+        intents = json.load(f)["intents"]
+    with open(TAMIL_INTENTS_FILE, "r", encoding="utf-8") as f:
+        tamil_intents = json.load(f)["tamil_intents"]
+
+    english = [kw for intent in intents for kw in intent.get("keywords", [])]
+    tamil = [
+        kw for intent in tamil_intents
+        for kw in intent.get("tamil_keywords", [])
+    ]
+    tanglish = [
+        kw for intent in tamil_intents
+        for kw in intent.get("tanglish_keywords", [])
+    ]
+
+    corpus = [
+        {"text": text, "language": "mixed", "source": "real"}
+        for text in REAL_QUERIES + load_missed_queries()
+    ]
+    while len(corpus) < size:
+        roll = rng.random()
+        if roll < 0.5:
+            text = _synthetic(rng, english, ENGLISH_FILLERS)
+            language = "english"
+        elif roll < 0.75:
+            text = _synthetic(rng, tamil, TAMIL_FILLERS)
+            language = "tamil"
+        else:
+            text = _synthetic(rng, tanglish, TANGLISH_FILLERS)
+            language = "tanglish"
+        corpus.append(
+            {"text": text, "language": language, "source": "synthetic"}
+        )
+    return corpus[:size]
+
+
+def corpus_digest(corpus: list) -> str:
+    """Short hash — results are only comparable on equal corpora."""
+    blob = "\n".join(item["text"] for item in corpus).encode("utf-8")
+    return hashlib.sha256(blob).hexdigest()[:12]
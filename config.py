@@ -2,11 +2,17 @@
 # Purpose: Central configuration for ARAM application
 
 import os
+import tempfile
+from pathlib import Path
 
 # ── Paths ──────────────────────────────────────────
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, "data")
 INTENTS_FILE = os.path.join(DATA_DIR, "intents.json")
+TAMIL_INTENTS_FILE = os.path.join(DATA_DIR, "tamil_intents.json")
+MODEL_PATH = os.path.join(BASE_DIR, "engine", "aram_model.pkl")
+# NumPy export of the same model — served without scikit-learn
+MODEL_NPZ_PATH = os.path.join(BASE_DIR, "engine", "aram_model.npz")
 
 # ── App Settings ───────────────────────────────────
 APP_NAME = "ARAM"
@@ -17,6 +23,67 @@ APP_DESCRIPTION = "Legal Awareness Assistant for Indian Citizens"
 MIN_KEYWORD_MATCH = 1        # Minimum keywords to match an intent
 CONFIDENCE_THRESHOLD = 0.15   # Match confidence threshold (0 to 1)
 
+# ── Rate Limits ────────────────────────────────────
+RATE_LIMIT_ENABLED = os.getenv("ARAM_RATE_LIMIT", "1") != "0"   # 0 = off (benchmarks)
+DEFAULT_RATE_LIMITS = ["200 per day", "50 per hour"]   # Per client, every route
+CHAT_RATE_LIMIT = "15 per minute"    # Per client, for /chat
+# Counters shared by all workers, so limits hold globally:
+#   sqlite:///path — one host (engine/rate_limit_store.py)
+#   redis://host:6379 — several hosts (needs the redis package)
+#   memory:// — per worker, limits multiply with the worker count
+RATE_LIMIT_STORAGE_URI = os.getenv(
+    "ARAM_RATE_LIMIT_STORAGE",
+    # Forward slashes and a leading "/", so a Windows
+    # drive (C:/...) stays in the URI path
+    "sqlite:///" + Path(
+        tempfile.gettempdir(), "aram-ratelimit.sqlite3"
+    ).as_posix().lstrip("/")
+)
+RATE_LIMIT_STRATEGY = "sliding-window-counter"   # Constant memory per client
+
+# ── Batch API ──────────────────────────────────────
+BATCH_MAX_SIZE = 1024         # Max messages per /chat/batch request
+BATCH_RATE_LIMIT = "10 per minute"   # Per client, for /chat/batch
+
+# ── Async Serving (asgi.py) ────────────────────────
+ASYNC_EXECUTOR_WORKERS = 4    # Threads running the pipeline off the event loop
+
+# ── Result Cache ───────────────────────────────────
+CACHE_MAX_ENTRIES = 2048      # Distinct messages kept
+CACHE_TTL = 600               # Seconds before a cached route expires
+
+# ── Startup ────────────────────────────────────────
+IMPORT_BUDGET_MS = 400        # tools.startup_report fails above this "import app" time
+
+# ── Hot Reload ─────────────────────────────────────
+RELOAD_CHECK_INTERVAL = 5     # Seconds between model/intent file checks
+
+# ── Integrity Monitor ──────────────────────────────
+INTEGRITY_CHECK_INTERVAL = 10          # Seconds between law file stat checks
+INTEGRITY_FULL_RECHECK_INTERVAL = 3600  # Seconds between forced re-hashes (0 = never)
+
+# ── Conversation Logs ──────────────────────────────
+LOG_QUEUE_SIZE = 10000        # Max log entries waiting for the writer
+LOG_BATCH_SIZE = 100          # Entries per write
+LOG_FLUSH_INTERVAL = 1.0      # Seconds before a partial batch is written
+LOG_MAX_BYTES = 5 * 1024 * 1024   # Rotate conversations.jsonl past this size
+LOG_ROTATE_DAILY = True       # Also rotate on the first write of a new day
+LOG_STATS_REFRESH_INTERVAL = 5     # Seconds between /logs/summary catch-ups
+LOG_STATS_SNAPSHOT_INTERVAL = 60   # Seconds between stats snapshots on disk
+
+# ── Event Logging ──────────────────────────────────
+LOG_LEVEL = os.getenv("ARAM_LOG_LEVEL", "INFO")   # DEBUG shows per-request traces
+LOG_EVENT_QUEUE_SIZE = 10000  # Events waiting for the output thread
+
+# ── MongoDB Logging ────────────────────────────────
+MONGO_QUEUE_SIZE = 5000       # Max documents waiting for insert
+MONGO_BATCH_SIZE = 50         # Documents per insert_many
+MONGO_FLUSH_INTERVAL = 2.0    # Seconds before a partial batch is inserted
+MONGO_OVERFLOW_POLICY = "spill"   # "spill" to logs/mongo_spill.jsonl or "drop"
+MONGO_CONNECT_TIMEOUT_MS = 5000   # Server selection timeout per attempt
+MONGO_RECONNECT_MIN_DELAY = 1     # Seconds before the first retry
+MONGO_RECONNECT_MAX_DELAY = 60    # Backoff cap between retries
+
 # ── Severity Levels ────────────────────────────────
 SEVERITY_LEVELS = {
     "low": "This situation can likely be resolved through communication.",
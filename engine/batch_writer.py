@@ -0,0 +1,170 @@
+# engine/batch_writer.py
+# Purpose: Move slow writes (files, MongoDB) off the request thread
+# Bounded queue → one writer thread → flush in batches
+
+import atexit
+import queue
+import threading
+import time
+from typing import NamedTuple
+from engine.event_log import get_logger
+from engine.proc_thread import PerProcess
+
+log = get_logger("batch_writer")
+
+
+class FlushOutcome(NamedTuple):
+    """
+    What became of a batch, returned by a flush_fn that
+    may not write everything (e.g. MongoDB down).
+    """
+    flushed: int = 0
+    spilled: int = 0
+    dropped: int = 0
+
+
+class BatchWriter:
+    """
+    Collects items on a bounded in-process queue and hands
+    them to flush_fn(batch) from a single writer thread.
+
+    A batch is flushed when it reaches batch_size items or
+    when flush_interval seconds passed since its first item.
+    submit() never blocks: when the queue is full the item
+    goes to on_full(item) if given, otherwise it is dropped.
+
+    Every item is counted exactly once as flushed, spilled,
+    dropped or failed. flush_fn returns None (all flushed)
+    or a FlushOutcome; if it raises, the batch is failed.
+    on_full returns True if it kept the item (spilled).
+    """
+
+    def __init__(
+        self,
+        flush_fn,
+        name: str,
+        max_queue: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        on_full=None
+    ):
+        self.flush_fn = flush_fn
+        self.name = name
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.on_full = on_full
+
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._thread = None
+        self._runner = PerProcess(self._start_thread)
+
+        self.submitted = 0
+        self.flushed = 0
+        self.spilled = 0
+        self.dropped = 0
+        self.failed = 0
+
+        atexit.register(self.close)
+
+    # ── Producer side (request thread) ───────────────
+    def submit(self, item) -> bool:
+        """Queues one item; returns False if it did not fit."""
+        self.ensure_running()
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            kept = False
+            if self.on_full:
+                try:
+                    kept = bool(self.on_full(item))
+                except Exception as e:
+                    log.error(
+                        "writer.overflow_handler_failed",
+                        writer=self.name, error=str(e)
+                    )
+            if kept:
+                self.spilled += 1
+            else:
+                self.dropped += 1
+            return False
+        self.submitted += 1
+        return True
+
+    def stats(self) -> dict:
+        """Counters for health / metrics."""
+        return {
+            "queued": self._queue.qsize(),
+            "submitted": self.submitted,
+            "flushed": self.flushed,
+            "spilled": self.spilled,
+            "dropped": self.dropped,
+            "failed": self.failed
+        }
+
+    # ── Writer thread ────────────────────────────────
+    def ensure_running(self) -> None:
+        """Starts the writer thread once per process."""
+        self._runner.ensure()
+
+    def _start_thread(self, forked: bool) -> None:
+        # A forked child inherits the parent's queue
+        # contents — the parent flushes those itself
+        if forked:
+            self._queue = queue.Queue(maxsize=self._queue.maxsize)
+        self._thread = threading.Thread(
+            target=self._run, name=self.name, daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch: list) -> None:
+        try:
+            outcome = self.flush_fn(batch)
+            if outcome is None:
+                outcome = FlushOutcome(flushed=len(batch))
+            self.flushed += outcome.flushed
+            self.spilled += outcome.spilled
+            self.dropped += outcome.dropped
+        except Exception as e:
+            self.failed += len(batch)
+            log.error(
+                "writer.flush_failed",
+                writer=self.name, batch=len(batch), error=str(e)
+            )
+        finally:
+            for _ in batch:
+                self._queue.task_done()
+
+    def drain(self) -> None:
+        """Blocks until everything queued so far is flushed."""
+        if self._runner.started_here():
+            self._queue.join()
+
+    def close(self) -> None:
+        """
+        Flushes whatever is still queued. Runs at exit, on
+        the calling thread, so nothing is lost on shutdown.
+        """
+        if not self._runner.started_here():
+            return
+        batch = []
+        while True:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._flush(batch)
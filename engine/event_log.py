@@ -0,0 +1,160 @@
+# engine/event_log.py
+# Purpose: Structured (JSON lines) event logging
+# Replaces print() on the request path: events below the
+# configured level cost one flag check, and output is
+# written by a background thread — never by the request
+
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import sys
+import threading
+from datetime import datetime
+from config import LOG_LEVEL, LOG_EVENT_QUEUE_SIZE
+from engine.proc_thread import PerProcess
+
+ROOT_LOGGER = "aram"
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line — event name plus fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created).isoformat(
+                timespec="milliseconds"
+            ),
+            "level": record.levelname,
+            "logger": record.name,
+            "pid": record.process,
+            "event": record.msg
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class _NonBlockingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler on a bounded queue. A full queue drops
+    the event (counted) instead of blocking the request.
+    The listener thread starts on the first event in each
+    process.
+    """
+
+    def __init__(self, max_queue: int):
+        super().__init__(queue.Queue(maxsize=max_queue))
+        self.max_queue = max_queue
+        self.dropped = 0
+        self._listener = None
+        self._runner = PerProcess(self._start_listener)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Formatting happens on the listener thread
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.ensure_listener()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def ensure_listener(self) -> None:
+        self._runner.ensure()
+
+    def _start_listener(self, forked: bool) -> None:
+        if forked:
+            # Parent's queued events are the parent's job
+            self.queue = queue.Queue(maxsize=self.max_queue)
+        output = logging.StreamHandler(sys.stdout)
+        output.setFormatter(JsonFormatter())
+        self._listener = logging.handlers.QueueListener(
+            self.queue, output, respect_handler_level=False
+        )
+        self._listener.start()
+        atexit.register(self.stop_listener)
+
+    def stop_listener(self) -> None:
+        """Writes whatever is still queued (runs at exit)."""
+        if self._listener is not None and self._runner.started_here():
+            self._listener.stop()
+            self._listener = None
+            self._runner.reset()
+
+
+_handler = None
+_setup_lock = threading.Lock()
+
+
+def configure_logging(level: str = LOG_LEVEL) -> None:
+    """Attaches the queue handler to the "aram" logger once."""
+    global _handler
+    with _setup_lock:
+        if _handler is not None:
+            return
+        root = logging.getLogger(ROOT_LOGGER)
+        root.setLevel(level.upper())
+        # Own output only — no duplicates via gunicorn's root
+        root.propagate = False
+        _handler = _NonBlockingQueueHandler(LOG_EVENT_QUEUE_SIZE)
+        root.addHandler(_handler)
+
+
+def stop_listener() -> None:
+    """
+    Writes queued events and stops this process's output
+    thread; the next event starts it again. gunicorn's
+    master calls it so no thread is running at fork().
+    """
+    if _handler is not None:
+        _handler.stop_listener()
+
+
+def dropped_events() -> int:
+    """Events lost because the log queue was full."""
+    return _handler.dropped if _handler else 0
+
+
+class EventLogger:
+    """
+    log.debug("rule.strong", intent="CP001", score=0.67)
+
+    Each method checks the level FIRST, so a disabled
+    event never builds its record or formats anything.
+    Keep field values cheap (no f-strings) — they are
+    evaluated at the call site.
+    """
+
+    __slots__ = ("logger",)
+
+    def __init__(self, logger: logging.Logger):
+        self.logger = logger
+
+    def is_enabled(self, level: int) -> bool:
+        return self.logger.isEnabledFor(level)
+
+    def debug(self, event: str, **fields) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(event, extra={"fields": fields})
+
+    def info(self, event: str, **fields) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(event, extra={"fields": fields})
+
+    def warning(self, event: str, **fields) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            self.logger.warning(event, extra={"fields": fields})
+
+    def error(self, event: str, **fields) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            self.logger.error(event, extra={"fields": fields})
+
+
+def get_logger(name: str) -> EventLogger:
+    """Event logger for a module, e.g. get_logger("mongo_logger")."""
+    configure_logging()
+    return EventLogger(logging.getLogger(f"{ROOT_LOGGER}.{name}"))
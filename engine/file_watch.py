@@ -0,0 +1,83 @@
+# engine/file_watch.py
+# Purpose: Cheap change detection for data / model files
+# Stats files at most once per interval — never per request
+
+import hashlib
+import os
+import threading
+import time
+
+
+def stat_signature(paths) -> tuple:
+    """
+    Metadata fingerprint of a group of files.
+    Missing files are recorded as None.
+    """
+    signature = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+            signature.append((st.st_mtime_ns, st.st_size, st.st_ino))
+        except OSError:
+            signature.append(None)
+    return tuple(signature)
+
+
+def content_digest(blobs) -> str:
+    """SHA256 over file contents, in the given order."""
+    sha = hashlib.sha256()
+    for blob in blobs:
+        sha.update(blob or b"")
+    return sha.hexdigest()
+
+
+class FileWatcher:
+    """
+    Watches a group of files for metadata changes.
+
+    poll() is safe to call on every request: it only
+    stats the files once per interval, and only one
+    thread at a time runs the change handler.
+    """
+
+    def __init__(self, paths, interval: float, background: bool = True):
+        self.paths = list(paths)
+        self.interval = interval
+        self.background = background
+        self._signature = stat_signature(self.paths)
+        self._last_check = time.monotonic()
+        self._lock = threading.Lock()
+
+    def poll(self, on_change) -> None:
+        """
+        Calls on_change() when the files changed since the last
+        successful handler run. on_change returns True to accept
+        the change, False to retry on the next interval.
+        """
+        now = time.monotonic()
+        if now - self._last_check < self.interval:
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+
+        self._last_check = now
+        signature = stat_signature(self.paths)
+        if signature == self._signature:
+            self._lock.release()
+            return
+
+        if self.background:
+            threading.Thread(
+                target=self._handle,
+                args=(on_change, signature),
+                daemon=True
+            ).start()
+        else:
+            self._handle(on_change, signature)
+
+    def _handle(self, on_change, signature: tuple) -> None:
+        try:
+            if on_change():
+                self._signature = signature
+        finally:
+            self._lock.release()
@@ -0,0 +1,140 @@
+# engine/integrity_monitor.py
+# Purpose: Detect tampering of law files WITHOUT hashing
+#          them on every request
+# Hashes once at startup, then re-hashes only when file
+# metadata changes (or on a slow full-recheck interval)
+
+import hashlib
+import threading
+import time
+from engine.event_log import get_logger
+from engine.file_watch import stat_signature
+from engine.proc_thread import PerProcess
+
+log = get_logger("integrity_monitor")
+
+
+def calculate_hash(filepath: str) -> str:
+    """Calculate SHA256 hash of a file."""
+    try:
+        with open(filepath, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except Exception:
+        return ""
+
+
+class IntegrityMonitor:
+    """
+    Background integrity check for a fixed set of files.
+
+    The request path only reads is_intact() — an in-memory
+    flag. A daemon thread stats the files every
+    check_interval seconds and re-hashes a file only when
+    its mtime / size / inode changed, plus a full re-hash
+    every full_recheck_interval seconds (0 = never).
+
+    on_tamper(filepath) is called ONCE when a file starts
+    failing its check, not on every request.
+    """
+
+    def __init__(
+        self,
+        files,
+        check_interval: float,
+        full_recheck_interval: float = 0,
+        on_tamper=None
+    ):
+        self.files = list(files)
+        self.check_interval = check_interval
+        self.full_recheck_interval = full_recheck_interval
+        self.on_tamper = on_tamper
+
+        # Metadata first: an edit during hashing is then
+        # still seen as a change on the first check
+        self._signatures = {
+            f: stat_signature([f]) for f in self.files
+        }
+        self.baseline = {f: calculate_hash(f) for f in self.files}
+        self._tampered = set()
+        self._intact = True
+        self._last_full_check = time.monotonic()
+        self._last_check_at = None
+
+        self._stop = threading.Event()
+        self._thread = None
+        self._runner = PerProcess(self._start_thread)
+
+        log.info(
+            "integrity.baseline",
+            files={f: h[:16] for f, h in self.baseline.items()}
+        )
+
+    # ── Request path ──────────────────────────────────
+    def is_intact(self) -> bool:
+        """Cheap flag read — no disk access."""
+        self.ensure_running()
+        return self._intact
+
+    def status(self) -> dict:
+        """Snapshot for health / debugging."""
+        return {
+            "intact": self._intact,
+            "tampered": sorted(self._tampered),
+            "last_check": self._last_check_at
+        }
+
+    # ── Background thread ─────────────────────────────
+    def ensure_running(self) -> None:
+        """Starts the monitor thread once per process."""
+        self._runner.ensure()
+
+    def _start_thread(self, forked: bool) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="integrity-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the monitor thread after its current wait."""
+        self._stop.set()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.check_interval):
+            try:
+                self.check_now()
+            except Exception as e:
+                log.error("integrity.monitor_error", error=str(e))
+
+    def check_now(self, full: bool = False) -> bool:
+        """Runs one check; returns the new intact flag."""
+        now = time.monotonic()
+        if (self.full_recheck_interval
+                and now - self._last_full_check
+                >= self.full_recheck_interval):
+            full = True
+        if full:
+            self._last_full_check = now
+
+        for filepath in self.files:
+            signature = stat_signature([filepath])
+            if not full and signature == self._signatures[filepath]:
+                continue
+            self._signatures[filepath] = signature
+            intact = calculate_hash(filepath) == self.baseline[filepath]
+            self._record(filepath, intact)
+
+        self._intact = not self._tampered
+        self._last_check_at = time.strftime("%Y-%m-%d %H:%M:%S")
+        return self._intact
+
+    def _record(self, filepath: str, intact: bool) -> None:
+        """Alerts only on a change of state."""
+        if not intact and filepath not in self._tampered:
+            self._tampered.add(filepath)
+            log.warning("integrity.tampered", file=filepath)
+            if self.on_tamper:
+                self.on_tamper(filepath)
+        elif intact and filepath in self._tampered:
+            self._tampered.discard(filepath)
+            log.info("integrity.restored", file=filepath)
@@ -1,18 +1,19 @@
 # engine/intent_detector.py
 # Purpose: Hybrid intent detection — rule-based + ML + Tamil support
 
-import json
-import os
-import pickle
-from utils.text_cleaner import extract_keywords, clean_text
-from config import INTENTS_FILE, CONFIDENCE_THRESHOLD
+from utils.text_cleaner import clean_text
+from config import CONFIDENCE_THRESHOLD
+from engine.registry import get_registry
+from engine.keyword_index import KeywordIndex
+from engine.ml_classifier import score_intent, score_intents
+from engine.metrics import stage
+from engine.event_log import get_logger
 from engine.language_detector import (
-    detect_tamil_intent,
-    translate_tanglish,
-    detect_language
+    scan_text,
+    translate_tanglish
 )
 
-MODEL_PATH = os.path.join("engine", "aram_model.pkl")
+log = get_logger("intent_detector")
 
 GREETING_WORDS = [
     "hello", "hi", "hey", "hai", "hii", "helo",
@@ -24,129 +25,100 @@ GREETING_WORDS = [
 
 
 def load_intents() -> dict:
-    """Loads intents.json as lookup dictionary."""
-    with open(INTENTS_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return {
-        intent["intent_id"]: intent
-        for intent in data["intents"]
-    }
+    """Returns the shared intent lookup dictionary."""
+    return get_registry().intents_lookup
 
 
 def load_intents_list() -> list:
-    """Loads intents.json as list."""
-    with open(INTENTS_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data["intents"]
+    """Returns the shared intent list."""
+    return get_registry().intents_list
 
 
 def load_ml_model():
-    """Loads trained ML model if available."""
-    if os.path.exists(MODEL_PATH):
-        with open(MODEL_PATH, "rb") as f:
-            return pickle.load(f)
-    return None
+    """Returns the shared ML model (None if not trained)."""
+    return get_registry().model
 
 
-def rule_based_detect(user_input: str, intents: list) -> tuple:
+def rule_based_detect(
+    user_input: str,
+    intents: list = None,
+    *,
+    index: KeywordIndex = None
+) -> tuple:
     """
     Rule-based detection using keyword matching.
+    Looks words up in an inverted keyword index: the one
+    passed in, one built from `intents`, or the registry's.
     Returns (intent, score).
     """
-    user_keywords = extract_keywords(user_input)
-    user_text = clean_text(user_input)
-    user_set = set(user_keywords)
-
-    if not user_set:
-        return None, 0.0
-
-    best_match = None
-    best_score = 0.0
-
-    for intent in intents:
-        intent_id = intent["intent_id"]
-        if intent_id in ["UNKNOWN001", "GREET001"]:
-            continue
-
-        keywords = intent.get("keywords", [])
-        if not keywords:
-            continue
-
-        intent_set = set(keywords)
-        direct_matches = user_set.intersection(intent_set)
-
-        phrase_matches = sum(
-            1 for kw in keywords
-            if len(kw.split()) > 1 and kw in user_text
-        )
-
-        total_matches = len(direct_matches) + phrase_matches
-
-        if total_matches == 0:
-            continue
-
-        score = total_matches / len(user_set)
-
-        if score > best_score:
-            best_score = score
-            best_match = intent
-
-    return best_match, best_score
-
-
-def ml_based_detect(user_input: str, intents_lookup: dict) -> tuple:
+    if index is None:
+        registry = get_registry()
+        if intents is None or intents is registry.intents_list:
+            index = registry.keyword_index
+        else:
+            index = KeywordIndex(intents)
+    return index.score(user_input)
+
+
+def ml_based_detect(
+    user_input: str,
+    intents_lookup: dict,
+    model=None
+) -> tuple:
     """
     ML-based detection using trained classifier.
+    model defaults to the current registry's.
     Returns (intent, normalized_confidence).
     """
-    model = load_ml_model()
+    if model is None:
+        model = load_ml_model()
     if not model:
         return None, 0.0
 
     try:
-        predicted_id = model.predict([user_input])[0]
-        decision_scores = model.decision_function([user_input])[0]
-        classes = model.classes_
+        # One pipeline run for prediction + scores
+        result = score_intent(user_input, model)
+    except Exception as e:
+        log.warning("ml.failed", error=str(e))
+        return None, 0.0
+    return ml_confidence(result, intents_lookup)
 
-        score_dict = dict(zip(classes, decision_scores))
-        confidence = score_dict.get(predicted_id, 0)
 
-        if confidence < 0.3:
-            return None, 0.0
+def ml_confidence(result, intents_lookup: dict) -> tuple:
+    """
+    Turns one MLScore into (intent, normalized_confidence).
+    Rejects weak or all-negative scores.
+    """
+    predicted_id = result.predicted_id
+    confidence = result.raw
 
-        positive_scores = [s for s in decision_scores if s > 0]
-        if not positive_scores:
-            return None, 0.0
+    if confidence < 0.3:
+        return None, 0.0
 
-        max_score = max(positive_scores)
-        normalized = confidence / max_score if max_score > 0 else 0.0
+    positive_scores = result.scores[result.scores > 0]
+    if not positive_scores.size:
+        return None, 0.0
 
-        print(f"   [ML] Predicted: {predicted_id} | "
-              f"Raw: {confidence:.2f} | "
-              f"Normalized: {normalized:.2f}")
+    max_score = float(positive_scores.max())
+    normalized = confidence / max_score if max_score > 0 else 0.0
 
-        intent = intents_lookup.get(predicted_id)
-        return intent, normalized
+    log.debug(
+        "ml.predicted",
+        intent=predicted_id, raw=confidence, normalized=normalized
+    )
 
-    except Exception as e:
-        print(f"   [ML Warning] {e}")
-        return None, 0.0
+    intent = intents_lookup.get(predicted_id)
+    return intent, normalized
 
 
-def detect_intent(user_input: str) -> dict:
+def _detect_without_ml(user_input: str, scan, registry) -> tuple:
     """
-    Main hybrid detection function.
-
-    Priority order:
-    1. Greeting check
-    2. Tamil/Tanglish keyword detection
-    3. Rule-based detection
-    4. ML-based detection
-    5. Combined hybrid
-    6. Unknown fallback
+    Priorities 1-3 of detect_intent.
+    Returns (intent, path, None) when decided, otherwise
+    (None, None, (ml_text, rule_intent, rule_score)) —
+    the input still needs an ML score.
     """
-    intents_list   = load_intents_list()
-    intents_lookup = load_intents()
+    intents_lookup = registry.intents_lookup
     user_lower     = clean_text(user_input)
 
     # ── Priority 1: Greeting check ───────────────────
@@ -154,85 +126,216 @@ def detect_intent(user_input: str) -> dict:
     if len(user_words) <= 3:
         for word in GREETING_WORDS:
             if word in user_lower:
-                return intents_lookup.get("GREET001", {})
+                return intents_lookup.get("GREET001", {}), "greeting", None
     else:
         if user_lower in GREETING_WORDS:
-            return intents_lookup.get("GREET001", {})
+            return intents_lookup.get("GREET001", {}), "greeting", None
 
     # ── Priority 2: Tamil/Tanglish detection ─────────
-    language = detect_language(user_input)
+    if scan is None:
+        scan = scan_text(user_input, registry)
+    language = scan.language
 
     if language == "tamil":
-        tamil_intent_id = detect_tamil_intent(user_input)
+        tamil_intent_id = scan.tamil_intent_id
         if tamil_intent_id:
-            print(f"   [Tamil] Matched: {tamil_intent_id}")
+            log.debug("tamil.matched", intent=tamil_intent_id)
             return intents_lookup.get(
                 tamil_intent_id,
                 intents_lookup.get("UNKNOWN001", {})
-            )
+            ), "tamil_keyword", None
 
     if language == "tanglish":
         converted = translate_tanglish(user_input)
-        tamil_intent_id = detect_tamil_intent(user_input)
+        tamil_intent_id = scan.tamil_intent_id
         if tamil_intent_id:
-            print(f"   [Tanglish] Matched: {tamil_intent_id}")
+            log.debug("tanglish.matched", intent=tamil_intent_id)
             return intents_lookup.get(
                 tamil_intent_id,
                 intents_lookup.get("UNKNOWN001", {})
-            )
+            ), "tanglish_keyword", None
         # Use converted text for further detection
         user_input = converted
-        user_lower = clean_text(converted)
 
     # ── Priority 3: Rule-based detection ────────────
-    rule_intent, rule_score = rule_based_detect(
-        user_input, intents_list
-    )
+    with stage("rule"):
+        rule_intent, rule_score = rule_based_detect(
+            user_input, index=registry.keyword_index
+        )
 
     if rule_score >= 0.5:
-        print(f"   [Rule] Strong: "
-              f"{rule_intent.get('intent_id')} "
-              f"({rule_score:.2f})")
-        return rule_intent
+        log.debug(
+            "rule.strong",
+            intent=rule_intent.get("intent_id"), score=rule_score
+        )
+        return rule_intent, "rule_strong", None
 
-    # ── Priority 4: ML-based detection ──────────────
-    ml_intent, ml_confidence = ml_based_detect(
-        user_input, intents_lookup
-    )
+    return None, None, (user_input, rule_intent, rule_score)
+
+
+def _decide_with_ml(
+    rule_intent,
+    rule_score: float,
+    ml_intent,
+    ml_confidence: float,
+    intents_lookup
+) -> tuple:
+    """
+    Priorities 4-6 of detect_intent, given the ML result.
+    Returns (intent, path).
+    """
 
+    # ── Priority 4: ML-based detection ──────────────
     if ml_confidence >= 0.75:
-        print(f"   [ML] Strong: "
-              f"{ml_intent.get('intent_id')} "
-              f"({ml_confidence:.2f})")
-        return ml_intent
+        log.debug(
+            "ml.strong",
+            intent=ml_intent.get("intent_id"), confidence=ml_confidence
+        )
+        return ml_intent, "ml_strong"
 
     # ── Priority 5: Hybrid combined ──────────────────
     if rule_intent and ml_intent and rule_score >= 0.15:
         if rule_intent.get("intent_id") == ml_intent.get("intent_id"):
-            print(f"   [Hybrid] Both agree: "
-                  f"{rule_intent.get('intent_id')}")
-            return rule_intent
+            log.debug("hybrid.agree", intent=rule_intent.get("intent_id"))
+            return rule_intent, "hybrid_agree"
 
         if rule_score >= 0.2:
-            print(f"   [Hybrid] Rule wins: "
-                  f"{rule_intent.get('intent_id')}")
-            return rule_intent
+            log.debug("hybrid.rule", intent=rule_intent.get("intent_id"))
+            return rule_intent, "hybrid_rule"
 
         if ml_confidence >= 0.6:
-            print(f"   [Hybrid] ML wins: "
-                  f"{ml_intent.get('intent_id')}")
-            return ml_intent
+            log.debug("hybrid.ml", intent=ml_intent.get("intent_id"))
+            return ml_intent, "hybrid_ml"
 
     # ── Priority 6: Weak rule match ──────────────────
     if rule_intent and rule_score >= CONFIDENCE_THRESHOLD:
-        print(f"   [Rule] Weak: "
-              f"{rule_intent.get('intent_id')} "
-              f"({rule_score:.2f})")
-        return rule_intent
+        log.debug(
+            "rule.weak",
+            intent=rule_intent.get("intent_id"), score=rule_score
+        )
+        return rule_intent, "rule_weak"
 
     # ── Fallback: Unknown ────────────────────────────
-    print("   [Fallback] No confident match")
-    return intents_lookup.get("UNKNOWN001", {})
+    log.debug("fallback")
+    return intents_lookup.get("UNKNOWN001", {}), "fallback"
+
+
+def detect_intent(user_input: str, scan=None, registry=None) -> dict:
+    """
+    Main hybrid detection function.
+    Pass the caller's scan_text() result as scan to skip
+    re-scanning the same message, and the request's
+    registry so a hot reload never changes data mid-request.
+
+    Priority order:
+    1. Greeting check
+    2. Tamil/Tanglish keyword detection
+    3. Rule-based detection
+    4. ML-based detection
+    5. Combined hybrid
+    6. Unknown fallback
+    """
+    return detect_intent_traced(user_input, scan, registry)[0]
+
+
+def detect_intent_traced(
+    user_input: str,
+    scan=None,
+    registry=None
+) -> tuple:
+    """
+    detect_intent that also reports the decision path:
+    greeting, tamil_keyword, tanglish_keyword, rule_strong,
+    ml_strong, hybrid_agree, hybrid_rule, hybrid_ml,
+    rule_weak or fallback. Returns (intent, path).
+    """
+    if registry is None:
+        registry = get_registry()
+    intent, path, pending = _detect_without_ml(user_input, scan, registry)
+    if pending is None:
+        return intent, path
+
+    ml_text, rule_intent, rule_score = pending
+    ml_intent, ml_confidence = None, 0.0
+    if registry.model is not None:
+        with stage("ml"):
+            ml_intent, ml_confidence = ml_based_detect(
+                ml_text, registry.intents_lookup, registry.model
+            )
+    return _decide_with_ml(
+        rule_intent, rule_score,
+        ml_intent, ml_confidence,
+        registry.intents_lookup
+    )
+
+
+def detect_intents(
+    user_inputs: list,
+    scans: list = None,
+    registry=None
+) -> list:
+    """
+    detect_intent for many messages at once — same result
+    per message. Inputs that reach the ML stage are scored
+    together with ONE decision_function call.
+    """
+    return [
+        intent for intent, _
+        in detect_intents_traced(user_inputs, scans, registry)
+    ]
+
+
+def detect_intents_traced(
+    user_inputs: list,
+    scans: list = None,
+    registry=None
+) -> list:
+    """detect_intents with decision paths: [(intent, path), ...]"""
+    if registry is None:
+        registry = get_registry()
+    intents_lookup = registry.intents_lookup
+    if scans is None:
+        scans = [None] * len(user_inputs)
+
+    results = [None] * len(user_inputs)
+    pending = []
+    for position, (user_input, scan) in enumerate(zip(user_inputs, scans)):
+        intent, path, needs_ml = _detect_without_ml(
+            user_input, scan, registry
+        )
+        if needs_ml is None:
+            results[position] = (intent, path)
+        else:
+            pending.append((position, needs_ml))
+
+    if not pending:
+        return results
+
+    ml_results = [(None, 0.0)] * len(pending)
+    if registry.model is not None:
+        try:
+            with stage("ml_batch"):
+                scores = score_intents(
+                    [needs_ml[0] for _, needs_ml in pending],
+                    registry.model
+                )
+            ml_results = [
+                ml_confidence(result, intents_lookup)
+                for result in scores
+            ]
+        except Exception as e:
+            log.warning("ml.failed", error=str(e), batch=len(pending))
+
+    for (position, needs_ml), (ml_intent, confidence) in zip(
+        pending, ml_results
+    ):
+        _, rule_intent, rule_score = needs_ml
+        results[position] = _decide_with_ml(
+            rule_intent, rule_score,
+            ml_intent, confidence,
+            intents_lookup
+        )
+    return results
 
 
 if __name__ == "__main__":
@@ -0,0 +1,22 @@
+# engine/jsonl_file.py
+# Purpose: Append JSON Lines safely from several processes
+
+import json
+import os
+
+
+def append_jsonl(path: str, entries: list, default=None) -> None:
+    """
+    One O_APPEND write for all entries — lines from several
+    gunicorn workers never interleave mid-line. default is
+    passed to json.dumps (e.g. str for datetimes).
+    """
+    data = "".join(
+        json.dumps(entry, ensure_ascii=False, default=default) + "\n"
+        for entry in entries
+    ).encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
@@ -0,0 +1,98 @@
+# engine/keyword_index.py
+# Purpose: Inverted keyword index for rule-based detection
+# Built once from intents.json — scoring cost grows with
+# the query length, not with the number of intents
+
+from collections import defaultdict
+from utils.text_cleaner import clean_text
+
+# Intents the rule scorer never returns
+SKIP_INTENTS = ("UNKNOWN001", "GREET001")
+
+
+class KeywordIndex:
+    """
+    token  → intents having that exact single keyword
+    word   → multi-word keywords starting with that word
+
+    Each intent is referred to by its position in
+    intents.json, so ties still go to the earlier intent.
+    """
+
+    def __init__(self, intents):
+        self.intents = []
+        token_index = defaultdict(set)
+        phrase_index = defaultdict(list)
+        serial = 0
+
+        for intent in intents:
+            if intent["intent_id"] in SKIP_INTENTS:
+                continue
+            keywords = intent.get("keywords", [])
+            if not keywords:
+                continue
+
+            position = len(self.intents)
+            self.intents.append(intent)
+
+            for kw in keywords:
+                words = kw.split()
+                if len(words) > 1:
+                    # Duplicates kept: each listed phrase scores,
+                    # so every entry gets its own serial number
+                    phrase_index[words[0]].append(
+                        (kw, position, serial)
+                    )
+                    serial += 1
+                else:
+                    token_index[kw].add(position)
+
+        self.token_index = {
+            token: tuple(sorted(positions))
+            for token, positions in token_index.items()
+        }
+        self.phrase_index = {
+            word: tuple(phrases)
+            for word, phrases in phrase_index.items()
+        }
+
+    def score(self, user_input: str) -> tuple:
+        """
+        Returns (best_intent, score) — score is matched
+        keywords divided by distinct words in the query.
+        """
+        user_text = clean_text(user_input)
+        if not user_text:
+            return None, 0.0
+
+        tokens = user_text.split(" ")
+        user_set = set(tokens)
+        counts = defaultdict(int)
+
+        # Single keywords — one hit per distinct query word
+        for token in user_set:
+            for position in self.token_index.get(token, ()):
+                counts[position] += 1
+
+        # Multi-word keywords — only those starting at a word
+        # of the query; each listed phrase counts once
+        matched_phrases = set()
+        offset = 0
+        for token in tokens:
+            for entry in self.phrase_index.get(token, ()):
+                if (entry not in matched_phrases
+                        and user_text.startswith(entry[0], offset)):
+                    matched_phrases.add(entry)
+                    counts[entry[1]] += 1
+            offset += len(token) + 1
+
+        if not counts:
+            return None, 0.0
+
+        best_position = min(
+            counts, key=lambda position: (-counts[position], position)
+        )
+        return (
+            self.intents[best_position],
+            counts[best_position] / len(user_set)
+        )
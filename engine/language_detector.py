@@ -4,16 +4,15 @@
 #          Offensive words, Irrelevant queries
 
 import re
-import json
 import random
-import os
+from collections import namedtuple
+from engine.pattern_matcher import PatternMatcher, LongestMatchTranslator
+from engine.registry import get_registry
+from utils.text_cleaner import normalize_for_matching
 
 # ── Tamil Unicode Pattern ─────────────────────────────────
 TAMIL_UNICODE_PATTERN = re.compile(r'[\u0B80-\u0BFF]')
 
-BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-TAMIL_INTENTS_FILE = os.path.join(BASE_DIR, "data", "tamil_intents.json")
-
 
 # ── Offensive Words ───────────────────────────────────────
 OFFENSIVE_WORDS = [
@@ -644,36 +643,104 @@ TANGLISH_KEYWORD_MAP = {
 
 
 def load_tamil_intents() -> list:
-    """Loads tamil_intents.json for keyword matching."""
-    try:
-        with open(TAMIL_INTENTS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return data.get("tamil_intents", [])
-    except Exception:
-        return []
+    """Returns the shared tamil_intents.json keyword list."""
+    return get_registry().tamil_intents
+
+
+# ── Single-Pass Text Scanner ──────────────────────────────
+# Every gate below is a plain substring check over a word
+# list. Instead of one Python loop per list, all lists are
+# compiled into ONE automaton and scanned once per message.
+
+TextScan = namedtuple("TextScan", [
+    "offensive",        # any OFFENSIVE_WORDS entry found
+    "general",          # GENERAL_PATTERNS type, first in dict order
+    "irrelevant",       # any IRRELEVANT_TOPICS entry found
+    "language",         # tamil / tanglish / english
+    "tamil_intent_id"   # first tamil_intents.json intent matched
+])
+
+# (registry version, matcher) — Tamil keywords hot-reload
+_text_matcher = (None, None)
+
+
+def build_text_matcher(tamil_keyword_table) -> PatternMatcher:
+    """
+    Compiles every gate word list into one automaton.
+    Patterns are NFC-normalised like the scanned text.
+    """
+    matcher = PatternMatcher()
+    for word in OFFENSIVE_WORDS:
+        matcher.add(normalize_for_matching(word), ("offensive", 0, True))
+    for topic in IRRELEVANT_TOPICS:
+        matcher.add(normalize_for_matching(topic), ("irrelevant", 0, True))
+    for order, (phrase, conv_type) in enumerate(GENERAL_PATTERNS.items()):
+        matcher.add(
+            normalize_for_matching(phrase),
+            ("general", order, conv_type)
+        )
+    for word in TANGLISH_KEYWORD_MAP:
+        matcher.add(normalize_for_matching(word), ("tanglish", 0, True))
+    for order, (intent_id, keywords) in enumerate(tamil_keyword_table):
+        for keyword in keywords:
+            matcher.add(keyword, ("tamil_intent", order, intent_id))
+    return matcher.build()
+
+
+def get_text_matcher(registry=None) -> PatternMatcher:
+    """Returns the automaton for the current registry version."""
+    global _text_matcher
+    if registry is None:
+        registry = get_registry()
+    version, matcher = _text_matcher
+    if version != registry.version:
+        matcher = build_text_matcher(registry.tamil_keyword_table)
+        _text_matcher = (registry.version, matcher)
+    return matcher
+
+
+def scan_text(text: str, registry=None) -> TextScan:
+    """
+    Runs every gate check in a single pass over the text.
+    Where a gate returns the FIRST match of its list, the
+    match with the lowest list position wins.
+    """
+    first = {}
+    for category, order, value in get_text_matcher(registry).scan(
+        normalize_for_matching(text)
+    ):
+        if category not in first or order < first[category][0]:
+            first[category] = (order, value)
+
+    if TAMIL_UNICODE_PATTERN.search(text):
+        language = "tamil"
+    elif "tanglish" in first:
+        language = "tanglish"
+    else:
+        language = "english"
+
+    return TextScan(
+        offensive="offensive" in first,
+        general=first.get("general", (0, None))[1],
+        irrelevant="irrelevant" in first,
+        language=language,
+        tamil_intent_id=first.get("tamil_intent", (0, None))[1]
+    )
 
 
 def detect_language(text: str) -> str:
     """Detects: tamil, tanglish, or english."""
-    if TAMIL_UNICODE_PATTERN.search(text):
-        return "tamil"
-    text_lower = text.lower()
-    for word in TANGLISH_KEYWORD_MAP:
-        if word in text_lower:
-            return "tanglish"
-    return "english"
+    return scan_text(text).language
 
 
 def is_offensive(text: str) -> bool:
     """Returns True if text contains offensive words."""
-    text_lower = text.lower()
-    return any(word in text_lower for word in OFFENSIVE_WORDS)
+    return scan_text(text).offensive
 
 
 def is_irrelevant(text: str) -> bool:
     """Returns True if text is clearly off-topic."""
-    text_lower = text.lower()
-    return any(topic in text_lower for topic in IRRELEVANT_TOPICS)
+    return scan_text(text).irrelevant
 
 
 def is_general_conversation(text: str) -> str | None:
@@ -681,12 +748,7 @@ def is_general_conversation(text: str) -> str | None:
     Checks all general conversation patterns.
     Returns conversation type key or None.
     """
-    text_lower = text.lower().strip()
-    # Check exact and partial matches
-    for phrase, conv_type in GENERAL_PATTERNS.items():
-        if phrase in text_lower:
-            return conv_type
-    return None
+    return scan_text(text.strip()).general
 
 
 def get_general_response(conv_type: str) -> str:
@@ -707,12 +769,16 @@ def get_irrelevant_response() -> str:
     return random.choice(IRRELEVANT_RESPONSES)
 
 
+_TANGLISH_TRANSLATOR = LongestMatchTranslator(TANGLISH_KEYWORD_MAP)
+
+
 def translate_tanglish(text: str) -> str:
-    """Converts Tanglish keywords to English."""
-    text_lower = text.lower()
-    for tanglish, english in TANGLISH_KEYWORD_MAP.items():
-        text_lower = text_lower.replace(tanglish, english)
-    return text_lower
+    """
+    Converts Tanglish keywords to English.
+    Single pass, longest keyword first — "hack aana"
+    becomes "hacked", not "hacked aana".
+    """
+    return _TANGLISH_TRANSLATOR.translate(text.lower())
 
 
 def detect_tamil_intent(text: str) -> str | None:
@@ -720,18 +786,7 @@ def detect_tamil_intent(text: str) -> str | None:
     Detects intent from Tamil/Tanglish keywords.
     Returns intent_id or None.
     """
-    tamil_intents = load_tamil_intents()
-    text_lower = text.lower()
-
-    for intent in tamil_intents:
-        all_keywords = (
-            intent.get("tamil_keywords", []) +
-            intent.get("tanglish_keywords", [])
-        )
-        for keyword in all_keywords:
-            if keyword.lower() in text_lower:
-                return intent["intent_id"]
-    return None
+    return scan_text(text).tamil_intent_id
 
 
 def get_tamil_response(intent_id: str) -> str:
@@ -0,0 +1,169 @@
+# engine/linear_scorer.py
+# Purpose: Serve the trained TF-IDF + LinearSVC model with
+#          NumPy only — no scikit-learn / SciPy at runtime
+# model_trainer exports the fitted numbers to aram_model.npz
+
+import io
+import json
+import math
+import re
+import numpy as np
+
+# Format of the exported artifact — bump on layout changes
+NPZ_FORMAT = 1
+
+
+def export_linear_model(pipeline, path: str) -> None:
+    """
+    Writes the fitted vocabulary, idf, coefficients and
+    intercepts of a TfidfVectorizer + LinearSVC pipeline
+    to a .npz file (written to a temp file, then renamed).
+    """
+    import os
+
+    vectorizer = pipeline.named_steps["tfidf"]
+    classifier = pipeline.named_steps["classifier"]
+
+    # Column order of the vocabulary = column order of coef_
+    terms = [None] * len(vectorizer.vocabulary_)
+    for term, column in vectorizer.vocabulary_.items():
+        terms[column] = term
+
+    config = {
+        "format": NPZ_FORMAT,
+        "lowercase": vectorizer.lowercase,
+        "token_pattern": vectorizer.token_pattern,
+        "ngram_range": list(vectorizer.ngram_range),
+        "sublinear_tf": vectorizer.sublinear_tf,
+        "norm": vectorizer.norm
+    }
+
+    buffer = io.BytesIO()
+    np.savez_compressed(
+        buffer,
+        vocabulary=np.array(terms, dtype=str),
+        idf=vectorizer.idf_.astype(np.float32),
+        coef=classifier.coef_.astype(np.float32),
+        intercept=classifier.intercept_.astype(np.float32),
+        classes=np.array(classifier.classes_, dtype=str),
+        config=np.array(json.dumps(config))
+    )
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(buffer.getvalue())
+    os.replace(tmp_path, path)
+
+
+class LinearScorer:
+    """
+    Drop-in for the pickled pipeline where serving needs
+    it: classes_ and decision_function(texts).
+
+    Reproduces TfidfVectorizer (word n-grams, sublinear tf,
+    idf, L2 norm) followed by coef · x + intercept.
+    Scores match scikit-learn to float32 precision.
+    """
+
+    def __init__(self, vocabulary, idf, coef, intercept, classes, config):
+        if config.get("format") != NPZ_FORMAT:
+            raise ValueError(
+                f"Unsupported model format: {config.get('format')}"
+            )
+        self.vocabulary = {
+            term: column for column, term in enumerate(vocabulary.tolist())
+        }
+        self.idf = idf.astype(np.float64)
+        # Transposed once: a query is a few columns of
+        # coef_T, so scoring is a small gather + sum
+        self.coef_T = np.ascontiguousarray(coef.T, dtype=np.float64)
+        self.intercept = intercept.astype(np.float64)
+        self.classes_ = classes
+
+        self.lowercase = config["lowercase"]
+        self.token_re = re.compile(config["token_pattern"])
+        self.min_n, self.max_n = config["ngram_range"]
+        self.sublinear_tf = config["sublinear_tf"]
+        self.norm = config["norm"]
+
+    @classmethod
+    def from_bytes(cls, blob: bytes) -> "LinearScorer":
+        """Loads an exported .npz (no pickles allowed)."""
+        with np.load(io.BytesIO(blob), allow_pickle=False) as data:
+            return cls(
+                data["vocabulary"],
+                data["idf"],
+                data["coef"],
+                data["intercept"],
+                data["classes"],
+                json.loads(str(data["config"]))
+            )
+
+    # ── Vectorizer ────────────────────────────────────
+    def _ngrams(self, text: str) -> list:
+        """Same n-grams as TfidfVectorizer's word analyzer."""
+        if self.lowercase:
+            text = text.lower()
+        tokens = self.token_re.findall(text)
+        grams = []
+        for n in range(self.min_n, min(self.max_n, len(tokens)) + 1):
+            for i in range(len(tokens) - n + 1):
+                grams.append(" ".join(tokens[i:i + n]))
+        return grams
+
+    def _features(self, text: str) -> tuple:
+        """Sparse TF-IDF row as (columns, weights)."""
+        counts = {}
+        vocabulary = self.vocabulary
+        for gram in self._ngrams(text):
+            column = vocabulary.get(gram)
+            if column is not None:
+                counts[column] = counts.get(column, 0) + 1
+
+        columns = np.fromiter(counts.keys(), dtype=np.intp, count=len(counts))
+        tf = np.fromiter(counts.values(), dtype=np.float64, count=len(counts))
+        if self.sublinear_tf:
+            tf = np.log(tf) + 1.0
+        weights = tf * self.idf[columns]
+
+        if self.norm == "l2":
+            length = math.sqrt(float(weights @ weights))
+            if length:
+                weights /= length
+        elif self.norm == "l1":
+            length = float(np.abs(weights).sum())
+            if length:
+                weights /= length
+        return columns, weights
+
+    # ── Classifier ────────────────────────────────────
+    def decision_function(self, texts) -> np.ndarray:
+        """
+        One row of per-class scores per text. A batch is
+        scored with a single gather + segmented sum over
+        the features of all texts.
+        """
+        rows = [self._features(text) for text in texts]
+        scores = np.tile(self.intercept, (len(rows), 1))
+        if not rows:
+            return scores
+
+        sizes = np.fromiter(
+            (len(columns) for columns, _ in rows),
+            dtype=np.intp, count=len(rows)
+        )
+        if not sizes.any():
+            return scores
+        columns = np.concatenate([columns for columns, _ in rows])
+        weights = np.concatenate([weights for _, weights in rows])
+
+        weighted = self.coef_T[columns] * weights[:, None]
+        # Texts without known n-grams have no segment and
+        # keep the intercept only
+        non_empty = sizes > 0
+        starts = (np.cumsum(sizes) - sizes)[non_empty]
+        scores[non_empty] += np.add.reduceat(weighted, starts, axis=0)
+        return scores
+
+    def predict(self, texts) -> np.ndarray:
+        return self.classes_[self.decision_function(texts).argmax(axis=1)]
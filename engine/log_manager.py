@@ -1,105 +1,269 @@
  #engine/log_manager.py
 # Purpose: Save logs to BOTH MongoDB and local JSON
 # MongoDB = permanent cloud storage
-# Local JSON = backup fallback
+# Local JSONL = backup fallback
+# Local log is append-only JSON Lines, written in batches
+# by a background thread — never rewritten per request
 
+import atexit
+import glob
 import json
 import os
 from datetime import datetime
+from config import (
+    LOG_QUEUE_SIZE,
+    LOG_BATCH_SIZE,
+    LOG_FLUSH_INTERVAL,
+    LOG_MAX_BYTES,
+    LOG_ROTATE_DAILY,
+    LOG_STATS_REFRESH_INTERVAL,
+    LOG_STATS_SNAPSHOT_INTERVAL
+)
+from engine.batch_writer import BatchWriter
+from engine.event_log import get_logger
+from engine.jsonl_file import append_jsonl
+from engine.log_stats import LogStats
 
-LOGS_FILE = os.path.join("logs", "conversations.json")
+log = get_logger("log_manager")
+
+LOGS_DIR = os.getenv("ARAM_LOGS_DIR", "logs")
+LOGS_FILE = os.path.join(LOGS_DIR, "conversations.jsonl")
+
+# Old format: one JSON array rewritten on every request
+LEGACY_LOGS_FILE = os.path.join(LOGS_DIR, "conversations.json")
+# Sorts before every dated archive, so it reads first
+LEGACY_ARCHIVE = os.path.join(
+    LOGS_DIR, "conversations-00000000-legacy.jsonl"
+)
+STATS_SNAPSHOT_FILE = os.path.join(LOGS_DIR, "stats_snapshot.json")
 
 
 def save_log(
     user_input: str,
     intent: str,
-    response: str
+    response: str,
+    language: str = None
 ):
     """
     Save to MongoDB first.
-    Always save to local JSON as backup.
+    Always save to local JSONL as backup.
     """
     # Try MongoDB first
     try:
         from engine.mongo_logger import save_to_mongo
-        save_to_mongo(user_input, intent, response)
+        save_to_mongo(user_input, intent, response, language)
     except Exception as e:
-        print(f"⚠️  Mongo log failed: {e}")
+        log.warning("mongo.log_failed", error=str(e))
 
     # Always save locally as backup
-    _save_local(user_input, intent, response)
+    _save_local(user_input, intent, response, language)
 
 
 def _save_local(
     user_input: str,
     intent: str,
-    response: str
+    response: str,
+    language: str = None
 ):
-    """Save conversation to local JSON file."""
+    """Queue conversation for the local JSONL writer."""
+    _local_writer.submit({
+        "timestamp": datetime.now().strftime(
+            "%Y-%m-%d %H:%M:%S"
+        ),
+        "user_input": user_input,
+        "detected_intent": intent,
+        "language": language,
+        "response_given": response[:100],
+        "feedback": None
+    })
+
+
+# ── Local JSONL writer ────────────────────────────────
+
+def _migrate_legacy():
+    """
+    One-time move of logs/conversations.json (JSON array)
+    into a JSONL archive. The rename makes sure only one
+    worker migrates; the original is kept as .migrated.
+    """
+    if not os.path.exists(LEGACY_LOGS_FILE):
+        return
+    claimed = LEGACY_LOGS_FILE + ".migrating"
     try:
-        os.makedirs("logs", exist_ok=True)
-
-        # Load existing logs
-        logs = []
-        if os.path.exists(LOGS_FILE):
-            try:
-                with open(LOGS_FILE, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                if isinstance(data, list):
-                    logs = data
-                elif isinstance(data, dict):
-                    for key in ["conversations", "logs", "data"]:
-                        if key in data:
-                            logs = data[key]
-                            break
-            except Exception:
-                logs = []
-
-        # Add new entry
-        logs.append({
-            "timestamp": datetime.now().strftime(
-                "%Y-%m-%d %H:%M:%S"
-            ),
-            "user_input": user_input,
-            "detected_intent": intent,
-            "response_given": response[:100],
-            "feedback": None
-        })
-
-        # Save back
-        with open(LOGS_FILE, "w", encoding="utf-8") as f:
-            json.dump(logs, f, ensure_ascii=False, indent=2)
+        os.rename(LEGACY_LOGS_FILE, claimed)
+    except OSError:
+        return   # another worker got there first
 
+    try:
+        with open(claimed, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        logs = _unwrap_legacy(data)
+        if logs:
+            append_jsonl(LEGACY_ARCHIVE, logs)
+        os.rename(claimed, LEGACY_LOGS_FILE + ".migrated")
+        log.info(
+            "log.legacy_migrated", entries=len(logs), archive=LEGACY_ARCHIVE
+        )
     except Exception as e:
-        print(f"⚠️  Local log failed: {e}")
+        log.error("log.legacy_migration_failed", error=str(e))
+
+
+def _unwrap_legacy(data) -> list:
+    """Handles both legacy formats — plain list or wrapped object."""
+    if isinstance(data, list):
+        return data
+    if isinstance(data, dict):
+        for key in ["conversations", "logs", "data"]:
+            if key in data:
+                return data[key]
+    return []
+
+
+def _rotate_if_needed():
+    """
+    Rotates conversations.jsonl when it grows past
+    LOG_MAX_BYTES, or on the first write of a new day.
+    """
+    try:
+        st = os.stat(LOGS_FILE)
+    except OSError:
+        return
+
+    last_write = datetime.fromtimestamp(st.st_mtime)
+    too_big = st.st_size >= LOG_MAX_BYTES
+    new_day = (
+        LOG_ROTATE_DAILY
+        and last_write.date() != datetime.now().date()
+    )
+    if not (too_big or new_day):
+        return
+
+    archive = os.path.join(
+        LOGS_DIR,
+        f"conversations-{last_write:%Y%m%d-%H%M%S}-{os.getpid()}.jsonl"
+    )
+    try:
+        os.rename(LOGS_FILE, archive)
+    except OSError:
+        pass   # another worker rotated it already
+
+
+def _write_local_batch(entries: list):
+    """Writer-thread flush: migrate, rotate, append, count."""
+    os.makedirs(LOGS_DIR, exist_ok=True)
+    _migrate_legacy()
+    _rotate_if_needed()
+    append_jsonl(LOGS_FILE, entries)
+    log_stats.refresh()
+
+
+def _stats_files() -> list:
+    """Local logs for the stats — migrates a legacy array first."""
+    _migrate_legacy()
+    return local_log_files()
+
+
+def _mongo_seed():
+    """
+    MongoDB totals for the stats — they survive a wiped
+    local disk. None until MongoDB is connected.
+    """
+    from engine.mongo_logger import get_mongo_counts, is_connected
+    if not is_connected():
+        return None
+    return get_mongo_counts()
+
+
+log_stats = LogStats(
+    _stats_files,
+    LOGS_FILE,
+    STATS_SNAPSHOT_FILE,
+    refresh_interval=LOG_STATS_REFRESH_INTERVAL,
+    snapshot_interval=LOG_STATS_SNAPSHOT_INTERVAL,
+    seed=_mongo_seed
+)
+# Registered before the writer's close(), so it runs after
+# the final flush (atexit is last-in, first-out)
+atexit.register(log_stats.save_snapshot)
+
+_local_writer = BatchWriter(
+    _write_local_batch,
+    name="local-log-writer",
+    max_queue=LOG_QUEUE_SIZE,
+    batch_size=LOG_BATCH_SIZE,
+    flush_interval=LOG_FLUSH_INTERVAL
+)
+
+
+def start_writers() -> None:
+    """Starts the local + MongoDB log writer threads now."""
+    from engine.mongo_logger import start_writer as start_mongo_writer
+    _local_writer.ensure_running()
+    start_mongo_writer()
+
+
+# ── Reading ───────────────────────────────────────────
+def local_log_files() -> list:
+    """Rotated archives oldest first, then the live file."""
+    archives = sorted(
+        glob.glob(os.path.join(LOGS_DIR, "conversations-*.jsonl"))
+    )
+    if os.path.exists(LOGS_FILE):
+        archives.append(LOGS_FILE)
+    return archives
+
+
+def read_local_logs():
+    """
+    Yields every local log entry, oldest first.
+    Includes a legacy conversations.json not yet migrated.
+    """
+    if os.path.exists(LEGACY_LOGS_FILE):
+        try:
+            with open(LEGACY_LOGS_FILE, "r", encoding="utf-8") as f:
+                yield from _unwrap_legacy(json.load(f))
+        except Exception:
+            pass
+
+    for path in local_log_files():
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue   # torn line from a crash
 
 
 def get_log_summary() -> dict:
-    """Returns summary — prefers MongoDB, falls back to local."""
+    """
+    Returns summary from the in-memory counters — MongoDB
+    is aggregated once to seed them, the local log is
+    never re-read in full.
+    """
+    summary = {}
+    try:
+        summary.update(log_stats.summary())
+    except Exception as e:
+        log.error("log_stats.unavailable", error=str(e))
+        summary["total"] = 0
+    summary["source"] = (
+        "MongoDB Atlas + Local JSONL" if log_stats.seeded
+        else "Local JSONL"
+    )
+
     try:
         from engine.mongo_logger import (
-            get_mongo_stats,
+            get_queue_stats,
             is_connected
         )
-        if is_connected():
-            return {
-                "source": "MongoDB Atlas",
-                "stats": get_mongo_stats()
-            }
-    except Exception:
-        pass
-
-    # Fallback to local
-    try:
-        if os.path.exists(LOGS_FILE):
-            with open(LOGS_FILE, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            logs = data if isinstance(data, list) else []
-            return {
-                "source": "Local JSON",
-                "total": len(logs)
-            }
+        summary["mongodb"] = {
+            "connected": is_connected(),
+            "queue": get_queue_stats()
+        }
     except Exception:
         pass
 
-    return {"source": "none", "total": 0}
\ No newline at end of file
+    return summary
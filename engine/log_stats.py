@@ -0,0 +1,233 @@
+# engine/log_stats.py
+# Purpose: Conversation statistics for /logs/summary
+# Kept in memory and updated incrementally — the summary
+# never re-reads or re-aggregates the whole log
+
+import json
+import os
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from engine.event_log import get_logger
+
+log = get_logger("log_stats")
+
+
+def _file_key(st: os.stat_result) -> str:
+    """
+    Identity of a log file that survives rotation —
+    a renamed archive keeps its inode, so it is not
+    counted twice under its new name.
+    """
+    return f"{st.st_dev}:{st.st_ino}"
+
+
+class LogStats:
+    """
+    Counters over the local JSONL conversation log:
+    total, per day, per intent and per language.
+
+    Counting follows the log files rather than single
+    calls, so with several gunicorn workers every worker
+    sees everyone's conversations. For each file only the
+    bytes after the last counted line are read.
+
+    Rotated archives never change, so one that has been
+    read to its last line is remembered and not opened
+    again — a refresh costs the live file plus any new
+    archive, however many archives pile up.
+
+    Counters plus file offsets are snapshotted to disk;
+    a restart loads the snapshot and reads only what was
+    written since. Without a snapshot (cold start) the
+    whole log is counted once.
+
+    The local disk may be wiped on deploy while MongoDB
+    keeps every conversation. When seed() returns counts
+    (MongoDB connected), they replace the local ones once:
+    every line logged locally so far is in MongoDB too.
+    The seeded flag is snapshotted with the counters.
+    """
+
+    def __init__(
+        self,
+        list_files,
+        live_path: str,
+        snapshot_path: str,
+        refresh_interval: float,
+        snapshot_interval: float,
+        seed=None
+    ):
+        self.list_files = list_files
+        self.live_path = live_path
+        self.snapshot_path = snapshot_path
+        self.refresh_interval = refresh_interval
+        self.snapshot_interval = snapshot_interval
+        self.seed = seed
+
+        self.total = 0
+        self.days = Counter()
+        self.intents = Counter()
+        self.languages = Counter()
+        self._offsets = {}          # file key → bytes counted
+        self._done = set()          # archives read to the end
+        self.seeded = False         # counters include MongoDB's
+
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._dirty = False
+        self._last_refresh = 0.0
+        self._last_snapshot = time.monotonic()
+
+    # ── Reading ───────────────────────────────────────
+    def summary(self) -> dict:
+        """Counters as served by /logs/summary."""
+        if time.monotonic() - self._last_refresh >= self.refresh_interval:
+            self.refresh()
+        today = datetime.now().strftime("%Y-%m-%d")
+        with self._lock:
+            return {
+                "total": self.total,
+                "today": self.days.get(today, 0),
+                "intents": dict(self.intents.most_common()),
+                "languages": dict(self.languages.most_common())
+            }
+
+    # ── Updating ──────────────────────────────────────
+    def refresh(self) -> None:
+        """
+        Counts lines appended since the last refresh.
+        Called by the log writer after every flush and,
+        time-gated, by summary().
+        """
+        with self._lock:
+            if not self._loaded:
+                self._load()
+            self._last_refresh = time.monotonic()
+
+            paths = self.list_files()
+            # Forget archives that were deleted
+            self._done.intersection_update(paths)
+            for path in paths:
+                if path in self._done:
+                    continue
+                try:
+                    self._count_tail(path)
+                except OSError:
+                    continue   # rotated away mid-scan
+
+            if not self.seeded and self.seed is not None:
+                self._apply_seed()
+
+            if (self._dirty and time.monotonic() - self._last_snapshot
+                    >= self.snapshot_interval):
+                self._save_snapshot()
+
+    def _count_tail(self, path: str) -> None:
+        with open(path, "rb") as f:
+            st = os.fstat(f.fileno())
+            key = _file_key(st)
+            offset = self._offsets.get(key, 0)
+            if offset > st.st_size:
+                offset = 0   # inode reused by a new file
+            f.seek(offset)
+            data = f.read()
+
+        # Only complete lines — a batch may still be
+        # half-written by another worker
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                self._record(json.loads(line))
+            except ValueError:
+                continue   # torn line from a crash
+
+        if path != self.live_path and end == len(data):
+            # Archive read to its last line — never opened again
+            self._done.add(path)
+            self._offsets.pop(key, None)
+        elif end:
+            self._offsets[key] = offset + end
+        else:
+            return
+        self._dirty = True
+
+    def _record(self, entry: dict) -> None:
+        self.total += 1
+        self.days[str(entry.get("timestamp", ""))[:10]] += 1
+        self.intents[entry.get("detected_intent") or "UNKNOWN"] += 1
+        self.languages[entry.get("language") or "unknown"] += 1
+
+    def _apply_seed(self) -> None:
+        counts = self.seed()
+        if counts is None:
+            return   # MongoDB not connected (yet)
+        self.total = counts["total"]
+        self.days = Counter(counts["days"])
+        self.intents = Counter(counts["intents"])
+        self.languages = Counter(counts["languages"])
+        self.seeded = True
+        self._dirty = True
+        log.info("log_stats.seeded", source="mongodb", total=self.total)
+
+    # ── Snapshots ─────────────────────────────────────
+    def _load(self) -> None:
+        """Starts from the last snapshot, if it is usable."""
+        self._loaded = True
+        try:
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snap = json.load(f)
+            total = snap["total"]
+            days = Counter(snap["days"])
+            intents = Counter(snap["intents"])
+            languages = Counter(snap["languages"])
+            offsets = dict(snap["offsets"])
+            done = set(snap.get("done", []))
+            seeded = bool(snap.get("seeded", False))
+        except FileNotFoundError:
+            log.info("log_stats.no_snapshot", action="count full log once")
+            return
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            log.warning(
+                "log_stats.snapshot_unusable",
+                action="count full log once", error=str(e)
+            )
+            return
+
+        self.total = total
+        self.days = days
+        self.intents = intents
+        self.languages = languages
+        self._offsets = offsets
+        self._done = done
+        self.seeded = seeded
+
+    def save_snapshot(self) -> None:
+        """Writes the snapshot now (also run at exit)."""
+        with self._lock:
+            if self._loaded and self._dirty:
+                self._save_snapshot()
+
+    def _save_snapshot(self) -> None:
+        snap = {
+            "saved_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "total": self.total,
+            "days": self.days,
+            "intents": self.intents,
+            "languages": self.languages,
+            "offsets": self._offsets,
+            "done": sorted(self._done),
+            "seeded": self.seeded
+        }
+        tmp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(snap, f, ensure_ascii=False)
+            os.replace(tmp_path, self.snapshot_path)
+            self._dirty = False
+            self._last_snapshot = time.monotonic()
+        except OSError as e:
+            log.error("log_stats.snapshot_failed", error=str(e))
@@ -1,12 +1,20 @@
 # engine/md_retriever.py
 # Purpose: Retrieve relevant law content from .md files
 # RAG-lite implementation
+# Law files are parsed ONCE into a heading index and
+# re-parsed only when their content hash changes
 
 import os
+import threading
+from config import RELOAD_CHECK_INTERVAL
+from engine.event_log import get_logger
+from engine.file_watch import FileWatcher, content_digest
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 LAWS_DIR = os.path.join(BASE_DIR, "laws")
 
+log = get_logger("md_retriever")
+
 INTENT_TO_LAW_FILE = {
     "CP001": "consumer_protection.md",
     "CP002": "consumer_protection.md",
@@ -62,52 +70,185 @@ def read_law_file(filename: str) -> str:
         return f.read()
 
 
+def parse_sections(content: str) -> dict:
+    """
+    Splits md content into {heading: text}.
+
+    ### sections run until the next ## / ### heading.
+    ## sections run until the next ## heading and keep
+    their ### children, e.g. "Where to File Complaint".
+    If a title is used at both levels, ### wins.
+    """
+    sub_sections = {}
+    top_sections = {}
+    sub_title = top_title = None
+    sub_lines, top_lines = [], []
+
+    def close_sub():
+        if sub_title is not None:
+            sub_sections.setdefault(
+                sub_title, "\n".join(sub_lines).strip()
+            )
+
+    def close_top():
+        if top_title is not None:
+            top_sections.setdefault(
+                top_title, "\n".join(top_lines).strip()
+            )
+
+    for line in content.split("\n"):
+        if line.startswith("###"):
+            close_sub()
+            sub_title, sub_lines = line.lstrip("#").strip(), []
+            if top_title is not None:
+                top_lines.append(line)
+            continue
+        if line.startswith("## ") or line.startswith("# "):
+            close_sub()
+            close_top()
+            sub_title, sub_lines = None, []
+            top_title, top_lines = None, []
+            if line.startswith("## "):
+                top_title = line[3:].strip()
+            continue
+        sub_lines.append(line)
+        top_lines.append(line)
+
+    close_sub()
+    close_top()
+    return {**top_sections, **sub_sections}
+
+
 def extract_section(content: str, section_name: str) -> str:
     """Extracts specific section from md content."""
-    lines = content.split("\n")
-    capturing = False
-    section_lines = []
+    return parse_sections(content).get(section_name, "")
 
-    for line in lines:
-        if f"### {section_name}" in line:
-            capturing = True
-            continue
-        if capturing:
-            if line.startswith("###") or line.startswith("## "):
-                break
-            section_lines.append(line)
 
-    return "\n".join(section_lines).strip()
+class LawIndex:
+    """
+    Parsed laws/*.md corpus.
+        sections     : file → heading → text
+        law_context  : intent_id → law section text
+        complaints   : intent_id → complaint channel text
+    """
 
+    def __init__(self, contents: dict, version: str):
+        self.version = version
+        self.sections = {
+            filename: parse_sections(content)
+            for filename, content in contents.items()
+        }
+        self.law_context = {}
+        self.complaints = {}
+        for intent_id, law_file in INTENT_TO_LAW_FILE.items():
+            headings = self.sections.get(law_file) if law_file else None
+            if not headings:
+                continue
+            self.law_context[intent_id] = headings.get(
+                INTENT_TO_SECTION.get(intent_id, ""), ""
+            )
+            self.complaints[intent_id] = headings.get(
+                COMPLAINT_SECTION_MAP.get(intent_id, ""), ""
+            )
 
-def get_law_context(intent_id: str) -> str:
-    """Returns relevant law context for a given intent."""
-    law_file = INTENT_TO_LAW_FILE.get(intent_id)
-    if not law_file:
-        return ""
-    content = read_law_file(law_file)
-    if not content:
-        return ""
-    section_name = INTENT_TO_SECTION.get(intent_id, "")
-    if section_name:
-        section = extract_section(content, section_name)
-        if section:
-            return section
-    return ""
+    def get_section(self, filename: str, heading: str) -> str:
+        """O(1) lookup of any ## / ### section by heading."""
+        return self.sections.get(filename, {}).get(heading, "")
+
+
+def _law_files() -> list:
+    """Names of all .md files in laws/."""
+    if not os.path.isdir(LAWS_DIR):
+        return []
+    return sorted(
+        name for name in os.listdir(LAWS_DIR)
+        if name.endswith(".md")
+    )
 
 
-def get_complaint_channels(intent_id: str) -> str:
+def build_law_index() -> LawIndex:
+    """Reads and parses every law file once."""
+    blobs = {}
+    for filename in _law_files():
+        with open(os.path.join(LAWS_DIR, filename), "rb") as f:
+            blobs[filename] = f.read()
+    version = content_digest(
+        name.encode("utf-8") + b"\0" + blob
+        for name, blob in blobs.items()
+    )[:12]
+    return LawIndex(
+        {name: blob.decode("utf-8") for name, blob in blobs.items()},
+        version
+    )
+
+
+_law_index = None
+_law_index_lock = threading.Lock()
+_law_watcher = None
+
+
+def _reload_law_index() -> bool:
+    """Re-parses only if the law files' content hash changed."""
+    global _law_index, _law_watcher
+    try:
+        fresh = build_law_index()
+    except Exception as e:
+        log.warning(
+            "law_index.reload_failed",
+            keeping=_law_index.version, error=str(e)
+        )
+        return False
+    if fresh.version != _law_index.version:
+        log.info(
+            "law_index.swapped", old=_law_index.version, new=fresh.version
+        )
+        _law_index = fresh
+    # A law file may have been added or removed
+    if set(_law_files()) != set(_law_index.sections):
+        _law_watcher = _new_law_watcher()
+    return True
+
+
+def _new_law_watcher() -> FileWatcher:
+    # The directory itself is watched to notice new files
+    return FileWatcher(
+        [LAWS_DIR] + [
+            os.path.join(LAWS_DIR, name) for name in _law_files()
+        ],
+        RELOAD_CHECK_INTERVAL,
+        background=False
+    )
+
+
+def get_law_index() -> LawIndex:
+    """Returns the shared law index, building it on first use."""
+    global _law_index, _law_watcher
+    if _law_index is None:
+        with _law_index_lock:
+            if _law_index is None:
+                watcher = _new_law_watcher()
+                _law_index = build_law_index()
+                _law_watcher = watcher
+    else:
+        _law_watcher.poll(_reload_law_index)
+    return _law_index
+
+
+def get_law_context(intent_id: str, law_index=None) -> str:
+    """
+    Returns relevant law context for a given intent.
+    Pass the request's law_index to read one version.
+    """
+    if law_index is None:
+        law_index = get_law_index()
+    return law_index.law_context.get(intent_id, "")
+
+
+def get_complaint_channels(intent_id: str, law_index=None) -> str:
     """Returns complaint filing information."""
-    law_file = INTENT_TO_LAW_FILE.get(intent_id)
-    if not law_file:
-        return ""
-    content = read_law_file(law_file)
-    if not content:
-        return ""
-    section_name = COMPLAINT_SECTION_MAP.get(intent_id, "")
-    if section_name:
-        return extract_section(content, section_name)
-    return ""
+    if law_index is None:
+        law_index = get_law_index()
+    return law_index.complaints.get(intent_id, "")
 
 
 if __name__ == "__main__":
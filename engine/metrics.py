@@ -0,0 +1,128 @@
+# engine/metrics.py
+# Purpose: Per-stage latency histograms for the chat pipeline
+# Exposed in Prometheus text format on /metrics
+# In-process and lock-light: a few hundred ns per timing
+
+import threading
+from bisect import bisect_left
+from time import perf_counter
+
+# Upper bounds in seconds — 10 µs to 1 s
+DEFAULT_BUCKETS = (
+    0.00001, 0.000025, 0.00005,
+    0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005,
+    0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0
+)
+
+
+class _Timer:
+    """with histogram.time("label"): ... — observes the block."""
+
+    __slots__ = ("histogram", "label", "start")
+
+    def __init__(self, histogram, label: str):
+        self.histogram = histogram
+        self.label = label
+
+    def __enter__(self):
+        self.start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.histogram.observe(self.label, perf_counter() - self.start)
+        return False
+
+
+class Histogram:
+    """
+    Latency histogram with ONE label (stage, path ...).
+    Each label value gets its own buckets, sum and count.
+
+    Numbers are per process — with several gunicorn
+    workers each worker reports its own share.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label: str,
+        buckets=DEFAULT_BUCKETS
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.label = label
+        self.buckets = tuple(buckets)
+        self._series = {}   # label value → [bucket counts, sum, count]
+        self._lock = threading.Lock()
+
+    def observe(self, label_value: str, seconds: float) -> None:
+        # Index len(buckets) is the +Inf bucket
+        index = bisect_left(self.buckets, seconds)
+        with self._lock:
+            series = self._series.get(label_value)
+            if series is None:
+                series = [[0] * (len(self.buckets) + 1), 0.0, 0]
+                self._series[label_value] = series
+            series[0][index] += 1
+            series[1] += seconds
+            series[2] += 1
+
+    def time(self, label_value: str) -> _Timer:
+        return _Timer(self, label_value)
+
+    def render(self) -> list:
+        """Prometheus text exposition lines."""
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram"
+        ]
+        with self._lock:
+            snapshot = {
+                value: (list(counts), total, count)
+                for value, (counts, total, count) in self._series.items()
+            }
+
+        for value in sorted(snapshot):
+            counts, total, count = snapshot[value]
+            label = f'{self.label}="{value}"'
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets, counts):
+                cumulative += bucket_count
+                lines.append(
+                    f'{self.name}_bucket{{{label},le="{bound}"}} {cumulative}'
+                )
+            lines.append(f'{self.name}_bucket{{{label},le="+Inf"}} {count}')
+            lines.append(f"{self.name}_sum{{{label}}} {total:.9f}")
+            lines.append(f"{self.name}_count{{{label}}} {count}")
+        return lines
+
+
+STAGE_SECONDS = Histogram(
+    "aram_stage_seconds",
+    "Time spent in each step of the chat pipeline.",
+    "stage"
+)
+
+REQUEST_SECONDS = Histogram(
+    "aram_request_seconds",
+    "End-to-end /chat latency by decision path.",
+    "path"
+)
+
+
+def stage(name: str) -> _Timer:
+    """Times one pipeline stage: with stage("scan"): ..."""
+    return STAGE_SECONDS.time(name)
+
+
+def observe_request(path: str, seconds: float) -> None:
+    REQUEST_SECONDS.observe(path, seconds)
+
+
+def render_prometheus() -> str:
+    """All histograms in Prometheus text format."""
+    lines = STAGE_SECONDS.render() + REQUEST_SECONDS.render()
+    return "\n".join(lines) + "\n"
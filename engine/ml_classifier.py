@@ -1,13 +1,11 @@
 # engine/ml_classifier.py
 # Purpose: Load trained ML model and classify user input
 
-import json
-import pickle
-import os
-import numpy as np
-from config import INTENTS_FILE
+from collections import namedtuple
+from engine.registry import get_registry
+from engine.event_log import get_logger
 
-MODEL_PATH = os.path.join("engine", "aram_model.pkl")
+log = get_logger("ml_classifier")
 
 GREETING_WORDS = [
     "hello", "hi", "hey", "hai", "hii", "helo",
@@ -19,21 +17,65 @@ GREETING_WORDS = [
 
 
 def load_model():
-    if not os.path.exists(MODEL_PATH):
+    model = get_registry().model
+    if model is None:
         raise FileNotFoundError(
             "ML model not found. Please run model_trainer.py first."
         )
-    with open(MODEL_PATH, "rb") as f:
-        return pickle.load(f)
+    return model
 
 
 def load_intents() -> dict:
-    with open(INTENTS_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return {
-        intent["intent_id"]: intent
-        for intent in data["intents"]
-    }
+    return get_registry().intents_lookup
+
+
+# One classifier run:
+#   predicted_id — best class (same as model.predict)
+#   classes      — class ids, aligned with scores
+#   scores       — decision_function score of every class
+#   raw          — score of predicted_id
+#   normalized   — raw scaled to 0-1 between min and max score
+MLScore = namedtuple(
+    "MLScore",
+    ["predicted_id", "classes", "scores", "raw", "normalized"]
+)
+
+
+def score_intent(user_input: str, model=None) -> MLScore:
+    """
+    Vectorizes the input ONCE and derives the prediction
+    and the confidence from a single decision_function
+    call — predict() would run the whole pipeline again.
+    """
+    return score_intents([user_input], model)[0]
+
+
+def score_intents(user_inputs: list, model=None) -> list:
+    """
+    score_intent for a whole batch — one decision_function
+    call over every input. Returns one MLScore per input.
+    """
+    if model is None:
+        model = load_model()
+
+    all_scores = model.decision_function(list(user_inputs))
+    classes = model.classes_
+
+    # LinearSVC.predict is the argmax of the same scores
+    best = all_scores.argmax(axis=1)
+    results = []
+    for row, scores in enumerate(all_scores):
+        raw = float(scores[best[row]])
+        max_score = raw
+        min_score = float(scores.min())
+        if max_score != min_score:
+            normalized = (raw - min_score) / (max_score - min_score)
+        else:
+            normalized = 1.0
+        results.append(
+            MLScore(classes[best[row]], classes, scores, raw, normalized)
+        )
+    return results
 
 
 def ml_detect_intent(user_input: str) -> dict:
@@ -49,32 +91,16 @@ def ml_detect_intent(user_input: str) -> dict:
         if word in user_lower:
             return intents_lookup.get("GREET001", {})
 
-    # Load model
-    model = load_model()
-
-    # Predict
-    predicted_id = model.predict([user_input])[0]
-
-    # Get confidence using decision function
-    decision_scores = model.decision_function([user_input])[0]
-    classes = model.classes_
-    score_dict = dict(zip(classes, decision_scores))
-    confidence = score_dict.get(predicted_id, 0)
-
-    print(f"   [ML] Predicted: {predicted_id} | Confidence: {confidence:.2f}")
-
-    # Normalize confidence — LinearSVC scores vary widely
-    # Accept if it's the highest score (model is confident)
-    max_score = max(decision_scores)
-    min_score = min(decision_scores)
-
-    # Normalize to 0-1 range
-    if max_score != min_score:
-        normalized = (confidence - min_score) / (max_score - min_score)
-    else:
-        normalized = 1.0
+    # Predict + confidence in one pass — LinearSVC scores
+    # vary widely, so they are normalized to 0-1
+    result = score_intent(user_input)
+    predicted_id = result.predicted_id
+    normalized = result.normalized
 
-    print(f"   [ML] Normalized confidence: {normalized:.2f}")
+    log.debug(
+        "ml.predicted",
+        intent=predicted_id, raw=result.raw, normalized=normalized
+    )
 
     # Accept if normalized confidence is above 0.6
     if normalized >= 0.6:
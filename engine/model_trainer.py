@@ -3,16 +3,16 @@
 # Uses expanded dataset + augmented sentences
 
 import json
-import pickle
 import os
+import pickle
+import sys
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.svm import LinearSVC
 from sklearn.pipeline import Pipeline
 from sklearn.model_selection import train_test_split, cross_val_score
 from sklearn import metrics
-from config import INTENTS_FILE
-
-MODEL_PATH = os.path.join("engine", "aram_model.pkl")
+from config import INTENTS_FILE, MODEL_PATH, MODEL_NPZ_PATH
+from engine.linear_scorer import export_linear_model
 
 
 def prepare_training_data() -> tuple:
@@ -437,15 +437,33 @@ def train_model():
     print("\n📋 Classification Report:")
     print(metrics.classification_report(y_test, y_pred))
 
-    # Save model
-    with open(MODEL_PATH, "wb") as f:
+    # Save model — write then rename, so a running app
+    # hot-reloading the file never sees a half-written pickle
+    tmp_path = MODEL_PATH + ".tmp"
+    with open(tmp_path, "wb") as f:
         pickle.dump(pipeline, f)
+    os.replace(tmp_path, MODEL_PATH)
     print(f"✅ Model saved: {MODEL_PATH}")
+
+    # NumPy-only copy used for serving
+    export_linear_model(pipeline, MODEL_NPZ_PATH)
+    print(f"✅ Serving model exported: {MODEL_NPZ_PATH}")
     print("─" * 50)
     print("🎉 Training Complete!")
 
     return pipeline
 
 
+def export_saved_model():
+    """Re-exports the existing aram_model.pkl without retraining."""
+    with open(MODEL_PATH, "rb") as f:
+        pipeline = pickle.load(f)
+    export_linear_model(pipeline, MODEL_NPZ_PATH)
+    print(f"✅ Serving model exported: {MODEL_NPZ_PATH}")
+
+
 if __name__ == "__main__":
-    train_model()
\ No newline at end of file
+    if "--export-only" in sys.argv:
+        export_saved_model()
+    else:
+        train_model()
\ No newline at end of file
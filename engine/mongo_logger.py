@@ -1,76 +1,281 @@
 # engine/mongo_logger.py
 # Purpose: Save conversation logs to MongoDB Atlas
 # Fallback to local JSON if MongoDB unavailable
+# Inserts are batched by a background thread — a slow
+# cluster never adds to request latency
+# Connects lazily in the background — importing this
+# module never waits on the network
 
 import os
-from pymongo.mongo_client import MongoClient
-from pymongo.server_api import ServerApi
-import certifi
+import threading
+import time
 from datetime import datetime
 from dotenv import load_dotenv
+from config import (
+    MONGO_QUEUE_SIZE,
+    MONGO_BATCH_SIZE,
+    MONGO_FLUSH_INTERVAL,
+    MONGO_OVERFLOW_POLICY,
+    MONGO_CONNECT_TIMEOUT_MS,
+    MONGO_RECONNECT_MIN_DELAY,
+    MONGO_RECONNECT_MAX_DELAY
+)
+from engine.batch_writer import BatchWriter, FlushOutcome
+from engine.event_log import get_logger
+from engine.jsonl_file import append_jsonl
 
 load_dotenv()
 
 MONGODB_URI = os.getenv("MONGODB_URI")
 
-# Try to connect to MongoDB
+log = get_logger("mongo_logger")
+
+if not MONGODB_URI:
+    log.info("mongo.disabled", reason="no MONGODB_URI — using local logs")
+
+SPILL_FILE = os.path.join("logs", "mongo_spill.jsonl")
+
+# ── Lazy connection state ─────────────────────────────
+# Nothing connects at import: the first caller starts a
+# background connect, failures back off exponentially.
+# pymongo itself is imported only when connecting.
 mongo_available = False
 collection = None
+_client = None
+_client_pid = None
+_connect_lock = threading.Lock()     # guards _connecting
+_attempt_lock = threading.Lock()     # one connect attempt at a time
+_connecting = False
+_next_attempt = 0.0
+_retry_delay = MONGO_RECONNECT_MIN_DELAY
+
 
-try:
-    from pymongo.mongo_client import MongoClient
-    from pymongo.server_api import ServerApi
+def _connect() -> bool:
+    """
+    Opens the client and pings it. Blocking — only ever
+    runs on a background thread.
+    """
+    with _attempt_lock:
+        if mongo_available and _client_pid == os.getpid():
+            return True
+        return _attempt_connect()
+
+
+def _attempt_connect() -> bool:
+    global mongo_available, collection, _client, _client_pid
+    global _next_attempt, _retry_delay
+    client = None
+    try:
+        import certifi
+        from pymongo.mongo_client import MongoClient
+        from pymongo.server_api import ServerApi
 
-    if MONGODB_URI:
         client = MongoClient(
-    MONGODB_URI,
-    server_api=ServerApi('1'),
-    serverSelectionTimeoutMS=5000,
-    tlsCAFile=certifi.where()
-)
+            MONGODB_URI,
+            server_api=ServerApi('1'),
+            serverSelectionTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+            tlsCAFile=certifi.where()
+        )
         # Test connection
         client.admin.command('ping')
-        db = client["aram_database"]
-        collection = db["conversations"]
+        _client, _client_pid = client, os.getpid()
+        collection = client["aram_database"]["conversations"]
         mongo_available = True
-        print("✅ MongoDB Atlas connected!")
-    else:
-        print("⚠️  No MongoDB URI found — using local logs")
+        _retry_delay = MONGO_RECONNECT_MIN_DELAY
+        log.info("mongo.connected")
+        return True
+
+    except Exception as e:
+        if client is not None:
+            client.close()   # stops its monitor threads
+        mongo_available = False
+        _next_attempt = time.monotonic() + _retry_delay
+        log.warning(
+            "mongo.unavailable", retry_in_s=_retry_delay, error=str(e)
+        )
+        _retry_delay = min(_retry_delay * 2, MONGO_RECONNECT_MAX_DELAY)
+        return False
+
+
+def _connect_in_background():
+    global _connecting
+    try:
+        _connect()
+    finally:
+        _connecting = False
 
-except Exception as e:
-    print(f"⚠️  MongoDB unavailable — using local logs: {e}")
+
+def warm_up():
+    """
+    Starts connecting in the background if not connected.
+    Never blocks; respects the reconnect backoff.
+    """
+    global _connecting, mongo_available, collection, _client
+    if not MONGODB_URI:
+        return
+
+    # MongoClient is not fork-safe — a forked worker
+    # opens its own client
+    if _client is not None and _client_pid != os.getpid():
+        _client, collection, mongo_available = None, None, False
+
+    if mongo_available or _connecting:
+        return
+    if time.monotonic() < _next_attempt:
+        return
+    with _connect_lock:
+        if _connecting:
+            return
+        _connecting = True
+    threading.Thread(
+        target=_connect_in_background,
+        name="mongo-connect",
+        daemon=True
+    ).start()
+
+
+def _mark_down(error: Exception):
+    """Connection lost — reconnect later with backoff."""
+    global mongo_available, _next_attempt
     mongo_available = False
+    _next_attempt = time.monotonic() + _retry_delay
+    log.warning("mongo.connection_lost", error=str(error))
+
+
+def get_collection():
+    """
+    Collection used by the batch writer (patchable in tests).
+    None while (re)connecting — callers spill instead.
+    """
+    warm_up()
+    if not mongo_available:
+        return None
+    return collection
+
+
+def _spill(docs: list) -> bool:
+    """
+    Writes documents Mongo did not take to a local JSONL
+    file, so they can be re-imported later. False if they
+    were dropped instead ("drop" policy or a failed write).
+    """
+    if MONGO_OVERFLOW_POLICY != "spill":
+        return False
+    try:
+        os.makedirs("logs", exist_ok=True)
+        append_jsonl(SPILL_FILE, docs, default=str)
+    except OSError as e:
+        log.error("mongo.spill_failed", docs=len(docs), error=str(e))
+        return False
+    return True
+
+
+def _set_aside(docs: list, flushed: int = 0) -> FlushOutcome:
+    """Spills docs (or drops them) and says which it was."""
+    if _spill(docs):
+        return FlushOutcome(flushed=flushed, spilled=len(docs))
+    return FlushOutcome(flushed=flushed, dropped=len(docs))
+
+
+def _writer_collection():
+    """
+    Collection for the writer thread. Unlike the request
+    path it may connect synchronously — it is already off
+    the request thread — unless the backoff says wait.
+    """
+    target = get_collection()
+    if target is None and time.monotonic() >= _next_attempt:
+        if _connect():
+            target = collection
+    return target
+
+
+def _insert_batch(docs: list) -> FlushOutcome:
+    """
+    Writer-thread flush: one insert_many per batch.
+    Whatever is not inserted is spilled or dropped — the
+    outcome lets the writer count each document once.
+    """
+    from pymongo.errors import BulkWriteError
+
+    target = _writer_collection()
+    if target is None:
+        return _set_aside(docs)
+    try:
+        target.insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        # Unordered insert: only the failed documents are missing
+        failed = [
+            docs[err["index"]]
+            for err in e.details.get("writeErrors", [])
+        ]
+        log.warning(
+            "mongo.insert_partial", failed=len(failed), batch=len(docs)
+        )
+        return _set_aside(failed, flushed=len(docs) - len(failed))
+    except Exception as e:
+        log.error("mongo.insert_failed", batch=len(docs), error=str(e))
+        _mark_down(e)
+        return _set_aside(docs)
+    return FlushOutcome(flushed=len(docs))
+
+
+_mongo_writer = BatchWriter(
+    _insert_batch,
+    name="mongo-log-writer",
+    max_queue=MONGO_QUEUE_SIZE,
+    batch_size=MONGO_BATCH_SIZE,
+    flush_interval=MONGO_FLUSH_INTERVAL,
+    on_full=lambda doc: _spill([doc])
+)
 
 
 def save_to_mongo(
     user_input: str,
     intent: str,
-    response: str
+    response: str,
+    language: str = None
 ) -> bool:
     """
-    Save conversation to MongoDB.
-    Returns True if saved, False if failed.
+    Queue conversation for MongoDB — never blocks on
+    connectivity. Returns True if queued, False if no
+    MongoDB is configured or the queue was full
+    (document dropped / spilled).
     """
-    if not mongo_available or collection is None:
+    if not MONGODB_URI:
         return False
+    warm_up()
 
-    try:
-        doc = {
-            "timestamp": datetime.now(),
-            "timestamp_str": datetime.now().strftime(
-                "%Y-%m-%d %H:%M:%S"
-            ),
-            "user_input": user_input,
-            "detected_intent": intent,
-            "response_given": response[:100],
-            "feedback": None
-        }
-        collection.insert_one(doc)
-        return True
+    now = datetime.now()
+    doc = {
+        "timestamp": now,
+        "timestamp_str": now.strftime(
+            "%Y-%m-%d %H:%M:%S"
+        ),
+        "user_input": user_input,
+        "detected_intent": intent,
+        "language": language,
+        "response_given": response[:100],
+        "feedback": None
+    }
+    return _mongo_writer.submit(doc)
 
-    except Exception as e:
-        print(f"⚠️  MongoDB save failed: {e}")
-        return False
+
+def start_writer() -> None:
+    """
+    Connects and starts the insert thread in this process
+    (a gunicorn worker's post_fork) instead of on the
+    first logged message.
+    """
+    if not MONGODB_URI:
+        return
+    warm_up()
+    _mongo_writer.ensure_running()
+
+
+def get_queue_stats() -> dict:
+    """Flushed / spilled / dropped counters of the Mongo writer."""
+    return _mongo_writer.stats()
 
 
 def get_mongo_stats() -> dict:
@@ -110,6 +315,52 @@ def get_mongo_stats() -> dict:
         return {"error": str(e)}
 
 
+def get_mongo_counts() -> dict | None:
+    """
+    Total, per-day, per-intent and per-language counts
+    of every stored conversation, in one $facet round
+    trip — the shape LogStats keeps. None if MongoDB is
+    unavailable or the aggregate fails.
+    """
+    if not mongo_available or collection is None:
+        return None
+
+    def group_by(field):
+        return [
+            {"$group": {"_id": field, "count": {"$sum": 1}}}
+        ]
+
+    pipeline = [{"$facet": {
+        "total": [{"$count": "count"}],
+        "days": group_by({
+            "$dateToString": {"format": "%Y-%m-%d", "date": "$timestamp"}
+        }),
+        "intents": group_by("$detected_intent"),
+        "languages": group_by("$language")
+    }}]
+    try:
+        result = next(collection.aggregate(pipeline))
+    except Exception as e:
+        log.warning("mongo.counts_failed", error=str(e))
+        return None
+
+    def counts(facet, missing):
+        # null and "" both land on the missing-value key
+        merged = {}
+        for item in result[facet]:
+            key = item["_id"] or missing
+            merged[key] = merged.get(key, 0) + item["count"]
+        return merged
+
+    return {
+        "total": result["total"][0]["count"] if result["total"] else 0,
+        "days": counts("days", ""),
+        "intents": counts("intents", "UNKNOWN"),
+        "languages": counts("languages", "unknown")
+    }
+
+
 def is_connected() -> bool:
-    """Check if MongoDB is connected."""
+    """Check if MongoDB is connected (never blocks)."""
+    warm_up()
     return mongo_available
\ No newline at end of file
@@ -0,0 +1,156 @@
+# engine/pattern_matcher.py
+# Purpose: Aho-Corasick multi-pattern substring matcher
+# One left-to-right pass finds every pattern in the text,
+# however many patterns there are
+
+import re
+from collections import deque
+
+
+class PatternMatcher:
+    """
+    Compiled automaton over literal patterns.
+
+    Usage:
+        matcher = PatternMatcher()
+        matcher.add("hack", ("tanglish", 0))
+        matcher.build()
+        matcher.scan("account hack pannittaan")
+        → [("tanglish", 0)]
+
+    scan() has the same meaning as `pattern in text`
+    for every pattern — no word boundaries.
+    """
+
+    def __init__(self):
+        self._goto = [{}]        # state → {char: next state}
+        self._fail = [0]         # state → longest proper suffix state
+        self._out = [()]         # state → pattern ids ending here
+        self._payloads = []      # pattern id → payloads
+        self._pattern_ids = {}   # pattern → pattern id
+        self._built = False
+
+    def add(self, pattern: str, payload) -> None:
+        """Registers a pattern; the same pattern may carry many payloads."""
+        if self._built:
+            raise RuntimeError("PatternMatcher is already built")
+
+        pattern_id = self._pattern_ids.get(pattern)
+        if pattern_id is not None:
+            self._payloads[pattern_id].append(payload)
+            return
+
+        pattern_id = len(self._payloads)
+        self._pattern_ids[pattern] = pattern_id
+        self._payloads.append([payload])
+
+        state = 0
+        for char in pattern:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+            state = nxt
+        self._out[state] = self._out[state] + (pattern_id,)
+
+    def build(self) -> "PatternMatcher":
+        """Computes failure links (breadth-first) and merges outputs."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Every pattern ending at the fallback state
+                # also ends here
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+        self._payloads = [tuple(p) for p in self._payloads]
+        self._built = True
+        return self
+
+    def scan(self, text: str) -> list:
+        """Returns payloads of every pattern found in text."""
+        goto, fail, out = self._goto, self._fail, self._out
+        hits = set(out[0])
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if out[state]:
+                hits.update(out[state])
+
+        payloads = []
+        for pattern_id in sorted(hits):
+            payloads.extend(self._payloads[pattern_id])
+        return payloads
+
+
+class LongestMatchTranslator:
+    """
+    Rewrites text in ONE left-to-right pass.
+
+    At each position the longest key starting there is
+    replaced by its value; other characters are copied.
+    Replaced text is never matched again, so the output
+    does not depend on the order of the mapping.
+
+    The keys are stored as a trie and compiled into one
+    regex that mirrors it, so matching runs inside the
+    regex engine and costs O(key length) per position,
+    not O(number of keys).
+    """
+
+    _END = object()   # marks "a key ends here" inside the trie
+
+    def __init__(self, mapping: dict):
+        self._mapping = dict(mapping)
+        trie = {}
+        for key in self._mapping:
+            if not key:
+                continue
+            node = trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[self._END] = True
+
+        self._pattern = (
+            re.compile(self._trie_regex(trie)) if trie else None
+        )
+
+    @classmethod
+    def _trie_regex(cls, node: dict) -> str:
+        """
+        a(?:b(?:c)?)? for keys "a", "ab", "abc" — the greedy
+        optional groups try the longer key first and fall
+        back to the shorter one.
+        """
+        branches = [
+            re.escape(char) + cls._trie_regex(child)
+            for char, child in sorted(
+                (c, n) for c, n in node.items() if c is not cls._END
+            )
+        ]
+        if not branches:
+            return ""
+        body = (
+            branches[0] if len(branches) == 1
+            else "(?:" + "|".join(branches) + ")"
+        )
+        if cls._END in node:
+            return "(?:" + body + ")?"
+        return body
+
+    def translate(self, text: str) -> str:
+        if self._pattern is None:
+            return text
+        mapping = self._mapping
+        return self._pattern.sub(lambda m: mapping[m.group(0)], text)
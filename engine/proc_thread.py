@@ -0,0 +1,40 @@
+# engine/proc_thread.py
+# Purpose: Start a background thread once per process
+# Threads do not survive fork(): a gunicorn worker forked
+# from a preloaded master must start its own
+
+import os
+import threading
+
+
+class PerProcess:
+    """
+    Calls start(forked) the first time ensure() runs in a
+    process, and again in every forked child. forked is
+    True when a parent already started — the child then
+    discards state inherited from it (e.g. queued items,
+    which the parent handles itself).
+    """
+
+    def __init__(self, start):
+        self._start = start
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def ensure(self) -> None:
+        """Starts for this process unless already done."""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._start(self._pid is not None)
+            self._pid = os.getpid()
+
+    def started_here(self) -> bool:
+        """True if started in this very process."""
+        return self._pid == os.getpid()
+
+    def reset(self) -> None:
+        """Next ensure() starts again (after a stop)."""
+        self._pid = None
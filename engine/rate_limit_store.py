@@ -0,0 +1,269 @@
+# engine/rate_limit_store.py
+# Purpose: Rate-limit counters shared by every worker on
+#          one host — a `limits` storage backed by SQLite
+# Importing this module registers the sqlite:// scheme,
+# so Flask-Limiter accepts storage_uri="sqlite:///path"
+# (Redis, for several hosts, is built into `limits`)
+
+import os
+import sqlite3
+import threading
+import time
+from math import floor
+from pathlib import Path
+from urllib.parse import unquote, urlparse
+
+from limits.errors import ConfigurationError
+from limits.storage import Storage, storage_from_string
+from limits.storage.base import (
+    SlidingWindowCounterSupport,
+    TimestampedSlidingWindow
+)
+
+from engine.event_log import get_logger
+
+log = get_logger("rate_limit_store")
+
+# Expired rows are deleted at most this often per process
+PURGE_INTERVAL = 60
+
+
+def sqlite_uri(path: str) -> str:
+    """sqlite:/// URI for a file path — POSIX or Windows."""
+    return "sqlite:///" + Path(path).as_posix().lstrip("/")
+
+
+def _uri_path(uri: str) -> str:
+    """
+    File path of a sqlite:// URI. Accepts sqlite:////tmp/x,
+    sqlite:///C:/x and a bare sqlite://C:\\x (the drive
+    then lands in netloc).
+    """
+    parsed = urlparse(uri)
+    path = unquote(parsed.netloc + parsed.path)
+    # "/C:/..." — a Windows drive behind the URI's slash
+    if len(path) > 2 and path[0] == "/" and path[2] == ":":
+        path = path[1:]
+    return path
+
+
+def usable_storage_uri(uri: str) -> str:
+    """
+    uri if `limits` can build a storage from it, else
+    memory:// — a bad setting degrades the limits to per
+    worker instead of stopping the app at import.
+    """
+    try:
+        storage_from_string(uri)
+        return uri
+    except (ConfigurationError, ValueError) as e:
+        log.error(
+            "rate_limit.storage_unusable",
+            uri=uri, fallback="memory://", error=str(e)
+        )
+        return "memory://"
+
+
+class SQLiteStorage(
+    Storage, SlidingWindowCounterSupport, TimestampedSlidingWindow
+):
+    """
+    Fixed-window and sliding-window-counter storage in one
+    SQLite file (WAL mode), shared by all processes that
+    open it.
+
+    One row per counter: (key, count, expires_at). The
+    sliding window counter uses two counters per client
+    key — current and previous window — so memory per key
+    is constant, and expired rows are purged.
+
+    A hit is one IMMEDIATE transaction: read both windows,
+    decide, increment. Concurrent workers serialise on the
+    database lock, so a limit holds across the whole host.
+    """
+
+    STORAGE_SCHEME = ["sqlite"]
+
+    def __init__(
+        self,
+        uri: str,
+        wrap_exceptions: bool = False,
+        timeout: float = 5.0,
+        **options
+    ):
+        """uri: sqlite:///absolute/path/to/file.sqlite3"""
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self.path = _uri_path(uri)
+        if not self.path:
+            raise ValueError(f"No database path in {uri!r}")
+        self.timeout = timeout
+        self._local = threading.local()
+        self._last_purge = 0.0
+
+    @property
+    def base_exceptions(self):
+        return sqlite3.Error
+
+    # ── Connections ───────────────────────────────────
+    def _connection(self) -> sqlite3.Connection:
+        """
+        One connection per thread and process — sqlite3
+        connections must not cross threads or fork().
+        """
+        local = self._local
+        if getattr(local, "pid", None) != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS counters ("
+                " key TEXT PRIMARY KEY,"
+                " count INTEGER NOT NULL,"
+                " expires_at REAL NOT NULL"
+                ") WITHOUT ROWID"
+            )
+            local.conn, local.pid = conn, os.getpid()
+        return local.conn
+
+    def _transaction(self, work):
+        """Runs work(conn, now) in one IMMEDIATE transaction."""
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = work(conn, now)
+            if now - self._last_purge >= PURGE_INTERVAL:
+                self._last_purge = now
+                conn.execute(
+                    "DELETE FROM counters WHERE expires_at <= ?", (now,)
+                )
+            conn.execute("COMMIT")
+            return result
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _count(conn, key: str, now: float) -> int:
+        row = conn.execute(
+            "SELECT count FROM counters WHERE key = ? AND expires_at > ?",
+            (key, now)
+        ).fetchone()
+        return row[0] if row else 0
+
+    @staticmethod
+    def _add(conn, key: str, amount: int, expiry: float, now: float) -> int:
+        """Adds to a live counter, or starts a new one."""
+        return conn.execute(
+            "INSERT INTO counters (key, count, expires_at)"
+            " VALUES (?, ?, ?)"
+            " ON CONFLICT (key) DO UPDATE SET"
+            "  count = CASE WHEN expires_at > ?"
+            "   THEN count + excluded.count ELSE excluded.count END,"
+            "  expires_at = CASE WHEN expires_at > ?"
+            "   THEN expires_at ELSE excluded.expires_at END"
+            " RETURNING count",
+            (key, amount, now + expiry, now, now)
+        ).fetchone()[0]
+
+    # ── Storage API ───────────────────────────────────
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        return self._transaction(
+            lambda conn, now: self._add(conn, key, amount, expiry, now)
+        )
+
+    def get(self, key: str) -> int:
+        return self._count(self._connection(), key, time.time())
+
+    def get_expiry(self, key: str) -> float:
+        now = time.time()
+        row = self._connection().execute(
+            "SELECT expires_at FROM counters WHERE key = ? AND expires_at > ?",
+            (key, now)
+        ).fetchone()
+        return row[0] if row else now
+
+    def clear(self, key: str) -> None:
+        self._connection().execute(
+            "DELETE FROM counters WHERE key = ?", (key,)
+        )
+
+    def check(self) -> bool:
+        try:
+            self._connection().execute("SELECT 1").fetchone()
+            return True
+        except sqlite3.Error:
+            return False
+
+    def reset(self) -> int | None:
+        return self._connection().execute(
+            "DELETE FROM counters"
+        ).rowcount
+
+    # ── Sliding window counter ────────────────────────
+    @staticmethod
+    def _window_info(
+        previous_count: int,
+        current_count: int,
+        expiry: int,
+        now: float
+    ) -> tuple:
+        # Same weighting as limits' MemoryStorage
+        if previous_count == 0:
+            previous_ttl = 0.0
+        else:
+            previous_ttl = (1 - (((now - expiry) / expiry) % 1)) * expiry
+        current_ttl = (1 - ((now / expiry) % 1)) * expiry + expiry
+        return previous_count, previous_ttl, current_count, current_ttl
+
+    def acquire_sliding_window_entry(
+        self,
+        key: str,
+        limit: int,
+        expiry: int,
+        amount: int = 1
+    ) -> bool:
+        if amount > limit:
+            return False
+
+        def acquire(conn, now):
+            previous_key, current_key = self.sliding_window_keys(
+                key, expiry, now
+            )
+            previous_count, previous_ttl, current_count, _ = (
+                self._window_info(
+                    self._count(conn, previous_key, now),
+                    self._count(conn, current_key, now),
+                    expiry, now
+                )
+            )
+            weighted = previous_count * previous_ttl / expiry + current_count
+            if floor(weighted) + amount > limit:
+                return False
+            # Current window lives on as the next one's "previous"
+            self._add(conn, current_key, amount, 2 * expiry, now)
+            return True
+
+        return self._transaction(acquire)
+
+    def get_sliding_window(self, key: str, expiry: int) -> tuple:
+        conn = self._connection()
+        now = time.time()
+        previous_key, current_key = self.sliding_window_keys(key, expiry, now)
+        return self._window_info(
+            self._count(conn, previous_key, now),
+            self._count(conn, current_key, now),
+            expiry, now
+        )
+
+    def clear_sliding_window(self, key: str, expiry: int) -> None:
+        previous_key, current_key = self.sliding_window_keys(
+            key, expiry, time.time()
+        )
+        self.clear(previous_key)
+        self.clear(current_key)
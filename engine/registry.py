@@ -0,0 +1,246 @@
+# engine/registry.py
+# Purpose: Load intents + ML model ONCE per worker
+# Shared read-only by every detector — no per-request disk reads
+# Hot-reloads when intents / model files change on disk
+
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from types import MappingProxyType
+from config import (
+    INTENTS_FILE,
+    TAMIL_INTENTS_FILE,
+    MODEL_PATH,
+    MODEL_NPZ_PATH,
+    RELOAD_CHECK_INTERVAL
+)
+from engine.event_log import get_logger
+from engine.file_watch import FileWatcher, content_digest
+from engine.keyword_index import KeywordIndex
+from utils.text_cleaner import normalize_for_matching
+
+WATCHED_FILES = [
+    INTENTS_FILE,
+    TAMIL_INTENTS_FILE,
+    MODEL_NPZ_PATH,
+    MODEL_PATH
+]
+
+_registry = None
+_registry_lock = threading.Lock()
+_watcher = None
+
+log = get_logger("registry")
+
+
+class IntentRegistry:
+    """
+    Read-only bundle of everything intent detection needs.
+    Built once, then shared by all requests in the worker.
+
+    A reload builds a NEW registry and swaps the reference,
+    so a request holding the old one finishes on it.
+    """
+
+    def __init__(
+        self,
+        intents_list,
+        tamil_intents,
+        model,
+        model_format,
+        version,
+        load_ms,
+        memory_kb
+    ):
+        # Each intent is wrapped read-only so no request
+        # can leak changes into the next one
+        self.intents_list = tuple(
+            MappingProxyType(intent) for intent in intents_list
+        )
+        self.intents_lookup = MappingProxyType({
+            intent["intent_id"]: intent
+            for intent in self.intents_list
+        })
+        self.keyword_index = KeywordIndex(self.intents_list)
+        self.tamil_intents = tuple(
+            MappingProxyType(intent) for intent in tamil_intents
+        )
+        self.tamil_keyword_table = build_tamil_keyword_table(
+            self.tamil_intents
+        )
+        self.model = model
+        self.model_format = model_format
+        self.version = version
+        self.loaded_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.load_ms = load_ms
+        self.memory_kb = memory_kb
+
+    def stats(self) -> dict:
+        """Version, load time and memory footprint of this registry."""
+        return {
+            "version": self.version,
+            "loaded_at": self.loaded_at,
+            "intents": len(self.intents_list),
+            "tamil_intents": len(self.tamil_intents),
+            "model_loaded": self.model is not None,
+            "model_format": self.model_format,
+            "load_ms": round(self.load_ms, 2),
+            "memory_kb": (
+                "unknown" if self.memory_kb is None
+                else round(self.memory_kb, 1)
+            )
+        }
+
+
+def build_tamil_keyword_table(tamil_intents) -> tuple:
+    """
+    (intent_id, keywords) pairs in file order, with every
+    Tamil and Tanglish keyword lowercased and NFC-normalised.
+    """
+    table = []
+    for intent in tamil_intents:
+        all_keywords = (
+            intent.get("tamil_keywords", []) +
+            intent.get("tanglish_keywords", [])
+        )
+        table.append((
+            intent["intent_id"],
+            tuple(normalize_for_matching(kw) for kw in all_keywords)
+        ))
+    return tuple(table)
+
+
+def _read_bytes(path: str) -> bytes | None:
+    """Reads a whole file, None if it does not exist."""
+    if not os.path.exists(path):
+        return None
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _rss_kb() -> float | None:
+    """
+    Current resident memory of this process in KB, None
+    where it cannot be read (no /proc: Windows, macOS).
+    Peak RSS is no substitute — a delta of peaks says
+    nothing about what one load cost.
+    """
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 1024
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+def build_registry() -> IntentRegistry:
+    """
+    Loads intents + model and measures the cost.
+    Memory is the RSS growth while loading — this
+    includes the ML libraries the model pulls in —
+    or None where RSS cannot be read.
+
+    Each file is read once; the same bytes are hashed
+    for the version id and parsed.
+
+    The NumPy export (aram_model.npz) is preferred — the
+    pickle needs scikit-learn + SciPy and is only loaded
+    when no export exists. NumPy / pickle are imported
+    here, not at module import — importing the app stays
+    cheap until the model is actually needed.
+    """
+    rss_before = _rss_kb()
+    start = time.perf_counter()
+
+    blobs = [_read_bytes(path) for path in WATCHED_FILES]
+    intents_blob, tamil_blob, npz_blob, model_blob = blobs
+
+    intents_list = json.loads(intents_blob)["intents"]
+    tamil_intents = (
+        json.loads(tamil_blob).get("tamil_intents", [])
+        if tamil_blob else []
+    )
+    if npz_blob:
+        from engine.linear_scorer import LinearScorer
+        model, model_format = LinearScorer.from_bytes(npz_blob), "npz"
+    elif model_blob:
+        import pickle
+        model, model_format = pickle.loads(model_blob), "pickle"
+    else:
+        model, model_format = None, None
+
+    load_ms = (time.perf_counter() - start) * 1000
+    rss_after = _rss_kb()
+    registry = IntentRegistry(
+        intents_list,
+        tamil_intents,
+        model,
+        model_format,
+        content_digest(blobs)[:12],
+        load_ms,
+        None if None in (rss_before, rss_after)
+        else rss_after - rss_before
+    )
+    stats = registry.stats()
+    log.info(
+        "registry.loaded",
+        version=registry.version,
+        intents=stats["intents"],
+        model_format=model_format,
+        load_ms=stats["load_ms"],
+        memory_kb=stats["memory_kb"]
+    )
+    return registry
+
+
+def _reload() -> bool:
+    """
+    Builds a fresh registry and swaps it in.
+    On a half-written or broken file the old registry
+    keeps serving and the reload is retried later.
+    """
+    global _registry
+    try:
+        fresh = build_registry()
+    except Exception as e:
+        log.warning(
+            "registry.reload_failed",
+            keeping=_registry.version, error=str(e)
+        )
+        return False
+
+    if fresh.version != _registry.version:
+        log.info(
+            "registry.swapped", old=_registry.version, new=fresh.version
+        )
+        _registry = fresh
+    return True
+
+
+def peek_registry() -> IntentRegistry | None:
+    """The loaded registry, or None — never triggers a load."""
+    return _registry
+
+
+def get_registry() -> IntentRegistry:
+    """
+    Returns the shared registry, loading it on first use.
+    Callers should fetch it ONCE per request and keep the
+    reference, so a reload never changes data mid-request.
+    """
+    global _registry, _watcher
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                # Watcher snapshots file metadata BEFORE reading,
+                # so an edit during load is still picked up
+                watcher = FileWatcher(
+                    WATCHED_FILES, RELOAD_CHECK_INTERVAL
+                )
+                _registry = build_registry()
+                _watcher = watcher
+    else:
+        _watcher.poll(_reload)
+    return _registry
@@ -5,6 +5,75 @@ import random
 from config import SEVERITY_LEVELS, SEPARATOR, DISCLAIMER
 
 
+SEVERITY_EMOJI = {
+    "low":    "🟡",
+    "medium": "🟠",
+    "high":   "🔴"
+}
+
+
+class LegalResponse(str):
+    """
+    Response text that is known to end with DISCLAIMER —
+    validate_response() can return it without scanning.
+    """
+    has_disclaimer = True
+
+
+class ResponseSkeleton:
+    """
+    A response rendered ahead of time, as named sections.
+    Exactly one section has a slot filled per request with
+    a randomly picked line; everything else is fixed text.
+
+        skeleton.render()          → full response
+        skeleton.render_sections() → [(name, text), ...]
+
+    Joining render_sections() gives the same text as
+    render(), so a caller may also send it section by
+    section.
+    """
+
+    def __init__(self, sections: list, response_type=str):
+        # sections: (name, text) or (name, before, choices, after)
+        self.sections = tuple(sections)
+        self.response_type = response_type
+
+        head, tail, self._choices = [], [], None
+        for section in self.sections:
+            if len(section) == 4:
+                _, before, choices, after = section
+                head.append(before)
+                tail.append(after)
+                self._choices = choices
+            elif self._choices is None:
+                head.append(section[1])
+            else:
+                tail.append(section[1])
+        self._head = "".join(head)
+        self._tail = "".join(tail)
+
+    def _pick(self) -> str:
+        if self._choices is None:
+            return ""
+        if isinstance(self._choices, str):
+            return self._choices
+        return random.choice(self._choices)
+
+    def render(self) -> str:
+        return self.response_type(self._head + self._pick() + self._tail)
+
+    def render_sections(self) -> list:
+        rendered = []
+        for section in self.sections:
+            if len(section) == 4:
+                name, before, _, after = section
+                rendered.append((name, before + self._pick() + after))
+            else:
+                rendered.append(section)
+        return rendered
+
+
 def get_template(intent: dict) -> str:
     """
     Picks a random response template.
@@ -16,93 +85,119 @@ def get_template(intent: dict) -> str:
     return template
 
 
+def template_choices(intent: dict):
+    """All templates of an intent — a string or a tuple."""
+    template = intent.get("response_template", "")
+    if isinstance(template, list):
+        return tuple(template)
+    return template
+
+
 def generate_response(intent: dict) -> str:
     """
     Main response generator.
     Routes to correct formatter based on intent type.
     """
+    return build_skeleton(intent).render()
+
+
+def build_skeleton(intent: dict) -> ResponseSkeleton:
+    """
+    Pre-renders the response of one intent. Build it once
+    (e.g. per intent at load time) and render() it per
+    request — only the template line changes.
+    """
     if not intent:
-        return (
+        return ResponseSkeleton([(
+            "message",
             "I'm sorry, I could not process your request. "
             "Please try again."
-        )
+        )])
 
     intent_id = intent.get("intent_id", "")
 
     if intent_id == "GREET001":
-        return format_greeting(intent)
+        return GREETING_SKELETON
 
     if intent_id == "UNKNOWN001":
-        return format_unknown(intent)
+        return UNKNOWN_SKELETON
 
-    return format_legal_response(intent)
+    return build_legal_skeleton(intent)
 
 
-def format_greeting(intent: dict) -> str:
-    """Formats warm varied greeting."""
+GREETINGS = (
+    "Hello! I am ARAM, your legal awareness assistant. "
+    "How can I help you today?",
 
-    greetings = [
-        "Hello! I am ARAM, your legal awareness assistant. "
-        "How can I help you today?",
+    "Hi there! I'm ARAM — here to help you understand "
+    "your legal rights calmly and clearly. "
+    "What's on your mind?",
 
-        "Hi there! I'm ARAM — here to help you understand "
-        "your legal rights calmly and clearly. "
-        "What's on your mind?",
+    "Welcome! I'm ARAM, your legal awareness guide. "
+    "Please describe your situation and "
+    "I'll do my best to help.",
 
-        "Welcome! I'm ARAM, your legal awareness guide. "
-        "Please describe your situation and "
-        "I'll do my best to help.",
+    "Hello! Great to have you here. I'm ARAM — "
+    "I help Indian citizens understand their legal rights. "
+    "How can I assist you?",
 
-        "Hello! Great to have you here. I'm ARAM — "
-        "I help Indian citizens understand their legal rights. "
-        "How can I assist you?",
+    "Hi! I'm ARAM, your legal awareness companion. "
+    "I'm here to guide you through consumer issues, "
+    "cyber concerns, and general legal matters. "
+    "What would you like to know?"
+)
 
-        "Hi! I'm ARAM, your legal awareness companion. "
-        "I'm here to guide you through consumer issues, "
-        "cyber concerns, and general legal matters. "
-        "What would you like to know?"
-    ]
+UNKNOWN_RESPONSES = (
+    "I'm not sure I understood that. "
+    "Could you describe your situation in a little more detail?",
 
-    response = f"""
-{SEPARATOR}
-👋  {random.choice(greetings)}
+    "I want to help but need a bit more context. "
+    "Could you tell me more about what happened?",
 
-    I can help you with:
-    • Consumer complaints (refunds, defective products, online shopping)
-    • Cyber issues (fraud, hacking, harassment, identity theft)
-    • General legal concerns (cheating, threats, harassment)
-    • Complaint guidance (where and how to file)
+    "I didn't quite catch that. Please describe your situation "
+    "and I'll guide you to the right information.",
 
-    Supported languages: English | Tamil | Tanglish
-{SEPARATOR}
-"""
-    return response
+    "Could you explain your situation a little differently? "
+    "I want to make sure I give you the right guidance.",
 
+    "I'm here to help with legal awareness. "
+    "Could you share more details about your concern?"
+)
 
-def format_unknown(intent: dict) -> str:
-    """Formats polite redirect for unknown queries."""
 
-    responses = [
-        "I'm not sure I understood that. "
-        "Could you describe your situation in a little more detail?",
+def format_greeting(intent: dict) -> str:
+    """Formats warm varied greeting."""
+    return GREETING_SKELETON.render()
 
-        "I want to help but need a bit more context. "
-        "Could you tell me more about what happened?",
 
-        "I didn't quite catch that. Please describe your situation "
-        "and I'll guide you to the right information.",
+def format_unknown(intent: dict) -> str:
+    """Formats polite redirect for unknown queries."""
+    return UNKNOWN_SKELETON.render()
 
-        "Could you explain your situation a little differently? "
-        "I want to make sure I give you the right guidance.",
 
-        "I'm here to help with legal awareness. "
-        "Could you share more details about your concern?"
-    ]
+GREETING_SKELETON = ResponseSkeleton([
+    ("greeting", f"""
+{SEPARATOR}
+👋  """, GREETINGS, """
+"""),
+    ("help_topics", f"""
+    I can help you with:
+    • Consumer complaints (refunds, defective products, online shopping)
+    • Cyber issues (fraud, hacking, harassment, identity theft)
+    • General legal concerns (cheating, threats, harassment)
+    • Complaint guidance (where and how to file)
 
-    response = f"""
+    Supported languages: English | Tamil | Tanglish
 {SEPARATOR}
-🤔  {random.choice(responses)}
+""")
+])
 
+UNKNOWN_SKELETON = ResponseSkeleton([
+    ("clarify", f"""
+{SEPARATOR}
+🤔  """, UNKNOWN_RESPONSES, """
+"""),
+    ("help_topics", f"""
     I can currently help you with:
     • Consumer complaints (refunds, defective products, online shopping)
     • Cyber issues (fraud, hacking, harassment, identity theft)
@@ -112,8 +207,8 @@ def format_unknown(intent: dict) -> str:
     💡 Tip: Describe what happened to you and I'll find
     the right legal information for your situation.
 {SEPARATOR}
-"""
-    return response
+""")
+])
 
 
 def format_legal_response(intent: dict) -> str:
@@ -121,14 +216,22 @@ def format_legal_response(intent: dict) -> str:
     Formats complete structured legal awareness response.
     Includes md file content when available.
     """
+    return build_legal_skeleton(intent).render()
+
+
+def build_legal_skeleton(intent: dict) -> ResponseSkeleton:
+    """
+    Everything of a legal response but the template line:
+    numbered steps, severity, law + complaint sections,
+    disclaimer.
+    """
 
-    description   = intent.get("intent_description", "")
     mapped_law    = intent.get("mapped_law", "")
     severity      = intent.get("severity_level", "low")
     explanation   = intent.get("simplified_explanation", "")
     steps         = intent.get("recommended_steps", [])
     severity_note = SEVERITY_LEVELS.get(severity, "")
-    template      = get_template(intent)
+    templates     = template_choices(intent)
     md_context    = intent.get("md_context", "")
     complaint_ch  = intent.get("complaint_channels", "")
 
@@ -138,49 +241,51 @@ def format_legal_response(intent: dict) -> str:
         formatted_steps += f"    {i}. {step}\n"
 
     # Severity emoji
-    severity_emoji = {
-        "low":    "🟡",
-        "medium": "🟠",
-        "high":   "🔴"
-    }.get(severity, "🟡")
-
-    # Build md context section
-    md_section = ""
-    if md_context:
-        md_section = f"""
-📖  LEGAL DETAILS
-    {md_context}
-"""
+    severity_emoji = SEVERITY_EMOJI.get(severity, "🟡")
 
-    # Build complaint channels section
-    complaint_section = ""
-    if complaint_ch:
-        complaint_section = f"""
-🏛️  WHERE TO FILE COMPLAINT
-    {complaint_ch}
-"""
-
-    # Build full response
-    response = f"""
+    sections = [
+        ("situation", f"""
 {SEPARATOR}
 📋  SITUATION UNDERSTOOD
-    {template}
-
+    """, templates, """
+"""),
+        ("law", f"""
 ⚖️  APPLICABLE LAW
     {mapped_law}
-
+"""),
+        ("severity", f"""
 {severity_emoji}  SEVERITY: {severity.upper()}
     {severity_note}
-
+"""),
+        ("meaning", f"""
 💡  WHAT THIS MEANS FOR YOU
     {explanation}
-{md_section}
+""")
+    ]
+
+    # md context section
+    if md_context:
+        sections.append(("legal_details", f"""
+📖  LEGAL DETAILS
+    {md_context}
+"""))
+
+    sections.append(("next_steps", f"""
 ✅  YOUR NEXT STEPS
-{formatted_steps}{complaint_section}
+{formatted_steps}"""))
+
+    # complaint channels section
+    if complaint_ch:
+        sections.append(("complaint", f"""
+🏛️  WHERE TO FILE COMPLAINT
+    {complaint_ch}
+"""))
+
+    sections.append(("disclaimer", f"""
 {DISCLAIMER}
 {SEPARATOR}
-"""
-    return response
+"""))
+    return ResponseSkeleton(sections, LegalResponse)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+# engine/result_cache.py
+# Purpose: Remember pipeline results for repeated messages
+# ("hello", "refund", "vanakkam aram" ...) so they skip
+# detection and law retrieval
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    """
+    Bounded LRU cache with a time-to-live per entry.
+
+    Every lookup passes the current data version (intents,
+    model and law files). When it differs from the version
+    the entries were stored under, the whole cache is
+    dropped — a hot reload never serves stale answers.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self._entries = OrderedDict()   # key → (stored_at, value)
+        self._version = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key, version):
+        """Cached value for key, or None."""
+        with self._lock:
+            self._check_version(version)
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > self.ttl:
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, version) -> None:
+        """
+        Stores value unless the cache moved to another
+        version since this request's lookup — a result
+        built from the old data is not worth keeping.
+        """
+        with self._lock:
+            if self._version is None:
+                self._version = version
+            elif version != self._version:
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Counters for health / metrics."""
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "version": self._version
+        }
+
+    def _check_version(self, version) -> None:
+        if version == self._version:
+            return
+        if self._entries:
+            self._entries.clear()
+            self.invalidations += 1
+        self._version = version
@@ -0,0 +1,86 @@
+# gunicorn.conf.py
+# Purpose: Pre-forked serving with shared engine state
+# Run: gunicorn -c gunicorn.conf.py
+#
+# The master loads the model, intent tables, law index and
+# matchers ONCE (preload_app); workers are forked from it
+# and share those pages copy-on-write. gc.freeze() moves
+# everything loaded so far out of the collector's reach,
+# so collections in a worker do not write to (and unshare)
+# the preloaded objects. Background threads are started
+# per worker in post_fork — threads do not survive fork(),
+# and one running in the master at fork time could hold a
+# lock the worker then inherits locked. The master stops
+# its event-log thread before forking and starts none.
+
+import gc
+import os
+import time
+
+# ARAM_PRELOAD=0 loads per worker — for benchmarks only,
+# it also skips the keep-alive ping
+preload_app = os.getenv("ARAM_PRELOAD", "1") != "0"
+
+# The master loads synchronously: a warm-up thread must
+# not be running when workers are forked
+wsgi_app = (
+    "app:create_app(start_services=False)" if preload_app
+    else "app:create_app(start_services=False, background_warm_up=True)"
+)
+
+# Render sets PORT / WEB_CONCURRENCY
+bind = f"0.0.0.0:{os.getenv('PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+
+# No collections while the master loads — they would
+# leave freed holes in the pages the workers share
+gc.disable()
+
+# The worker that runs the keep-alive ping (master state)
+_keepalive_worker = None
+
+
+def when_ready(server):
+    """Master: app preloaded, workers not forked yet."""
+    if not preload_app:
+        gc.enable()
+        return
+
+    gc.freeze()
+    gc.enable()
+    server.log.info(
+        "Preloaded engine: %d objects frozen", gc.get_freeze_count()
+    )
+
+    # Preloading logged events, which started the output
+    # thread — flush and stop it; each worker starts its own
+    from engine.event_log import stop_listener
+    stop_listener()
+
+
+def pre_fork(server, worker):
+    """Master: pick one live worker for the keep-alive ping."""
+    global _keepalive_worker
+    if preload_app and _keepalive_worker not in server.WORKERS.values():
+        _keepalive_worker = worker
+    worker.keepalive = worker is _keepalive_worker
+
+
+def post_fork(server, worker):
+    """Worker: start this process's background threads."""
+    gc.enable()
+    worker.forked_at = time.perf_counter()
+
+    import app
+    app.start_worker_services()
+    if worker.keepalive:
+        app.start_keepalive()
+
+
+def post_worker_init(worker):
+    """Worker: app loaded, about to serve."""
+    worker.log.info(
+        "Worker %s ready in %.1f ms",
+        worker.pid, (time.perf_counter() - worker.forked_at) * 1000
+    )
@@ -155,6 +155,14 @@ function appendMessage(text, sender) {
 
   chatWindow.appendChild(wrap);
   scrollToBottom();
+  return wrap;
+}
+
+// ── Update a bot message as more text arrives ─────────
+function setBotText(wrap, text) {
+  wrap.querySelector('.msg-bubble').innerHTML =
+    `<pre style="white-space:pre-wrap;font-family:inherit;margin:0;">${formatResponse(text)}</pre>`;
+  scrollToBottom();
 }
 
 // ── Typing indicator ──────────────────────────────────
@@ -183,6 +191,83 @@ function scrollToBottom() {
   chatWindow.scrollTop = chatWindow.scrollHeight;
 }
 
+// ── Streamed reply (Server-Sent Events) ──────────────
+// /chat/stream sends the answer section by section —
+// SITUATION UNDERSTOOD first — so rendering starts
+// before the whole response has arrived.
+const canStream = Boolean(
+  window.ReadableStream && window.TextDecoder &&
+  'body' in Response.prototype
+);
+
+function parseEvent(raw) {
+  let type = 'message';
+  const data = [];
+  raw.split('\n').forEach(line => {
+    if (line.startsWith('event: ')) type = line.slice(7);
+    else if (line.startsWith('data: ')) data.push(line.slice(6));
+  });
+  return { type, data: data.length ? JSON.parse(data.join('\n')) : {} };
+}
+
+// Errors carry `rendered`: true once part of the reply is
+// on screen — only then is retrying via /chat unsafe
+async function streamReply(message) {
+  let wrap = null;
+  try {
+    const res = await fetch('/chat/stream', {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({ message })
+    });
+    const type = res.headers.get('Content-Type') || '';
+    if (!res.ok || !type.startsWith('text/event-stream')) {
+      throw new Error(`Stream failed: ${res.status}`);
+    }
+
+    const reader = res.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let text = '';
+
+    while (true) {
+      const { value, done } = await reader.read();
+      if (done) break;
+      buffer += decoder.decode(value, { stream: true });
+
+      let end;
+      while ((end = buffer.indexOf('\n\n')) !== -1) {
+        const event = parseEvent(buffer.slice(0, end));
+        buffer = buffer.slice(end + 2);
+        if (event.type !== 'section') continue;
+
+        text += event.data.text;
+        if (!wrap) {
+          removeTyping();
+          wrap = appendMessage(text, 'bot');
+        } else {
+          setBotText(wrap, text);
+        }
+      }
+    }
+    if (!wrap) throw new Error('Empty stream');
+  } catch (err) {
+    err.rendered = wrap !== null;
+    throw err;
+  }
+}
+
+async function fetchReply(message) {
+  const res = await fetch('/chat', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ message })
+  });
+  const data = await res.json();
+  removeTyping();
+  appendMessage(data.response, 'bot');
+}
+
 // ── Main send ─────────────────────────────────────────
 async function sendMessage() {
   const message = userInput.value.trim();
@@ -197,14 +282,17 @@ async function sendMessage() {
   showTyping();
 
   try {
-    const res = await fetch('/chat', {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify({ message })
-    });
-    const data = await res.json();
-    removeTyping();
-    appendMessage(data.response, 'bot');
+    if (canStream) {
+      try {
+        await streamReply(message);
+      } catch (err) {
+        if (err.rendered) throw err;
+        // Stream failed before showing anything — plain request
+        await fetchReply(message);
+      }
+    } else {
+      await fetchReply(message);
+    }
   } catch (err) {
     removeTyping();
     appendMessage('Sorry, something went wrong. Please try again.', 'bot');
@@ -0,0 +1,149 @@
+# tests/test_mongo_logger.py
+# Purpose: Batched MongoDB logging against a fake collection —
+#          every document is counted once: flushed, spilled
+#          or dropped
+# Run: python -m pytest -q
+
+import json
+
+import pytest
+from pymongo.errors import BulkWriteError
+
+import engine.mongo_logger as mongo_logger
+from engine.batch_writer import BatchWriter
+
+
+class FakeCollection:
+    """Records insert_many calls; can fail some or all docs."""
+
+    def __init__(self, fail_indexes=(), error=None):
+        self.batches = []
+        self.fail_indexes = list(fail_indexes)
+        self.error = error
+
+    def insert_many(self, docs, ordered=True):
+        assert ordered is False
+        if self.error:
+            raise self.error
+        self.batches.append(list(docs))
+        if self.fail_indexes:
+            raise BulkWriteError({
+                "writeErrors": [{"index": i} for i in self.fail_indexes]
+            })
+
+
+@pytest.fixture
+def writer(monkeypatch, tmp_path):
+    """A fresh Mongo writer, spilling into tmp_path."""
+    monkeypatch.setattr(mongo_logger, "MONGODB_URI", "mongodb://fake")
+    monkeypatch.setattr(mongo_logger, "warm_up", lambda: None)
+    # Never attempt a real connection
+    monkeypatch.setattr(mongo_logger, "_next_attempt", float("inf"))
+    monkeypatch.setattr(
+        mongo_logger, "SPILL_FILE", str(tmp_path / "spill.jsonl")
+    )
+    monkeypatch.chdir(tmp_path)
+    batch_writer = BatchWriter(
+        mongo_logger._insert_batch,
+        name="test-mongo-writer",
+        max_queue=1000,
+        batch_size=50,
+        flush_interval=0.05,
+        on_full=lambda doc: mongo_logger._spill([doc])
+    )
+    monkeypatch.setattr(mongo_logger, "_mongo_writer", batch_writer)
+    return batch_writer
+
+
+def _use(monkeypatch, collection):
+    monkeypatch.setattr(mongo_logger, "get_collection", lambda: collection)
+
+
+def _log(count: int) -> None:
+    for i in range(count):
+        assert mongo_logger.save_to_mongo(
+            f"q{i}", "IT004", "answer", "english"
+        )
+
+
+def _counts() -> tuple:
+    stats = mongo_logger.get_queue_stats()
+    return (
+        stats["flushed"], stats["spilled"],
+        stats["dropped"], stats["failed"]
+    )
+
+
+def _spilled_lines() -> int:
+    try:
+        with open(mongo_logger.SPILL_FILE, encoding="utf-8") as f:
+            return sum(1 for line in f if json.loads(line))
+    except FileNotFoundError:
+        return 0
+
+
+def test_inserts_in_batches(monkeypatch, writer):
+    collection = FakeCollection()
+    _use(monkeypatch, collection)
+    _log(120)
+    writer.drain()
+
+    assert sum(len(batch) for batch in collection.batches) == 120
+    assert max(len(batch) for batch in collection.batches) <= 50
+    assert _counts() == (120, 0, 0, 0)
+
+
+def test_unavailable_spills(monkeypatch, writer):
+    _use(monkeypatch, None)
+    _log(10)
+    writer.drain()
+
+    assert _counts() == (0, 10, 0, 0)
+    assert _spilled_lines() == 10
+
+
+def test_unavailable_drop_policy_counts_dropped(monkeypatch, writer):
+    monkeypatch.setattr(mongo_logger, "MONGO_OVERFLOW_POLICY", "drop")
+    _use(monkeypatch, None)
+    _log(10)
+    writer.drain()
+
+    assert _counts() == (0, 0, 10, 0)
+    assert _spilled_lines() == 0
+
+
+def test_insert_error_spills_once(monkeypatch, writer):
+    monkeypatch.setattr(mongo_logger, "_mark_down", lambda error: None)
+    _use(monkeypatch, FakeCollection(error=RuntimeError("timeout")))
+    _log(10)
+    writer.drain()
+
+    # Spilled — not also counted as failed
+    assert _counts() == (0, 10, 0, 0)
+    assert _spilled_lines() == 10
+
+
+def test_partial_failure_spills_only_failed(monkeypatch, writer):
+    _use(monkeypatch, FakeCollection(fail_indexes=[1, 3]))
+    _log(5)
+    writer.drain()
+
+    assert _counts() == (3, 2, 0, 0)
+    assert _spilled_lines() == 2
+
+
+def test_full_queue_spills_or_drops(monkeypatch, writer):
+    full = BatchWriter(
+        lambda batch: None, name="full", max_queue=1,
+        on_full=lambda doc: mongo_logger._spill([doc])
+    )
+    full.ensure_running = lambda: None   # no writer: queue stays full
+    full._queue.put_nowait({"n": 0})
+
+    assert full.submit({"n": 1}) is False
+    monkeypatch.setattr(mongo_logger, "MONGO_OVERFLOW_POLICY", "drop")
+    assert full.submit({"n": 2}) is False
+
+    stats = full.stats()
+    assert (stats["spilled"], stats["dropped"]) == (1, 1)
+    assert _spilled_lines() == 1
@@ -2,12 +2,11 @@
 # Purpose: Review conversation logs to improve ARAM
 # Run weekly: python -m tools.log_reviewer
 
-import json
 import os
 from datetime import datetime, timedelta
 from collections import Counter
+from engine.log_manager import LOGS_DIR, read_local_logs
 
-LOGS_FILE = os.path.join("logs", "conversations.json")
 
 # ── Color codes for terminal ──────────────────────────
 GREEN  = "\033[92m"
@@ -20,21 +19,11 @@ BOLD   = "\033[1m"
 
 
 def load_logs() -> list:
-    """Loads all conversation logs."""
-    if not os.path.exists(LOGS_FILE):
-        print(f"{RED}No logs found at {LOGS_FILE}{RESET}")
-        return []
-    with open(LOGS_FILE, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    # Handle both formats — plain list or wrapped object
-    if isinstance(data, list):
-        return data
-    if isinstance(data, dict):
-        for key in ["conversations", "logs", "data"]:
-            if key in data:
-                return data[key]
-        return list(data.values())[0] if data else []
-    return []
+    """Loads all conversation logs — rotated archives included."""
+    logs = list(read_local_logs())
+    if not logs:
+        print(f"{RED}No logs found in {LOGS_DIR}/{RESET}")
+    return logs
 
 
 def parse_ts(ts_string: str) -> datetime:
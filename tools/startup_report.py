@@ -0,0 +1,187 @@
+# tools/startup_report.py
+# Purpose: Where does startup time go?
+# Import profile of app.py (python -X importtime) and the
+# time from process start to the first /health response,
+# each over several fresh interpreters
+# Run: python -m tools.startup_report [--runs 5] [--sync]
+#                                     [--budget-ms 400] [--json]
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from config import BASE_DIR, IMPORT_BUDGET_MS
+
+# Runs in a fresh interpreter; prints one JSON line
+HEALTH_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import app
+imported = time.perf_counter()
+flask_app = app.create_app(start_services=False{factory_args})
+created = time.perf_counter()
+app.limiter.enabled = False
+status = flask_app.test_client().get("/health").status_code
+answered = time.perf_counter()
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "create_app_ms": (created - imported) * 1000,
+    "first_health_ms": (answered - start) * 1000,
+    "status": status,
+    "numpy_loaded": "numpy" in sys.modules
+}}))
+"""
+
+
+def _run(args: list, env: dict = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args], cwd=BASE_DIR,
+        capture_output=True, text=True, env=env
+    )
+
+
+def import_profile(module: str = "app") -> dict:
+    """
+    {module name: (self µs, cumulative µs, depth)} for one
+    `python -X importtime -c "import <module>"` run.
+    """
+    result = _run(["-X", "importtime", "-c", f"import {module}"])
+    profile = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        head, cumulative_us, name = line.split("|", 2)
+        self_us = int(head.split(":")[1])
+        # "| " then two spaces per nesting level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        profile[name.strip()] = (self_us, int(cumulative_us), depth)
+    return profile
+
+
+def direct_imports(profile: dict, module: str) -> list:
+    """Modules imported by `module` itself (depth 1 under it)."""
+    names = list(profile)
+    end = names.index(module)
+    start = end
+    # Children are printed before their parent
+    while start > 0 and profile[names[start - 1]][2] > 0:
+        start -= 1
+    return [n for n in names[start:end] if profile[n][2] == 1]
+
+
+def _median_profile(profiles: list) -> dict:
+    merged = {}
+    for name in profiles[0]:
+        samples = [p[name] for p in profiles if name in p]
+        merged[name] = (
+            statistics.median(s[0] for s in samples),
+            statistics.median(s[1] for s in samples),
+            samples[0][2]
+        )
+    return merged
+
+
+def health_probe(sync: bool) -> dict:
+    factory_args = "" if sync else ", background_warm_up=True"
+    env = dict(os.environ, MONGODB_URI="")
+    start = time.perf_counter()
+    result = _run(["-c", HEALTH_PROBE.format(factory_args=factory_args)], env)
+    wall_ms = (time.perf_counter() - start) * 1000
+    lines = result.stdout.strip().splitlines()
+    if result.returncode != 0 or not lines:
+        raise RuntimeError(result.stderr.strip()[-500:])
+    probe = json.loads(lines[-1])
+    probe["process_ms"] = wall_ms
+    return probe
+
+
+def build_report(runs: int, sync: bool, module: str = "app") -> dict:
+    profile = _median_profile([import_profile(module) for _ in range(runs)])
+    probes = [health_probe(sync) for _ in range(runs)]
+
+    def median(key):
+        return statistics.median(p[key] for p in probes)
+
+    by_self = sorted(profile.items(), key=lambda item: -item[1][0])
+    return {
+        "module": module,
+        "runs": runs,
+        "warm_up": "sync" if sync else "background",
+        "import_ms": profile[module][1] / 1000,
+        "direct_imports": [
+            {"module": name, "cumulative_ms": profile[name][1] / 1000}
+            for name in sorted(
+                direct_imports(profile, module),
+                key=lambda n: -profile[n][1]
+            )
+        ],
+        "top_self": [
+            {"module": name, "self_ms": times[0] / 1000}
+            for name, times in by_self[:15]
+        ],
+        "health": {
+            "import_ms": median("import_ms"),
+            "create_app_ms": median("create_app_ms"),
+            "first_health_ms": median("first_health_ms"),
+            "process_ms": median("process_ms"),
+            "numpy_loaded": probes[-1]["numpy_loaded"],
+            "status": probes[-1]["status"]
+        }
+    }
+
+
+def print_report(report: dict, budget_ms: float) -> None:
+    print(f"\n🚀 Startup report — import {report['module']} "
+          f"(median of {report['runs']} runs)")
+    print("─" * 60)
+    mark = "✅" if report["import_ms"] <= budget_ms else "❌"
+    print(f"{mark} import {report['module']}: "
+          f"{report['import_ms']:.1f} ms (budget {budget_ms:.0f} ms)")
+
+    print(f"\n📦 Imported by {report['module']} (cumulative)")
+    for entry in report["direct_imports"][:15]:
+        print(f"   {entry['cumulative_ms']:>8.1f} ms  {entry['module']}")
+
+    print("\n🔥 Slowest modules (self time)")
+    for entry in report["top_self"]:
+        print(f"   {entry['self_ms']:>8.1f} ms  {entry['module']}")
+
+    health = report["health"]
+    print(f"\n🩺 First /health ({report['warm_up']} warm-up)")
+    print(f"   import app      {health['import_ms']:>8.1f} ms")
+    print(f"   create_app()    {health['create_app_ms']:>8.1f} ms")
+    print(f"   first /health   {health['first_health_ms']:>8.1f} ms")
+    print(f"   whole process   {health['process_ms']:>8.1f} ms "
+          f"(interpreter start + exit)")
+    print(f"   NumPy loaded by then: "
+          f"{'yes' if health['numpy_loaded'] else 'no'}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Import profile + time to first /health"
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--sync", action="store_true",
+        help="load the engine before serving (gunicorn preload path)"
+    )
+    parser.add_argument("--budget-ms", type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = build_report(args.runs, args.sync)
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report, args.budget_ms)
+
+    # Non-zero exit lets CI enforce the import budget
+    return 0 if report["import_ms"] <= args.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
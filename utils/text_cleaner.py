@@ -3,6 +3,7 @@
 
 import re
 import string
+import unicodedata
 
 def clean_text(text: str) -> str:
     """
@@ -41,6 +42,17 @@ def extract_keywords(text: str) -> list:
     return cleaned.split()
 
 
+def normalize_for_matching(text: str) -> str:
+    """
+    Lowercase + Unicode NFC for substring matching.
+    Tamil can be typed as different code point sequences
+    for the same letters — NFC makes them compare equal.
+    """
+    if not text:
+        return ""
+    return unicodedata.normalize("NFC", text.lower())
+
+
 # Quick test — only runs when this file is run directly
 if __name__ == "__main__":
     sample = "  Hello!! I was CHEATED online... help me?? "